@@ -13,7 +13,9 @@ import traceback
 import atexit
 import argparse
 from models.game import Game
-from models.network import Network, SERVER_LOCK_FILE
+from models.ui import HeadlessUI
+from models.network import ReplayNetwork, SERVER_LOCK_FILE
+from models.recorder import SessionReplayer, read_session
 
 # Uygulama kapanışında çağrılacak fonksiyon
 def cleanup():
@@ -28,14 +30,164 @@ def cleanup():
     
     print("\nTemizlik işlemleri tamamlandı.")
 
+def replay_session(path, speed, dev_mode=False):
+    """Kaydedilmiş ağ oturumunu mesaj işleyicilerine geri besler"""
+    header, _ = read_session(path)
+    is_server = header.get('role') == 'server'
+    
+    game = Game(dev_mode=dev_mode)
+    game.ui = HeadlessUI(game)  # Oynatma sırasında ekran çizilmez, bildirim beklenmez
+    network = ReplayNetwork(game, is_server=is_server)
+    game.network = network
+    game.is_multiplayer = True
+    game.is_host = is_server
+    
+    replayer = SessionReplayer(network, path, speed=speed)
+    speed_text = f"{speed}x" if speed else "maksimum hız"
+    print(f"▶️  Oturum oynatılıyor: {path} ({'sunucu' if is_server else 'istemci'}, {speed_text})")
+    
+    stats = replayer.replay()
+    
+    print(f"Mesaj: {stats['messages']} | Hata: {stats['errors']} | "
+          f"Süre: {stats['elapsed']:.3f}s | İşleyici süresi: {stats['handler_time']:.3f}s")
+    print(f"İşlenen mesaj/saniye: {stats['messages_per_second']:.0f} | "
+          f"Gönderilen: {stats['packets_sent']} paket, {stats['bytes_sent']} byte")
+    return stats
+
+def run_headless(sim_count, days, script=None, seed=None, workers=1, autopilot=False, focus=None):
+    """Sim'leri arayüzsüz ve beklemesiz çalıştırır, hız raporunu yazdırır"""
+    # Toplu çalıştırma motorları sadece bu modda yüklenir
+    from models.headless import HeadlessEngine, parse_script
+    from models.lod import LevelOfDetail
+    from models.parallel import run_parallel
+    from models.autopilot import Autopilot
+    
+    if script:
+        policy = f"senaryo: {script}"
+    else:
+        policy = "otomatik pilot" if autopilot else "rastgele eylemler"
+    if workers > 1:
+        # Sim'ler süreçlere bölünür, bölümler arası ilişkiler bariyerlerde değiş tokuş edilir
+        report = run_parallel(sim_count, days, workers, parse_script(script) if script else None, seed,
+                              autopilot=autopilot)
+        print(f"⚙️  Paralel headless simülasyon: {sim_count} Sim, {days} gün, {report['workers']} süreç "
+              f"({policy}, seed: {report['seed']})")
+    else:
+        engine = HeadlessEngine(script=parse_script(script) if script else None, seed=seed,
+                                autopilot=Autopilot() if autopilot else None)
+        engine.populate(sim_count)
+        if focus is not None:
+            # İlk N Sim ve ilişkili oldukları tam ayrıntıda, diğerleri kaba ilerler
+            LevelOfDetail(engine, [f"Sim{i + 1}" for i in range(focus)])
+            policy += f", odak: {focus}"
+        print(f"⚙️  Headless simülasyon: {sim_count} Sim, {days} gün ({policy}, seed: {engine.rng_service.seed})")
+        report = engine.run(days)
+    
+    print(f"Eylem: {report['actions']} | Sim-saat: {report['sim_hours']:.0f} | "
+          f"Süre: {report['elapsed']:.3f}s")
+    print(f"Sim-saat/saniye: {report['sim_hours_per_second']:,.0f} | "
+          f"Hayatta: {report['alive']}/{report['sims']}")
+    print("Ortalamalar: " + ", ".join(f"{k}={v}" for k, v in report['averages'].items()))
+    if report.get('lod'):
+        lod = report['lod']
+        print(f"Ayrıntı: {lod['full']} tam, {lod['coarse']} kaba | Kaba eylem: {lod['coarse_actions']} | "
+              f"Yükseltme: {lod['promotions']}, düşürme: {lod['demotions']}")
+    return report
+
+def run_population(sim_count, days, autopilot=False, seed=None):
+    """Vektörel nüfus motoruyla ihtiyaç azalmasını, ölümleri (ve otomatik pilotla eylemleri) simüle eder"""
+    import numpy as np
+    from models.population import Population
+    from models.autopilot import Autopilot
+    from models.headless import DEFAULT_JOBS
+    from models.rng import POPULATION_STREAM, RandomService
+    
+    # Karakter tipleri, meslekler ve eylem örnekleri aynı seed'den gelir
+    rng_service = RandomService(seed)
+    population = Population.generate(sim_count, rng_service, DEFAULT_JOBS)
+    rng = np.random.default_rng(rng_service.stream(POPULATION_STREAM).getrandbits(64))
+    hours = int(days * 24)
+    mode = " (otomatik pilot)" if autopilot else ""
+    print(f"⚙️  Vektörel nüfus simülasyonu: {sim_count:,} Sim, {days} gün{mode} (seed: {rng_service.seed})")
+    
+    report = population.simulate(hours, Autopilot() if autopilot else None, rng)
+    
+    print(f"Sim-saat: {report['sim_hours']:,} | Süre: {report['elapsed']:.3f}s")
+    print(f"Sim-saat/saniye: {report['sim_hours_per_second']:,.0f} | Hayatta: {report['alive']:,}/{report['sims']:,} | "
+          f"Uyarıda: {report['warning']:,} | Kritik: {report['critical']:,}")
+    print("Ortalamalar: " + ", ".join(f"{k}={v}" for k, v in report['averages'].items()))
+    return report
+
+def memory_benchmark(sim_count):
+    """Sim başına ayrılan belleği tracemalloc ile eski ve güncel düzende ölçer"""
+    from models.memory import sim_layouts
+    
+    layouts = sim_layouts(sim_count)
+    print(f"🧠 {sim_count:,} Sim - byte/Sim")
+    print(f"Eski düzen (__dict__, Sim başına tablolar): {layouts['legacy']:,.0f}")
+    print(f"Güncel (__slots__, ortak tablolar):        {layouts['current']:,.0f} "
+          f"({layouts['current'] / layouts['legacy']:.0%})")
+    print(f"Güncel, durum önbelleği kurulmuş:          {layouts['displayed']:,.0f} "
+          f"({layouts['displayed'] / layouts['legacy']:.0%})")
+    return layouts
+
 def main():
     """Ana program fonksiyonu"""
     # Command line argümanlarını parse et
     parser = argparse.ArgumentParser(description='Sims 1960 - MS-DOS Edition')
     parser.add_argument('-dev', '--developer', action='store_true', 
                        help='Developer modunu aktif eder (hızlı yükleme)')
+    parser.add_argument('--authoritative', action='store_true',
+                       help='Sunucu modunda tüm Sim\'leri host çalıştırır (istemciler sadece istek gönderir)')
+    parser.add_argument('--lockstep', action='store_true',
+                       help='Sunucu modunda sadece eylemler gönderilir, her oyuncu tüm Sim\'leri kendisi hesaplar')
+    parser.add_argument('--record', metavar='DOSYA',
+                       help='Ağ trafiğini belirtilen dosyaya kaydeder')
+    parser.add_argument('--replay', metavar='DOSYA',
+                       help='Kaydedilmiş ağ oturumunu oynatır ve çıkar')
+    parser.add_argument('--replay-speed', type=float, default=1.0,
+                       help='Oynatma hızı çarpanı (0 = maksimum hız)')
+    parser.add_argument('--headless', action='store_true',
+                       help='Arayüzsüz toplu simülasyon çalıştırır ve çıkar')
+    parser.add_argument('--sims', type=int, default=1,
+                       help='Headless modda Sim sayısı')
+    parser.add_argument('--days', type=float, default=7,
+                       help='Headless modda simüle edilecek oyun günü')
+    parser.add_argument('--script', metavar='EYLEMLER',
+                       help='Headless eylem senaryosu: "eat,go_to_work,bet:100,wait:8" veya dosya (yoksa rastgele)')
+    parser.add_argument('--vectorized', action='store_true',
+                       help='Headless modda NumPy nüfus motorunu kullanır (eylemsiz, sadece ihtiyaç azalması)')
+    parser.add_argument('--seed', type=int,
+                       help='Rastgele akışların seed\'i - aynı seed aynı çalıştırmayı üretir (headless\'te verilmezse rastgele seçilip yazdırılır)')
+    parser.add_argument('--autopilot', action='store_true',
+                       help='Headless Sim\'lerin eylemlerini ihtiyaçlara göre puanlayan otomatik pilot seçer')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Headless Sim\'leri bu kadar sürece bölerek paralel çalıştırır')
+    parser.add_argument('--focus', type=int, metavar='N',
+                       help='Headless modda sadece ilk N Sim (ve ilişkileri) tam ayrıntıda, diğerleri kaba ilerler')
+    parser.add_argument('--memory-benchmark', type=int, metavar='N', nargs='?', const=10000,
+                       help='N Sim oluşturup Sim başına bellek kullanımını ölçer ve çıkar')
     args = parser.parse_args()
     
+    if args.memory_benchmark:
+        memory_benchmark(args.memory_benchmark)
+        return
+    
+    if args.headless and args.vectorized:
+        run_population(args.sims, args.days, args.autopilot, args.seed)
+        return
+    
+    if args.focus is not None and args.workers > 1:
+        parser.error('--focus tek süreçte çalışır, --workers ile birlikte kullanılamaz')
+    
+    if args.headless:
+        run_headless(args.sims, args.days, args.script, args.seed, args.workers, args.autopilot, args.focus)
+        return
+    
+    if args.replay:
+        replay_session(args.replay, args.replay_speed, dev_mode=args.developer)
+        return
+    
     try:
         # Çıkış işlemlerini kaydet
         atexit.register(cleanup)
@@ -46,7 +198,8 @@ def main():
             os.remove(SERVER_LOCK_FILE)
         
         # Oyun nesnesini oluştur (dev mode ile)
-        game = Game(dev_mode=args.developer)
+        game = Game(dev_mode=args.developer, record_path=args.record,
+                    authoritative=args.authoritative, lockstep=args.lockstep, seed=args.seed)
         
         if args.developer:
             print("🚀 Developer modu aktif - Hızlı yükleme etkinleştirildi!")
@@ -0,0 +1,186 @@
+import random
+from typing import Dict, Optional
+
+import numpy as np
+
+from models.activity import compile_activity
+from models.npc import NPCPool
+from models.relationships import FLIRT_EVENT
+from models.rng import NPC_STREAM
+
+# Aktivite ilerlemesindeki adım sayısı saat başına (HeadlessUI.get_progress_plan)
+STEPS_PER_HOUR = 10
+
+# Tablo tabanlı eylemler - sayı sabit değer, (alt, üst) uçlar dahil tamsayı aralığıdır
+# name: aktivite adı, duration: saat, cost: para, effects: ihtiyaç değişimleri
+# exclusive: başka eylem sürerken yapılamaz, romance: havuzdan rastgele bir NPC ile ilişki kurulur/gelişir
+ACTION_TABLE = {
+    'eat': {
+        'name': 'Yemek yeme',
+        'duration': 3,
+        'cost': (20, 50),
+        'effects': {'hunger': 40, 'energy': 10, 'mood': 5},
+        'exclusive': True
+    },
+    'sleep': {
+        'name': 'Uyuma',
+        'duration': (6, 8),
+        'effects': {'energy': 50, 'mood': 20, 'hunger': -10},
+        'exclusive': True
+    },
+    'take_bath': {
+        'name': 'Banyo yapma',
+        'duration': 2,
+        'effects': {'hygiene': 60, 'mood': 15, 'energy': -5},
+        'exclusive': True
+    },
+    'socialize': {
+        'name': 'Sosyalleşme',
+        'duration': (2, 4),
+        'effects': {'social': (20, 40), 'mood': (10, 30), 'energy': (-20, -10)},
+        'exclusive': True
+    },
+    'meet_friends': {
+        'name': 'Arkadaşlarla buluşma',
+        'duration': 3,
+        'effects': {'social': 40, 'mood': 20, 'energy': -15, 'hunger': -10},
+        'exclusive': True
+    },
+    'flirt': {
+        'name': 'Flört etme',
+        'duration': 2,
+        'effects': {'social': 30, 'mood': 25, 'energy': -10},
+        'exclusive': True,
+        'romance': True
+    },
+    'go_to_party': {
+        'name': 'Partiye gitme',
+        'duration': 4,
+        'cost': (50, 100),
+        'effects': {'social': 50, 'mood': 30, 'energy': -30, 'hygiene': -20},
+        'exclusive': True
+    }
+}
+
+
+def sample(rng, spec):
+    """Sabit değeri döndürür veya aralıktan örnekler - negatif aralık mutlak değer üzerinden (-randint)"""
+    if not isinstance(spec, tuple):
+        return spec
+    low, high = spec
+    if high < 0:
+        return -rng.randint(-high, -low)
+    return rng.randint(low, high)
+
+
+def expected_value(spec) -> float:
+    """Sabit değer veya aralığın ortası"""
+    if not isinstance(spec, tuple):
+        return spec
+    return (spec[0] + spec[1]) / 2
+
+
+def _sample_array(rng, spec, count: int) -> np.ndarray:
+    """Nüfus için örnekler - rng yoksa beklenen değer"""
+    if rng is None or not isinstance(spec, tuple):
+        return np.full(count, float(expected_value(spec)))
+    low, high = spec
+    return rng.integers(low, high + 1, count).astype(np.float64)
+
+
+def activity_steps(duration: float) -> int:
+    """Aktivite ilerlemesinin adım sayısı"""
+    return max(1, int(round(duration * STEPS_PER_HOUR)))
+
+
+class ActionEngine:
+    """Eylem tablosundaki eylemleri tek Sim'e, Sim listesine veya nüfus dizilerine uygulayan motor"""
+
+    def __init__(self, table: Optional[Dict[str, dict]] = None, npcs: Optional[NPCPool] = None,
+                 rng_service=None):
+        self.table = ACTION_TABLE if table is None else table
+        self._npcs = npcs
+        self.rng_service = rng_service  # NPC havuzlarının seed'i bu servisin akışından gelir (yoksa rastgele)
+
+    def npcs_for(self, graph) -> NPCPool:
+        """Dünyanın flört edilen NPC havuzu - ilk ihtiyaçta, ilişki deposu değişince (yeni oyun) yeniden oluşturulur"""
+        if self._npcs is None or self._npcs.relationship_graph is not graph:
+            if self.rng_service is not None:
+                seed = self.rng_service.stream(NPC_STREAM).getrandbits(32)
+            else:
+                seed = random.getrandbits(32)
+            self._npcs = NPCPool(seed=seed, relationship_graph=graph)
+        return self._npcs
+
+    def perform(self, sim, action: str, rng=None, name: Optional[str] = None) -> Dict:
+        """Eylemi Sim'e uygular ve aktivite bilgisini döndürür (rng: yoksa Sim'in akışı)"""
+        spec = self.table[action]
+        rng = rng or sim.rng or random
+
+        # Örnekleme sırası rastgele akışla uyumlu: süre, maliyet, etkiler
+        result = {'name': name or spec['name'], 'duration': sample(rng, spec['duration'])}
+        if 'cost' in spec:
+            result['cost'] = sample(rng, spec['cost'])
+            sim.money -= result['cost']
+        effects = {attr: sample(rng, value) for attr, value in spec['effects'].items()}
+        result['effects'] = effects
+        sim.update_needs(**effects)
+
+        if spec.get('romance'):
+            partner = self.romance(sim, rng)
+            result['relationship'] = {
+                'name': partner,
+                'level': sim.relationships[partner]['level'],
+                'type': sim.relationships[partner]['type']
+            }
+        return result
+
+    def romance(self, sim, rng) -> str:
+        """Havuzdan rastgele bir NPC ile flört eder (ilişki kurulur veya gelişir), NPC'nin adını döndürür"""
+        npcs = self.npcs_for(sim.relationship_graph)
+        partner = npcs.get(npcs.pick(rng))
+        if partner.name not in sim.relationships:
+            sim.add_relationship(partner, rng.randint(20, 40))
+        else:
+            sim.update_relationship(partner, rng.randint(5, 15), FLIRT_EVENT)
+        sim.relationship_graph.flirt(sim.name, partner.name)
+        sim.check_relationship_goals(partner)
+        return partner.name
+
+    # Vektörel nüfus
+
+    def apply_population(self, population, index, action: str, rng=None) -> np.ndarray:
+        """Eylemi nüfus satırlarına toplu uygular, süreleri döndürür (rng: np.random.Generator, yoksa beklenen değerler)"""
+        spec = self.table[action]
+        index = np.asarray(index, dtype=np.intp)
+        count = len(index)
+        if not count:
+            return np.zeros(0)
+
+        durations = _sample_array(rng, spec['duration'], count)
+        if 'cost' in spec:
+            population.money[index] = np.round(population.money[index] - _sample_array(rng, spec['cost'], count), 2)
+        effects = {attr: _sample_array(rng, value, count) for attr, value in spec['effects'].items()}
+        population.update_needs(index, **effects)
+
+        # Aktivite ilerlemesi: aynı süre ve etkiyi paylaşan satırlar tek derlenmiş planla
+        fields = list(effects)
+        columns = [durations] + [effects[attr] for attr in fields]
+        sources = [spec['duration']] + list(spec['effects'].values())
+        sampled = [column for column, source in zip(columns, sources) if rng is not None and isinstance(source, tuple)]
+        if sampled:
+            # Örneklenen tamsayı sütunları tek anahtara çevrilip gruplanır
+            key = np.zeros(count, dtype=np.int64)
+            for column in sampled:
+                low = int(column.min())
+                key = key * (int(column.max()) - low + 1) + (column.astype(np.int64) - low)
+            _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+            inverse = inverse.reshape(-1)
+        else:
+            first, inverse = np.zeros(1, dtype=np.intp), np.zeros(count, dtype=np.intp)
+
+        for group, row in enumerate(first.tolist()):
+            plan = compile_activity({'effects': {attr: float(effects[attr][row]) for attr in fields}},
+                                    activity_steps(durations[row]))
+            plan.apply_population(population, index if len(first) == 1 else index[inverse == group])
+        return durations
@@ -7,45 +7,39 @@ from datetime import datetime, timedelta
 from rich.panel import Panel
 import math
 
+from models.action_engine import ACTION_TABLE, ActionEngine
+
 class Actions:
     def __init__(self, game):
         self.game = game
         self.console = game.ui.console
         self._last_progress_time = None
         self._progress_step = 0.05  # İlerleme çubuğu adım süresi
+        self.engine = ActionEngine(rng_service=getattr(game, 'rng_service', None))  # Tablo tabanlı eylemler
         
-    def _show_progress(self, message, duration=2.5):
-        """Optimize edilmiş ilerleme çubuğu gösterimi"""
-        self.game.ui.show_activity_progress(message, duration)
+    def _rng(self, sim):
+        """Sim'in kendi rastgele akışı (lockstep için), yoksa global random"""
+        return sim.rng or random
     
-    def eat(self, sim):
-        """Yemek yeme eylemi"""
-        if self.game.events.is_action_in_progress:
+    def _perform(self, sim, action):
+        """Tablodaki eylemi motorla uygular - başka eylem sürerken yapılamaz"""
+        if ACTION_TABLE[action].get('exclusive') and self.game.events.is_action_in_progress:
             return {}
         
         self.game.events.start_action()
         try:
-            # Yemek yeme etkileri
-            cost = random.randint(20, 50)
-            sim.money -= cost
-            
-            # Tüm değişiklikleri tek seferde uygula
-            sim.update_needs(hunger=40, energy=10, mood=5)
-            
-            # Aktivite bilgisini döndür
-            return {
-                'name': 'Yemek yeme',
-                'duration': 3,
-                'cost': cost,
-                'effects': {
-                    'hunger': 40,
-                    'energy': 10,
-                    'mood': 5
-                }
-            }
+            return self.engine.perform(sim, action, self._rng(sim))
         finally:
             self.game.events.end_action()
     
+    def _show_progress(self, message, duration=2.5):
+        """Optimize edilmiş ilerleme çubuğu gösterimi"""
+        self.game.ui.show_activity_progress(message, duration)
+    
+    def eat(self, sim):
+        """Yemek yeme eylemi"""
+        return self._perform(sim, 'eat')
+    
     def go_to_work(self, sim):
         """İşe gitme aksiyonu - yeni job sistemi ile"""
         self.game.events.start_action()
@@ -58,7 +52,7 @@ class Actions:
                 return {}
             
             # Çalışma saatleri
-            work_hours = random.randint(4, 8)
+            work_hours = self._rng(sim).randint(4, 8)
             
             # Başarı mesajını göster
             message = work_result['message']
@@ -147,52 +141,11 @@ class Actions:
     
     def sleep(self, sim):
         """Uyuma aksiyonu"""
-        if self.game.events.is_action_in_progress:
-            return {}
-        
-        self.game.events.start_action()
-        try:
-            # Uyuma süresi
-            hours = random.randint(6, 8)
-            
-            # İhtiyaçları güncelle
-            sim.update_needs(energy=50, mood=20, hunger=-10)
-            
-            # Aktivite bilgisini döndür
-            return {
-                'name': 'Uyuma',
-                'duration': hours,  # Gerçek uyuma süresini kullan
-                'effects': {
-                    'energy': 50,
-                    'mood': 20,
-                    'hunger': -10
-                }
-            }
-        finally:
-            self.game.events.end_action()
+        return self._perform(sim, 'sleep')
     
     def take_bath(self, sim):
         """Banyo yapma aksiyonu"""
-        if self.game.events.is_action_in_progress:
-            return {}
-        
-        self.game.events.start_action()
-        try:
-            # İhtiyaçları güncelle
-            sim.update_needs(hygiene=60, mood=15, energy=-5)
-            
-            # Aktivite bilgisini döndür
-            return {
-                'name': 'Banyo yapma',
-                'duration': 2,
-                'effects': {
-                    'hygiene': 60,
-                    'mood': 15,
-                    'energy': -5
-                }
-            }
-        finally:
-            self.game.events.end_action()
+        return self._perform(sim, 'take_bath')
     
     def socialize(self, sim):
         """Sosyalleşme aksiyonu"""
@@ -206,42 +159,13 @@ class Actions:
             
             if social_action == "Geri Dön":
                 return {}
-                
-            # Aktivite bilgisi
-            activity_info = {
-                'name': social_action,
-                'duration': random.randint(2, 4),
-                'effects': {
-                    'social': random.randint(20, 40),
-                    'mood': random.randint(10, 30),
-                    'energy': -random.randint(10, 20)
-                }
-            }
             
-            # İhtiyaçları güncelle
-            sim.update_needs(
-                social=activity_info['effects']['social'],
-                mood=activity_info['effects']['mood'],
-                energy=activity_info['effects']['energy']
-            )
+            rng = self._rng(sim)
+            activity_info = self.engine.perform(sim, 'socialize', rng, name=social_action)
             
             # İlişki oluşturma veya geliştirme
-            if social_action == "Flört Et" and random.random() > 0.3:
-                # Rastgele bir isim seç
-                names = ["Ayşe", "Mehmet", "Zeynep", "Ali", "Fatma", "Ahmet"]
-                name = random.choice(names)
-                
-                # İlişki oluştur veya güncelle
-                if name not in sim.relationships:
-                    sim.relationships[name] = {
-                        'level': random.randint(20, 40),
-                        'type': 'Flört'
-                    }
-                else:
-                    sim.relationships[name]['level'] += random.randint(5, 15)
-                    if sim.relationships[name]['level'] > 70:
-                        sim.relationships[name]['type'] = 'Sevgili'
-                
+            if social_action == "Flört Et" and rng.random() > 0.3:
+                name = self.engine.romance(sim, rng)
                 self.game.ui.show_notification(f"{name} ile ilişkiniz gelişti!", "success")
                 
             return activity_info
@@ -250,99 +174,15 @@ class Actions:
     
     def meet_friends(self, sim):
         """Arkadaşlarla buluşma aksiyonu"""
-        if self.game.events.is_action_in_progress:
-            return {}
-            
-        self.game.events.start_action()
-        try:
-            # İhtiyaçları güncelle
-            sim.update_needs(social=40, mood=20, energy=-15, hunger=-10)
-            
-            # Aktivite bilgisini döndür
-            return {
-                'name': 'Arkadaşlarla buluşma',
-                'duration': 3,
-                'effects': {
-                    'social': 40,
-                    'mood': 20,
-                    'energy': -15,
-                    'hunger': -10
-                }
-            }
-        finally:
-            self.game.events.end_action()
+        return self._perform(sim, 'meet_friends')
     
     def flirt(self, sim):
         """Flört etme aksiyonu"""
-        if self.game.events.is_action_in_progress:
-            return {}
-            
-        self.game.events.start_action()
-        try:
-            # İhtiyaçları güncelle
-            sim.update_needs(social=30, mood=25, energy=-10)
-            
-            # Rastgele bir isim seç
-            names = ["Ayşe", "Mehmet", "Zeynep", "Ali", "Fatma", "Ahmet"]
-            name = random.choice(names)
-            
-            # İlişki oluştur veya güncelle
-            if name not in sim.relationships:
-                sim.relationships[name] = {
-                    'level': random.randint(20, 40),
-                    'type': 'Flört'
-                }
-            else:
-                sim.relationships[name]['level'] += random.randint(5, 15)
-                if sim.relationships[name]['level'] > 70:
-                    sim.relationships[name]['type'] = 'Sevgili'
-            
-            # Aktivite bilgisini döndür
-            return {
-                'name': 'Flört etme',
-                'duration': 2,
-                'effects': {
-                    'social': 30,
-                    'mood': 25,
-                    'energy': -10
-                },
-                'relationship': {
-                    'name': name,
-                    'level': sim.relationships[name]['level'],
-                    'type': sim.relationships[name]['type']
-                }
-            }
-        finally:
-            self.game.events.end_action()
+        return self._perform(sim, 'flirt')
     
     def go_to_party(self, sim):
         """Partiye gitme aksiyonu"""
-        if self.game.events.is_action_in_progress:
-            return {}
-            
-        self.game.events.start_action()
-        try:
-            # Parti maliyeti
-            cost = random.randint(50, 100)
-            sim.money -= cost
-            
-            # İhtiyaçları güncelle
-            sim.update_needs(social=50, mood=30, energy=-30, hygiene=-20)
-            
-            # Aktivite bilgisini döndür
-            return {
-                'name': 'Partiye gitme',
-                'duration': 4,
-                'cost': cost,
-                'effects': {
-                    'social': 50,
-                    'mood': 30,
-                    'energy': -30,
-                    'hygiene': -20
-                }
-            }
-        finally:
-            self.game.events.end_action()
+        return self._perform(sim, 'go_to_party')
     
     def save_game(self, sim):
         """Oyunu kaydetme aksiyonu"""
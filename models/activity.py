@@ -0,0 +1,106 @@
+from functools import lru_cache
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+# Aktivite etkilerinin uygulanabildiği sayısal Sim alanları
+ACTIVITY_FIELDS = ('mood', 'energy', 'hunger', 'hygiene', 'social', 'money', 'job_satisfaction')
+
+# 0-100 arasında sınırlanmayan alanlar
+UNBOUNDED_FIELDS = ('money',)
+
+# Derlenmiş planların önbellek boyutu (etki, adım sayısı) başına
+PLAN_CACHE_SIZE = 256
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """Python'un round(x, 2) sonucuyla birebir aynı vektörel yuvarlama"""
+    scaled = values * 100
+    rounded = np.rint(scaled)
+    # np.round yarıya çok yakın değerlerde çarpma hatası yüzünden farklı yuvarlayabilir
+    distance = np.abs(scaled - rounded, out=scaled)
+    near_half = np.abs(distance - 0.5, out=distance) < 1e-6
+    rounded /= 100
+    if near_half.any():
+        # Aynı değerler (ör. aynı durumdaki Sim'ler) bir kez yuvarlanır
+        unique, inverse = np.unique(values[near_half], return_inverse=True)
+        rounded[near_half] = np.array([round(value, 2) for value in unique.tolist()])[inverse.reshape(-1)]
+    return rounded
+
+
+class ActivityPlan:
+    """Aktivite etkisinin adım başına önceden hesaplanmış değişimleri"""
+
+    __slots__ = ('total_steps', 'fields', 'columns', 'bounded', 'deltas', 'lower', 'upper', 'sums')
+
+    def __init__(self, effects: Dict[str, float], total_steps: int):
+        self.total_steps = total_steps
+        self.fields = tuple(attr for attr in effects if attr in ACTIVITY_FIELDS)
+        self.bounded = tuple(attr not in UNBOUNDED_FIELDS for attr in self.fields)
+
+        # Adım s'de etkinin (s + 1) / T oranının T'de biri uygulanır - toplam etki value * (T + 1) / (2T)
+        columns = []
+        for attr in self.fields:
+            value = effects[attr]
+            columns.append(tuple(value * ((step + 1) / total_steps) / total_steps for step in range(total_steps)))
+        self.columns = tuple(columns)
+        self.sums = tuple(sum(column) for column in columns)
+        # Nüfus dizileri için (adım, alan) matrisi
+        self.deltas = np.array(columns, dtype=np.float64).T.reshape(total_steps, len(self.fields))
+        # Hepsi sınırlıysa skaler sınırlar (daha hızlı), değilse sütun başına
+        if all(self.bounded):
+            self.lower, self.upper = 0, 100
+        else:
+            self.lower = np.where(self.bounded, 0, -np.inf)
+            self.upper = np.where(self.bounded, 100, np.inf)
+
+    def apply(self, sim, start: int = 0, stop: Optional[int] = None):
+        """[start, stop) adımlarını Sim'e uygular - alan başına tek atama yapılır"""
+        stop = self.total_steps if stop is None else stop
+        for attr, column, bounded in zip(self.fields, self.columns, self.bounded):
+            current = getattr(sim, attr)
+            if bounded:
+                for delta in column[start:stop]:
+                    current = round(max(0, min(100, current + delta)), 2)
+            else:
+                for delta in column[start:stop]:
+                    current = round(current + delta, 2)
+            setattr(sim, attr, current)
+
+    def apply_total(self, sim):
+        """Tüm adımların toplamını tek atamayla uygular - ara adımlarda sınırlama yapılmaz (kaba ayrıntı için)"""
+        for attr, total, bounded in zip(self.fields, self.sums, self.bounded):
+            current = getattr(sim, attr) + total
+            setattr(sim, attr, round(max(0, min(100, current)), 2) if bounded else round(current, 2))
+
+    def apply_step(self, sim, step: int):
+        """Tek adımı uygular (ilerleme çubuğu geri çağrısı için)"""
+        for attr, column, bounded in zip(self.fields, self.columns, self.bounded):
+            current = getattr(sim, attr) + column[step]
+            setattr(sim, attr, round(max(0, min(100, current)), 2) if bounded else round(current, 2))
+
+    def apply_population(self, population, index: Sequence[int], start: int = 0, stop: Optional[int] = None):
+        """Aynı aktiviteyi yapan nüfus satırlarına adımları vektörel uygular - tüm alanlar tek matriste"""
+        if not self.fields:
+            return
+        stop = self.total_steps if stop is None else stop
+        current = np.stack([getattr(population, attr)[index] for attr in self.fields], axis=1)
+        for delta in self.deltas[start:stop]:
+            current += delta
+            current = round2(np.clip(current, self.lower, self.upper, out=current))
+        for column, attr in enumerate(self.fields):
+            getattr(population, attr)[index] = current[:, column]
+
+    def totals(self) -> Dict[str, float]:
+        """Sınırlamasız toplam değişimler"""
+        return dict(zip(self.fields, self.sums))
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile(effects: tuple, total_steps: int) -> ActivityPlan:
+    return ActivityPlan(dict(effects), total_steps)
+
+
+def compile_activity(activity_info: dict, total_steps: int) -> ActivityPlan:
+    """Aktivite sonucunun derlenmiş planı - aynı etki ve adım sayısı için önbellekten döner"""
+    return _compile(tuple(activity_info.get('effects', {}).items()), total_steps)
@@ -0,0 +1,356 @@
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Dict, List
+
+from models.actions import Actions
+from models.character_types import CharacterFactory
+from models.clock import format_world_time
+from models.events import Events
+from models.gambling import GamblingGames
+from models.relationships import RelationshipGraph
+from models.rng import GAMBLING_STREAM, subsystem_rng
+from models.scheduler import EventScheduler
+from models.ui import HeadlessUI
+
+# İstemcilerin gönderebileceği eylem istekleri -> Actions metodları
+ACTION_INTENTS = {
+    'eat': 'eat',
+    'sleep': 'sleep',
+    'take_bath': 'take_bath',
+    'go_to_work': 'go_to_work',
+    'meet_friends': 'meet_friends',
+    'flirt': 'flirt',
+    'go_to_party': 'go_to_party'
+}
+
+# Para ile ilgili istekler
+GAMBLING_INTENTS = ('bet', 'slots')
+
+# Otoriter simülasyonda boştaki Sim'lerin ihtiyaç azalmasının yayınlandığı aralık (oyun saati)
+PUBLISH_HOURS = 1
+
+# Host'un istemcilere akıttığı Sim alanları
+STATE_FIELDS = ('mood', 'energy', 'hunger', 'hygiene', 'social', 'money', 'job', 'job_satisfaction')
+
+
+def get_sim_state(sim) -> dict:
+    """Sim'in ağ üzerinden gönderilecek durumunu oluşturur"""
+    state = {field: getattr(sim, field) for field in STATE_FIELDS}
+    state.update({
+        'job_level': sim.job_instance.level,
+        'job_experience': sim.job_instance.experience,
+        'activity': sim.current_activity,
+        'is_alive': sim.is_alive,
+        'death_reason': sim.death_reason,
+        'game_time': format_world_time(sim.game_time) if sim.game_time else None
+    })
+    return state
+
+
+def apply_sim_state(sim, state: dict):
+    """get_sim_state çıktısını Sim'e geri uygular"""
+    for field in STATE_FIELDS:
+        if field != 'job' and field in state:
+            setattr(sim, field, state[field])
+
+    if state.get('job') and state['job'] != sim.job:
+        sim.change_job(state['job'])
+    sim.job_instance.level = state.get('job_level', sim.job_instance.level)
+    sim.job_instance.experience = state.get('job_experience', sim.job_instance.experience)
+    sim.current_activity = state.get('activity', 'Boşta')
+
+
+class HeadlessSimulation:
+    """Oyuncu Sim'lerini konsolsuz çalıştıran ve eylem isteklerini uygulayan temel sınıf"""
+
+    def __init__(self, game):
+        self.game = game  # Oyuncunun Game nesnesi (ağ ve dünya saati için)
+        # Seed'li akış servisi (Game --seed ile başlatıldıysa), None ise Sim.rng/global random
+        self.rng_service = getattr(game, 'rng_service', None)
+
+        # Konsolsuz yardımcı sistemler - oyuncunun kendi arayüzünü etkilemez
+        self.ui = HeadlessUI(self)
+        self.events = Events(self)
+        self.actions = Actions(self)
+        self.gambling = GamblingGames(self.ui)
+
+        self.sims: Dict[str, object] = {}  # player_name -> Sim
+        # Sim'lerin ilişki deposu - oyunun deposu paylaşılır, motorlar kendi deposunu kullanır
+        graph = getattr(game, 'relationship_graph', None)
+        self.relationship_graph = graph if graph is not None else RelationshipGraph()
+        self._lock = threading.Lock()
+
+    @property
+    def game_time(self):
+        """Olay sistemi için dünya zamanı - host'un dünya saati varsa ondan okunur"""
+        world_clock = getattr(self.game, 'world_clock', None)
+        return world_clock.now() if world_clock else self.game.game_time
+
+    # Oyuncu yönetimi
+
+    def add_player(self, player_name: str, player_data: dict, sim=None):
+        """Oyuncu için host tarafında Sim oluşturur (veya verilen Sim'i kullanır)"""
+        if sim is None:
+            sim = CharacterFactory.create_character(
+                player_data.get('character_type', 'Dengeli'),
+                player_name,
+                player_data.get('gender', 'Erkek'),
+                int(player_data.get('age', 25))
+            )
+            sim.change_job(player_data.get('job', 'İşsiz'))
+            for field in ('mood', 'energy', 'hunger', 'hygiene', 'social', 'money'):
+                if field in player_data:
+                    setattr(sim, field, player_data[field])
+            sim.game_time = self.game_time
+            if self.rng_service is not None:
+                self.rng_service.bind_sim(sim)
+        self.relationship_graph.attach(sim)
+
+        with self._lock:
+            self.sims[player_name] = sim
+        return sim
+
+    def remove_player(self, player_name: str):
+        """Oyuncunun Sim'ini simülasyondan çıkarır"""
+        with self._lock:
+            if self.sims.pop(player_name, None) is not None:
+                self.relationship_graph.remove_sim(player_name)
+
+    def _resolve_intent(self, sim, intent: dict) -> dict:
+        """Eylem isteğinin anlık kısmını uygular - aktivite ilerlemesi ve zaman geçişi hariç"""
+        action = intent.get('action')
+
+        if action in ACTION_INTENTS:
+            return getattr(self.actions, ACTION_INTENTS[action])(sim)
+
+        if action in GAMBLING_INTENTS:
+            bet_amount = float(intent.get('amount', 0))
+            if bet_amount <= 0 or bet_amount > sim.money:
+                return {}
+            rng = subsystem_rng(self.rng_service, sim, GAMBLING_STREAM)
+            if action == 'bet':
+                result = self.gambling.resolve_bet(bet_amount, rng)
+            else:
+                result = self.gambling.resolve_slots(bet_amount, rng)
+            if result['success']:
+                self.gambling.apply_result(sim, result, bet_amount)
+            return result
+
+        if action == 'change_job':
+            sim.change_job(intent.get('job', 'İşsiz'))
+            return {'name': 'İş değişikliği', 'new_job': sim.job}
+
+        return {}
+
+    def _apply_intent(self, sim, intent: dict) -> dict:
+        """Tek bir eylem isteğini Sim'e uygular"""
+        action = intent.get('action')
+        result = self._resolve_intent(sim, intent)
+
+        if action in ACTION_INTENTS:
+            if isinstance(result, dict) and 'duration' in result:
+                sim.current_activity = result.get('name', 'Aktivite')
+                # Beklenmeyen ilerleme: derlenmiş adımlar geri çağrısız tek seferde uygulanır
+                steps, _ = self.ui.get_progress_plan(result['duration'])
+                sim.run_activity(result, steps)
+                sim.current_activity = 'Boşta'
+                self._advance_sim_time(sim, result['duration'])
+        elif action in GAMBLING_INTENTS and result.get('success'):
+            hours = result.get('duration', 1)
+            self._advance_sim_time(sim, hours)
+            sim.advance_time(hours)
+        return result
+
+    def _advance_sim_time(self, sim, hours):
+        """Sim'in zamanını ilerletir ve dünya saatini gerekirse öne alır"""
+        base = sim.game_time or self.game_time
+        sim.game_time = base + timedelta(hours=hours)
+        if hasattr(self.game, 'apply_world_time'):
+            self.game.apply_world_time(sim.game_time)
+
+
+class AuthoritativeSimulation(HeadlessSimulation):
+    """Host'ta tüm oyuncuların Sim'lerini tek döngüde çalıştıran otoriter simülasyon"""
+
+    def __init__(self, game, tick_interval: float = 0.25):
+        super().__init__(game)
+        self.tick_interval = tick_interval
+        self._intents = deque()
+        self.running = False
+        # Sim'lerin durumu bu kilit altında değişir - host'un arayüz thread'i de kendi Sim'ine bununla erişir
+        self.sim_lock = threading.RLock()
+        # Ölüm anları, aktivite bitişleri ve düzenli yayın dünya saatine göre tek kuyrukta -
+        # olayı gelmeyen adımda hiçbir Sim hesaplanmaz
+        self.scheduler = EventScheduler(self.game_time)
+        self.scheduler.schedule(self.game_time + timedelta(hours=PUBLISH_HOURS), self._on_publish, key=(self, 'publish'))
+        self._changed = set()  # Adımda durumu değişen oyuncular
+
+        # Diagnostik sayaçları
+        self.tick_count = 0
+        self.intents_processed = 0
+
+    def add_player(self, player_name: str, player_data: dict, sim=None):
+        """Oyuncunun Sim'ini ekler ve ölüm anını kuyruğa kurar"""
+        sim = super().add_player(player_name, player_data, sim)
+        with self.sim_lock:
+            self._post(sim)
+        return sim
+
+    def remove_player(self, player_name: str):
+        """Oyuncunun Sim'ini ve kuyruktaki olaylarını çıkarır"""
+        sim = self.sims.get(player_name)
+        super().remove_player(player_name)
+        if sim is not None:
+            with self.sim_lock:
+                self.scheduler.cancel_key((sim, 'death'))
+                self.scheduler.cancel_key((sim, 'activity'))
+
+    # İstek kuyruğu
+
+    def submit_intent(self, player_name: str, intent: dict):
+        """Oyuncunun eylem isteğini bir sonraki adımda işlenmek üzere kuyruğa alır"""
+        with self._lock:
+            self._intents.append((player_name, intent))
+
+    def start(self):
+        """Simülasyon döngüsünü ayrı thread'de başlatır"""
+        if self.running:
+            return
+        self.running = True
+        loop_thread = threading.Thread(target=self._run)
+        loop_thread.daemon = True
+        loop_thread.start()
+
+    def stop(self):
+        """Simülasyon döngüsünü durdurur"""
+        self.running = False
+
+    def _run(self):
+        """Sabit aralıklarla tüm Sim'leri adımlar"""
+        while self.running:
+            started = time.monotonic()
+            try:
+                self.step()
+            except Exception as e:
+                self.game.ui.console.print(f"[red]Simülasyon hatası: {e}[/red]")
+            time.sleep(max(0.0, self.tick_interval - (time.monotonic() - started)))
+
+    def step(self) -> List[str]:
+        """Zamanı gelen olayları çalıştırır, bekleyen istekleri uygular ve sonuçları yayınlar"""
+        with self._lock:
+            intents = list(self._intents)
+            self._intents.clear()
+            sims = dict(self.sims)
+
+        world_time = self.game_time
+        with self.sim_lock:
+            self._changed = set()
+            # Ölüm anları, aktivite bitişleri ve düzenli yayın - zamanı gelmeyen Sim'e dokunulmaz
+            self.scheduler.run_until(world_time)
+            for player_name, intent in intents:
+                sim = sims.get(player_name)
+                if sim is None:
+                    continue
+                # Boştaki Sim isteği gelince dünya saatine getirilir
+                self._catch_up(sim, world_time)
+                if not sim.can_perform_action():
+                    self._changed.add(player_name)
+                    continue
+                result = self._apply_intent(sim, intent)
+                if sim.game_time > world_time and isinstance(result, dict):
+                    # Aktivite dünya saatinde bitene kadar sürer
+                    sim.current_activity = result.get('name', 'Aktivite')
+                self._post(sim)
+                self.intents_processed += 1
+                self._changed.add(player_name)
+            changed = self._changed
+
+        self.tick_count += 1
+
+        if changed:
+            self._publish({name: get_sim_state(sims[name]) for name in changed if name in sims})
+        return sorted(changed)
+
+    def _catch_up(self, sim, until) -> bool:
+        """Dünya saatinin gerisinde kalan (boştaki) Sim'i ihtiyaç azalmasıyla verilen ana getirir"""
+        if not (sim.is_alive and sim.game_time and sim.game_time < until):
+            return False
+        sim.catch_up(until)
+        return True
+
+    def _post(self, sim):
+        """Sim'in sıradaki olaylarını kurar: ölüm anı ve varsa süren aktivitenin bitişi"""
+        if sim.is_alive and sim.game_time > self.scheduler.now:
+            self.scheduler.schedule(sim.game_time, self._on_activity_end, sim, key=(sim, 'activity'))
+        else:
+            self.scheduler.cancel_key((sim, 'activity'))
+        sim.schedule_death(self.scheduler, self._on_death)
+
+    def _on_death(self, sim, attribute: str):
+        """Boştaki Sim'in ölüm anı geldi - o ana kadar ilerletilir"""
+        self._catch_up(sim, self.scheduler.now)
+        if not sim.is_alive:
+            self.scheduler.cancel_key((sim, 'activity'))
+        else:
+            # İlerletme sırasında değerler yuvarlandı - ölüm anı yeniden hesaplanır
+            sim.schedule_death(self.scheduler, self._on_death)
+        self._changed.add(sim.name)
+
+    def _on_activity_end(self, sim):
+        """Eylem veya iş dünya saatinde bitti - Sim boşa çıkar"""
+        sim.current_activity = 'Boşta'
+        self._changed.add(sim.name)
+
+    def _on_publish(self):
+        """Boştaki Sim'leri yayın için dünya saatine getirir ve sıradaki yayını kurar"""
+        now = self.scheduler.now
+        with self._lock:
+            sims = dict(self.sims)
+        for player_name, sim in sims.items():
+            if self._catch_up(sim, now):
+                sim.schedule_death(self.scheduler, self._on_death)
+                self._changed.add(player_name)
+        self.scheduler.schedule(now + timedelta(hours=PUBLISH_HOURS), self._on_publish, key=(self, 'publish'))
+
+    def _publish(self, states: Dict[str, dict]):
+        """Değişen Sim durumlarını tek mesajda tüm istemcilere yayınlar"""
+        network = self.game.network
+        if not network:
+            return
+
+        network.apply_sim_states(states)
+        network._broadcast({
+            'type': 'sim_states',
+            'states': states
+        })
+
+    # Desync tespiti
+
+    def state_hashes(self):
+        """(tur, oyuncu -> hash) - otoriter modda tur yoktur; adım uygulanırken okunmaz"""
+        with self._lock:
+            sims = dict(self.sims)
+        with self.sim_lock:
+            return None, {name: sim.state_hash for name, sim in sims.items()}
+
+    def get_resync_states(self, names):
+        """(tur, istenen oyuncuların tam durumu)"""
+        with self._lock:
+            sims = dict(self.sims)
+        with self.sim_lock:
+            return None, {name: get_sim_state(sims[name]) for name in names if name in sims}
+
+    def get_diagnostics(self) -> dict:
+        """Diagnostik ekranı için simülasyon sayaçları"""
+        with self._lock:
+            pending = len(self._intents)
+            sim_count = len(self.sims)
+        return {
+            'sim_count': sim_count,
+            'ticks': self.tick_count,
+            'intents_processed': self.intents_processed,
+            'pending_intents': pending,
+            'scheduled_events': self.scheduler.processed
+        }
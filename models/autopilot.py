@@ -0,0 +1,279 @@
+import itertools
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from models.action_engine import ACTION_TABLE, STEPS_PER_HOUR, ActionEngine, expected_value
+from models.gambling import GamblingGames
+from models.population import DAMPENED_MASK, DECAY_PER_HOUR, NEEDS
+from models.sim import Sim
+
+# Kumar eylemlerinde paranın yatırılan oranı (headless rastgele politikayla aynı)
+GAMBLE_FRACTION = 0.1
+
+
+def table_profile(action: str, **extra) -> dict:
+    """Eylem tablosundaki eylemin beklenen etkileri - aralıkların ortası"""
+    spec = ACTION_TABLE[action]
+    profile = {
+        'effects': {attr: expected_value(value) for attr, value in spec['effects'].items()},
+        'duration': expected_value(spec['duration'])
+    }
+    if 'cost' in spec:
+        profile['money'] = -expected_value(spec['cost'])
+    profile.update(extra)
+    return profile
+
+
+# Eylemlerin beklenen etkileri - tablo eylemleri models/action_engine.py'den gelir
+# effects: aktivite etkileri, immediate: etkiler eylem başında update_needs ile de uygulanır mı
+ACTION_PROFILES = {
+    'eat': table_profile('eat'),
+    'sleep': table_profile('sleep'),
+    'take_bath': table_profile('take_bath'),
+    'go_to_work': {'effects': {'hunger': -20, 'mood': -10, 'social': -15}, 'duration': 6, 'immediate': False},
+    'meet_friends': table_profile('meet_friends'),
+    'flirt': table_profile('flirt'),
+    'go_to_party': table_profile('go_to_party', min_money=100),
+    'bet': {'effects': {}, 'duration': 1, 'immediate': False},
+    'slots': {'effects': {}, 'duration': 1, 'immediate': False}
+}
+
+ACTIONS = tuple(ACTION_PROFILES)
+
+# İhtiyaç ağırlıkları - ölüm eşiği kısa olan ihtiyaç daha acildir (açlık = 1)
+NEED_WEIGHTS = {need: Sim.death_thresholds['hunger'] / hours for need, hours in Sim.death_thresholds.items()}
+
+# Paranın faydası logaritmiktir - fakirken aynı miktar daha değerlidir
+MONEY_WEIGHT = 0.5
+
+# Uyarı eşiğinin altındaki ihtiyaçların ek ceza katsayısı
+WARNING_PENALTY = 4.0
+
+# Tahminci verilirse en iyi adayların riskinin puandan düşülme katsayıları
+RISK_WEIGHTS = {'p_critical': 0.5, 'p_death': 5.0}
+RISK_CANDIDATES = 3
+
+
+def _gamble_expectations() -> Dict[str, tuple]:
+    """Bahis ve slotun yatırılan birim başına beklenen kârı ve beklenen ruh hali etkisi"""
+    games = GamblingGames(None)
+
+    profit = mood = 0.0
+    for chance, multiplier in games.bet_odds:
+        p = chance / 100
+        profit += p * (multiplier - 1 if multiplier else -1)
+        mood += p * (10 if multiplier else -15)
+    expectations = {'bet': (profit, mood)}
+
+    # Slot: üç makara bağımsız ve sembolleri eşit olasılıklı
+    outcomes = list(itertools.product(games.slot_symbols, repeat=3))
+    profit = mood = 0.0
+    for slots in outcomes:
+        gain = games.calculate_slot_winnings(slots, 1) - 1
+        profit += gain
+        mood += (20 if gain >= 5 else 10) if gain > 0 else -15
+    expectations['slots'] = (profit / len(outcomes), mood / len(outcomes))
+    return expectations
+
+
+GAMBLE_EXPECTATIONS = _gamble_expectations()
+
+
+def _activity_ramp(duration: float) -> float:
+    """update_stats_during_activity'nin etkilerin toplamda uyguladığı oran: (T + 1) / 2T"""
+    steps = max(1, duration * STEPS_PER_HOUR)
+    return (steps + 1) / (2 * steps)
+
+
+def _build_tables():
+    """(eylem x ihtiyaç) beklenen değişim tabloları - eylem başındaki ve aktivite süresince uygulanan kısımlar ayrı"""
+    immediate = np.zeros((len(ACTIONS), len(NEEDS)))
+    activity = np.zeros((len(ACTIONS), len(NEEDS)))
+    durations = np.zeros(len(ACTIONS))
+    money = np.zeros(len(ACTIONS))
+    min_money = np.zeros(len(ACTIONS))
+
+    for a, action in enumerate(ACTIONS):
+        profile = ACTION_PROFILES[action]
+        durations[a] = profile['duration']
+        money[a] = profile.get('money', 0)
+        min_money[a] = profile.get('min_money', 1 if action in GAMBLE_EXPECTATIONS else 0)
+        ramp = _activity_ramp(profile['duration'])
+        for n, need in enumerate(NEEDS):
+            value = profile['effects'].get(need, 0)
+            activity[a, n] = value * ramp
+            if profile.get('immediate', True):
+                immediate[a, n] = value
+        if action in GAMBLE_EXPECTATIONS:
+            immediate[a, NEEDS.index('mood')] = GAMBLE_EXPECTATIONS[action][1]
+    return immediate, activity, durations, money, min_money
+
+
+# Eylem başındaki beklenen değişimler (eylem x ihtiyaç) tahmincide de kullanılır
+IMMEDIATE_EFFECTS, _ACTIVITY, _DURATIONS, _MONEY, _MIN_MONEY = _build_tables()
+_WEIGHTS = np.array([NEED_WEIGHTS[need] for need in NEEDS])
+_WORK = ACTIONS.index('go_to_work')
+_ENERGY = NEEDS.index('energy')
+# Dengeli olmayan Sim'ler için toplam beklenen değişim ve Dengeli azaltmasının uygulandığı kısım
+_BASE_DELTAS = IMMEDIATE_EFFECTS + _ACTIVITY + DECAY_PER_HOUR * _DURATIONS[:, None]
+_DAMPENABLE = (np.where(DAMPENED_MASK & (IMMEDIATE_EFFECTS < 0), IMMEDIATE_EFFECTS, 0)
+               + np.where(DAMPENED_MASK, DECAY_PER_HOUR, 0) * _DURATIONS[:, None])
+_GAMBLES = [(ACTIONS.index(action), profit) for action, (profit, _) in GAMBLE_EXPECTATIONS.items()]
+
+
+def need_cost(values: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """İhtiyacın karşılanmamışlık maliyeti - boşaldıkça ve uyarı eşiğinin altında hızla artar (out: yerinde)"""
+    below_warning = np.maximum(0, 20 - values)
+    below_warning *= below_warning
+    below_warning *= WARNING_PENALTY / 400
+    deficit = np.subtract(100, values, out=out)
+    deficit *= deficit
+    deficit /= 10000
+    deficit += below_warning
+    return deficit
+
+
+class Autopilot:
+    """Eylemleri ihtiyaçlara ve paraya beklenen etkileriyle puanlayıp en iyisini seçen denetleyici"""
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, money_weight: float = MONEY_WEIGHT,
+                 estimator=None):
+        self.weights = _WEIGHTS if weights is None else np.array([weights.get(n, 0) for n in NEEDS])
+        self.money_weight = money_weight
+        # Eylem sonuçlarının Monte Carlo tahmincisi (models/estimator.py) - None ise risk hesaba katılmaz
+        self.estimator = estimator
+        # Tablo eylemlerini nüfusa toplu uygulayan motor
+        self.engine = ActionEngine()
+
+        # Diagnostik sayaçları
+        self.decisions = 0
+        self.choices = dict.fromkeys(ACTIONS, 0)
+
+    # Toplu puanlama
+
+    def score_arrays(self, needs: np.ndarray, money: np.ndarray, salary: np.ndarray,
+                     work_energy: np.ndarray, negative_scale: np.ndarray, alive: np.ndarray) -> np.ndarray:
+        """(Sim x eylem) fayda matrisi - yapılamayan eylemler -inf"""
+        # Dengeli karakterlerde negatif kısım azalır: tablo + (ölçek - 1) * azaltılabilir kısım
+        deltas = np.multiply.outer(negative_scale - 1, _DAMPENABLE)  # (N, eylem, ihtiyaç)
+        deltas += _BASE_DELTAS
+        # İşin enerji maliyeti mesleğe bağlı: baştan (ölçeksiz) düşülür ve aktivitede tekrar uygulanır
+        deltas[:, _WORK, _ENERGY] -= work_energy * (1 + _activity_ramp(_DURATIONS[_WORK]))
+
+        deltas += needs[:, None, :]
+        after = np.clip(deltas, 0, 100, out=deltas)
+        gain = (need_cost(needs) @ self.weights)[:, None] - need_cost(after, out=after) @ self.weights  # (N, eylem)
+
+        # Beklenen para değişimi
+        money_delta = np.broadcast_to(_MONEY, gain.shape).copy()
+        money_delta[:, _WORK] = salary
+        stake = np.maximum(1, np.round(money * GAMBLE_FRACTION))
+        for action, profit in _GAMBLES:
+            money_delta[:, action] = stake * profit
+        wealth = np.maximum(money, 0)
+        gain += self.money_weight * (np.log1p(np.maximum(wealth[:, None] + money_delta, 0)) - np.log1p(wealth[:, None]))
+
+        # Yapılamayan eylemler
+        feasible = alive[:, None] & ((_MIN_MONEY <= 0) | (money[:, None] >= _MIN_MONEY))
+        feasible[:, _WORK] &= (salary > 0) & (needs[:, _ENERGY] >= work_energy)
+        return np.where(feasible, gain, -np.inf)
+
+    def score_sims(self, sims: List) -> np.ndarray:
+        """Sim nesnelerinin (Sim x eylem) fayda matrisi"""
+        return self.score_arrays(*self._sim_arrays(sims))
+
+    def score_population(self, population, index=slice(None)) -> np.ndarray:
+        """Population dizilerindeki Sim'lerin fayda matrisi - nesne oluşturulmaz"""
+        needs = np.stack([getattr(population, need)[index] for need in NEEDS], axis=1)
+        salary = np.where(population.employed[index], population.salary[index], 0)
+        return self.score_arrays(needs, population.money[index], salary, population.work_energy[index],
+                                 population.negative_scale[index], population.alive[index])
+
+    @staticmethod
+    def _sim_arrays(sims: List):
+        """Sim nesnelerinden puanlama dizileri"""
+        needs = np.array([[getattr(sim, need) for need in NEEDS] for sim in sims], dtype=np.float64).reshape(-1, len(NEEDS))
+        money = np.array([sim.money for sim in sims], dtype=np.float64)
+        salary = np.array([sim.job_instance.expected_salary() for sim in sims], dtype=np.float64)
+        work_energy = np.array([sim.job_instance.energy_cost for sim in sims], dtype=np.float64)
+        negative_scale = np.array([getattr(sim, 'NEGATIVE_SCALE', 1.0) for sim in sims], dtype=np.float64)
+        alive = np.array([sim.is_alive for sim in sims], dtype=bool)
+        return needs, money, salary, work_energy, negative_scale, alive
+
+    # Seçim
+
+    def best_actions(self, scores: np.ndarray) -> np.ndarray:
+        """Her Sim için en yüksek puanlı eylemin sırası (-1: yapılabilecek eylem yok)"""
+        best = np.argmax(scores, axis=1) if scores.size else np.zeros(0, dtype=np.intp)
+        if scores.size:
+            best[np.isneginf(scores[np.arange(len(best)), best])] = -1
+        return best
+
+    def intent_for(self, sim, action: str) -> dict:
+        """Seçilen eylemin istek sözlüğü - headless motor ve ağ istekleriyle aynı biçim"""
+        self.decisions += 1
+        self.choices[action] += 1
+        if action in GAMBLE_EXPECTATIONS:
+            return {'action': action, 'amount': max(1, round(sim.money * GAMBLE_FRACTION))}
+        return {'action': action}
+
+    def choose_batch(self, sims: List) -> List[Optional[dict]]:
+        """Sim'lerin hepsi için tek puanlamayla eylem seçer (ölüler için None)"""
+        scores = self.score_sims(sims)
+        if self.estimator is not None:
+            self._apply_risk(sims, scores)
+        best = self.best_actions(scores)
+        return [self.intent_for(sim, ACTIONS[a]) if a >= 0 else None for sim, a in zip(sims, best)]
+
+    def _apply_risk(self, sims: List, scores: np.ndarray):
+        """En iyi birkaç adayın kritik duruma düşme ve ölme olasılığını puandan düşer"""
+        for i, sim in enumerate(sims):
+            candidates = np.argsort(scores[i])[::-1][:RISK_CANDIDATES]
+            for a in candidates[np.isfinite(scores[i, candidates])]:
+                estimate = self.estimator.estimate(sim, ACTIONS[a])
+                scores[i, a] -= sum(weight * estimate[key] for key, weight in RISK_WEIGHTS.items())
+
+    def choose(self, sim) -> Optional[dict]:
+        """Tek Sim için en iyi eylemin isteği"""
+        return self.choose_batch([sim])[0]
+
+    # Vektörel nüfus
+
+    def step_population(self, population, index, rng=None) -> tuple:
+        """Seçili Sim'lere en iyi eylemi seçip uygular: (eylemler, süreler) - rng yoksa beklenen değerlerle"""
+        index = np.asarray(index, dtype=np.intp)
+        best = self.best_actions(self.score_population(population, index))
+        durations = np.zeros(len(index))
+
+        for a, action in enumerate(ACTIONS):
+            chosen = index[best == a]
+            if not len(chosen):
+                continue
+            self.choices[action] += len(chosen)
+            # Eylem başına tek vektörel güncelleme - Sim başına Python çağrısı yok
+            if action in ACTION_TABLE:
+                durations[best == a] = self.engine.apply_population(population, chosen, action, rng)
+                continue
+            for n, need in enumerate(NEEDS):
+                # Aktivite ilerlemesi değerleri doğrudan yazar - Dengeli azaltması uygulanmaz
+                if _ACTIVITY[a, n]:
+                    column = getattr(population, need)
+                    column[chosen] = np.round(np.clip(column[chosen] + _ACTIVITY[a, n], 0, 100), 2)
+            if a == _WORK:
+                cost = population.work_energy[chosen]
+                population.energy[chosen] = np.round(np.clip(population.energy[chosen] - cost * (
+                    1 + _activity_ramp(_DURATIONS[a])), 0, 100), 2)
+                population.money[chosen] = np.round(population.money[chosen] + population.salary[chosen], 2)
+            else:
+                stake = np.maximum(1, np.round(population.money[chosen] * GAMBLE_FRACTION))
+                population.money[chosen] = np.round(population.money[chosen] + stake * GAMBLE_EXPECTATIONS[action][0], 2)
+                population.update_needs(chosen, mood=GAMBLE_EXPECTATIONS[action][1])
+            durations[best == a] = _DURATIONS[a]
+
+        self.decisions += int(np.count_nonzero(best >= 0))
+        return best, durations
+
+    def get_diagnostics(self) -> dict:
+        """Karar sayaçları"""
+        return {'decisions': self.decisions, 'choices': dict(self.choices)}
@@ -23,6 +23,8 @@ class CharacterType(ABC):
 class AmbitiousSim(Sim):
     """Hırslı karakter tipi"""
     
+    __slots__ = ()
+    
     def __init__(self, name, gender, age=25):
         super().__init__(name, gender, age)
         # Hırslı karakterler işe odaklı
@@ -43,6 +45,8 @@ class AmbitiousSim(Sim):
 class SocialSim(Sim):
     """Sosyal karakter tipi"""
     
+    __slots__ = ()
+    
     def __init__(self, name, gender, age=25):
         super().__init__(name, gender, age)
         # Sosyal karakterler ilişkiler konusunda başarılı
@@ -59,6 +63,8 @@ class SocialSim(Sim):
 class CreativeSim(Sim):
     """Yaratıcı karakter tipi"""
     
+    __slots__ = ()
+    
     def __init__(self, name, gender, age=25):
         super().__init__(name, gender, age)
         # Yaratıcı karakterler sanat işlerinde başarılı
@@ -78,6 +84,12 @@ class CreativeSim(Sim):
 class BalancedSim(Sim):
     """Dengeli karakter tipi"""
     
+    __slots__ = ()
+    
+    # Negatif etkisi azaltılan ihtiyaçlar ve çarpanı
+    DAMPENED_NEEDS = ('energy', 'hunger', 'hygiene')
+    NEGATIVE_SCALE = 0.8
+    
     def __init__(self, name, gender, age=25):
         super().__init__(name, gender, age)
         # Dengeli karakterler her alanda orta seviyede
@@ -91,11 +103,19 @@ class BalancedSim(Sim):
     def update_needs(self, energy=0, hunger=0, hygiene=0, mood=0, social=0):
         """Dengeli karakterler daha yavaş yorulur"""
         # Negatif etkileri %20 azalt
-        adjusted_energy = energy * 0.8 if energy < 0 else energy
-        adjusted_hunger = hunger * 0.8 if hunger < 0 else hunger
-        adjusted_hygiene = hygiene * 0.8 if hygiene < 0 else hygiene
+        adjusted_energy = energy * self.NEGATIVE_SCALE if energy < 0 else energy
+        adjusted_hunger = hunger * self.NEGATIVE_SCALE if hunger < 0 else hunger
+        adjusted_hygiene = hygiene * self.NEGATIVE_SCALE if hygiene < 0 else hygiene
         
         super().update_needs(adjusted_energy, adjusted_hunger, adjusted_hygiene, mood, social)
+    
+    def decay_rates(self):
+        """Azalan ihtiyaçlarda update_needs ile aynı %20 azaltma"""
+        rates = super().decay_rates()
+        for need in self.DAMPENED_NEEDS:
+            if rates.get(need, 0) < 0:
+                rates[need] *= self.NEGATIVE_SCALE
+        return rates
 
 class CharacterFactory:
     """Karakter tipi factory'si"""
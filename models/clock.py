@@ -0,0 +1,139 @@
+import math
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+# Ağ üzerinden taşınan oyun zamanı formatı (Sim.save ile aynı)
+WORLD_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Oyun saati sayaçlarının sıfır noktası (oyunun başladığı yılın başı)
+GAME_EPOCH = datetime(1960, 1, 1)
+
+# Dünya saatinin hızı: gerçek saniye başına oyun saati (normal aktivite hızıyla aynı)
+WORLD_HOURS_PER_SECOND = 1.0
+
+
+def format_world_time(value: datetime) -> str:
+    """Oyun zamanını ağ formatına çevirir"""
+    return value.strftime(WORLD_TIME_FORMAT)
+
+
+def parse_world_time(value: str) -> datetime:
+    """Ağ formatındaki oyun zamanını datetime'a çevirir"""
+    return datetime.strptime(value, WORLD_TIME_FORMAT)
+
+
+def game_hours(value: datetime) -> float:
+    """Oyun zamanını GAME_EPOCH'tan beri geçen oyun saatine çevirir"""
+    return (value - GAME_EPOCH).total_seconds() / 3600
+
+
+def hours_until(hours: float) -> timedelta:
+    """Oyun saatini mikrosaniyeye yukarı yuvarlar - eşik anının gerisinde kalınmaz"""
+    return timedelta(microseconds=math.ceil(hours * 3600 * 10**6))
+
+
+class WorldClock:
+    """Host'un dünya saati - Sim eylemlerinden bağımsız, host monotonic saatiyle sabit hızda ilerler"""
+
+    def __init__(self, start: datetime, hours_per_second: float = WORLD_HOURS_PER_SECOND,
+                 monotonic: Callable[[], float] = time.monotonic):
+        self.start = start
+        self.hours_per_second = hours_per_second
+        self._monotonic = monotonic
+        self.start_stamp = monotonic()
+
+    def at(self, host_monotonic: float) -> datetime:
+        """Host saatinin verilen anındaki dünya zamanı"""
+        return self.start + timedelta(hours=(host_monotonic - self.start_stamp) * self.hours_per_second)
+
+    def read(self):
+        """(host monotonic, dünya zamanı) - ikisi aynı anda okunur"""
+        stamp = self._monotonic()
+        return stamp, self.at(stamp)
+
+    def now(self) -> datetime:
+        """Şimdiki dünya zamanı"""
+        return self.read()[1]
+
+
+class ClockSync:
+    """Cristian/NTP tarzı host saati tahmini - en düşük RTT'li örnek esas alınır"""
+
+    def __init__(self, max_samples: int = 8, monotonic: Callable[[], float] = time.monotonic):
+        self.samples = deque(maxlen=max_samples)  # (rtt, offset) çiftleri
+        self.world_time: Optional[datetime] = None  # Host'tan gelen son dünya zamanı
+        self.world_stamp: Optional[float] = None  # Dünya zamanının host'ta okunduğu an (host monotonic)
+        self.hours_per_second = 0.0  # Host dünya saatinin hızı (0: host saati yalnızca okumalarla ilerler)
+        self.sample_count = 0
+        self.max_rtt = 0.0
+        self._monotonic = monotonic
+
+    def add_sample(self, t0: float, t1: float, host_monotonic: float,
+                   world_time: Optional[datetime] = None, hours_per_second: float = 0.0):
+        """Bir ping/pong ölçümünü ekler, (rtt, offset) döndürür"""
+        rtt = max(0.0, t1 - t0)
+        # Host cevabı gönderdiğinde yolculuğun yarısı geçmiş kabul edilir
+        offset = host_monotonic + rtt / 2 - t1
+
+        self.samples.append((rtt, offset))
+        self.sample_count += 1
+        self.max_rtt = max(self.max_rtt, rtt)
+
+        # Dünya zamanının tek kaynağı host'tur - en büyük değer değil, host saatine göre en yeni okuma geçerlidir
+        if world_time is not None and (self.world_stamp is None or host_monotonic >= self.world_stamp):
+            self.world_time = world_time
+            self.world_stamp = host_monotonic
+            self.hours_per_second = hours_per_second
+
+        return rtt, offset
+
+    def _best_sample(self):
+        """En güvenilir (en düşük RTT'li) örnek"""
+        if not self.samples:
+            return None
+        return min(self.samples, key=lambda sample: sample[0])
+
+    @property
+    def offset(self) -> float:
+        """Host monotonic saati ile yerel saat arasındaki tahmini fark (saniye)"""
+        best = self._best_sample()
+        return best[1] if best else 0.0
+
+    @property
+    def rtt(self) -> float:
+        """En iyi örneğin gidiş-dönüş süresi (saniye)"""
+        best = self._best_sample()
+        return best[0] if best else 0.0
+
+    def is_synced(self) -> bool:
+        """En az bir ölçüm yapıldı mı?"""
+        return bool(self.samples)
+
+    def host_monotonic(self, local: Optional[float] = None) -> float:
+        """Yerel monotonic zamanı host saatine çevirir"""
+        if local is None:
+            local = self._monotonic()
+        return local + self.offset
+
+    def world_now(self, local: Optional[float] = None) -> Optional[datetime]:
+        """Host dünya saatinin şimdiki tahmini: son okuma + okunduğundan beri host saatinde geçen süre"""
+        if self.world_time is None:
+            return None
+        elapsed = max(0.0, self.host_monotonic(local) - self.world_stamp)
+        return self.world_time + timedelta(hours=elapsed * self.hours_per_second)
+
+    def get_latency_info(self) -> dict:
+        """Diagnostik ekranı için latency özetini döndürür (ms)"""
+        if not self.samples:
+            return {'average_latency': 0, 'max_latency': 0, 'samples': 0}
+
+        average = sum(rtt for rtt, _ in self.samples) / len(self.samples)
+        return {
+            'average_latency': average * 1000,
+            'max_latency': self.max_rtt * 1000,
+            'best_latency': self.rtt * 1000,
+            'clock_offset': self.offset * 1000,
+            'samples': self.sample_count
+        }
@@ -0,0 +1,248 @@
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from models.action_engine import ACTION_TABLE
+from models.autopilot import ACTION_PROFILES, ACTIONS, GAMBLE_FRACTION, IMMEDIATE_EFFECTS, STEPS_PER_HOUR
+from models.gambling import GamblingGames
+from models.jobs import CreativeJob, HealthcareJob
+from models.population import DAMPENED_MASK, DECAY_PER_HOUR, NEEDS
+from models.sim import Sim
+
+# Eylemlerin rastgele kısımları - eylem tablosundaki ve işe gitmedeki aralıklar (uçlar dahil)
+ACTION_RANGES = {
+    action: {key: spec[key] for key in ('duration', 'cost') if isinstance(spec.get(key), tuple)}
+    for action, spec in ACTION_TABLE.items() if action in ACTION_PROFILES
+}
+ACTION_RANGES['go_to_work'] = {'duration': (4, 8)}
+
+# Eylem yapılamazsa (ör. enerji yetmezse) geçen boş süre - headless motorla aynı
+IDLE_HOURS = 1
+
+# Varsayılan deneme sayısı ve önbellek boyutu
+DEFAULT_TRIALS = 2000
+CACHE_SIZE = 4096
+
+# Durum anahtarının yuvarlama adımları - yakın durumlar aynı sonucu paylaşır
+NEED_QUANTUM = 2
+MONEY_QUANTUM = 10
+
+# İstatistikleri raporlanan alanlar
+RESULT_FIELDS = NEEDS + ('money',)
+
+_GAMES = GamblingGames(None)
+_BET_PROBABILITIES = np.array([chance for chance, _ in _GAMES.bet_odds], dtype=np.float64) / 100
+_BET_MULTIPLIERS = np.array([multiplier for _, multiplier in _GAMES.bet_odds], dtype=np.float64)
+# Slot: üç sembolün (7^3) her birleşimi için birim bahisin geri ödemesi
+_SLOT_PAYOUTS = np.array([
+    _GAMES.calculate_slot_winnings((a, b, c), 1)
+    for a in _GAMES.slot_symbols for b in _GAMES.slot_symbols for c in _GAMES.slot_symbols
+], dtype=np.float64)
+
+_CRITICAL_LEVELS = np.array([Sim.critical_thresholds[need]['critical'] for need in NEEDS], dtype=np.float64)
+_DEATH_HOURS = np.array([Sim.death_thresholds[need] for need in NEEDS], dtype=np.float64)
+
+# Eylemlerin aktivite etkileri (oransız) - oran denemenin süresine göre hesaplanır
+_ACTIVITY_EFFECTS = np.array([
+    [ACTION_PROFILES[action]['effects'].get(need, 0) for need in NEEDS] for action in ACTIONS
+], dtype=np.float64)
+_MOOD = NEEDS.index('mood')
+_ENERGY = NEEDS.index('energy')
+
+
+def normalize_actions(actions) -> tuple:
+    """'eat' / {'action': 'bet', 'amount': 50} listesini önbellek anahtarına uygun demete çevirir"""
+    if isinstance(actions, (str, dict)):
+        actions = [actions]
+    normalized = []
+    for intent in actions:
+        if isinstance(intent, str):
+            intent = {'action': intent}
+        if intent['action'] not in ACTION_PROFILES:
+            raise ValueError(f"Bilinmeyen eylem: {intent['action']}")
+        normalized.append((intent['action'], intent.get('amount')))
+    return tuple(normalized)
+
+
+class EstimatorState:
+    """Tahminin başladığı yuvarlanmış Sim durumu"""
+
+    __slots__ = ('needs', 'money', 'negative_scale', 'job', 'salary', 'work_energy', 'critical_since', 'is_alive')
+
+    def __init__(self, sim):
+        self.needs = tuple(round(getattr(sim, need) / NEED_QUANTUM) * NEED_QUANTUM for need in NEEDS)
+        self.money = round(sim.money / MONEY_QUANTUM) * MONEY_QUANTUM
+        self.negative_scale = getattr(sim, 'NEGATIVE_SCALE', 1.0)
+        self.job = sim.job_instance
+        self.salary = sim.job_instance.calculate_salary()
+        self.work_energy = sim.job_instance.energy_cost
+        self.is_alive = sim.is_alive
+
+        # Kritik sayaçlar şimdiye göreli saat olarak (negatif: önceden başladı, None: kritik değil)
+        now = sim.current_game_hours()
+        self.critical_since = tuple(
+            float(round(sim.critical_time_counters[need] - now)) if now is not None and need in sim.critical_time_counters
+            else None
+            for need in NEEDS
+        )
+
+    def key(self) -> tuple:
+        """Önbellek anahtarı"""
+        return (self.needs, self.money, self.negative_scale, type(self.job).__name__, self.job.name,
+                self.salary, self.work_energy, self.critical_since, self.is_alive)
+
+
+class ActionEstimator:
+    """Eylem veya kısa eylem dizisinin sonuçlarını vektörel Monte Carlo denemeleriyle tahmin eder"""
+
+    def __init__(self, trials: int = DEFAULT_TRIALS, seed: int = 0, cache_size: int = CACHE_SIZE):
+        self.trials = trials
+        self.seed = seed
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[tuple, dict]' = OrderedDict()
+
+        # Diagnostik sayaçları
+        self.hits = 0
+        self.misses = 0
+
+    def estimate(self, sim, actions, trials: Optional[int] = None) -> Dict:
+        """Beklenen değişimler, varyanslar ve kritik duruma düşme / ölme olasılıkları"""
+        trials = trials or self.trials
+        state = EstimatorState(sim)
+        key = (state.key(), normalize_actions(actions), trials)
+
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        # Seed anahtardan türetilir - sonuç sorgu sırasından bağımsızdır
+        rng = np.random.default_rng([self.seed, zlib.crc32(repr(key).encode('utf-8'))])
+        result = self._simulate(state, key[1], trials, rng)
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def estimate_each(self, sim, actions: Sequence = ACTIONS) -> Dict[str, Dict]:
+        """Her eylemin tek başına tahmini"""
+        return {action: self.estimate(sim, action) for action in actions}
+
+    def clear(self):
+        """Önbelleği boşaltır"""
+        self._cache.clear()
+
+    def get_diagnostics(self) -> dict:
+        """Önbellek sayaçları"""
+        total = self.hits + self.misses
+        return {
+            'cached': len(self._cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    # Denemeler
+
+    def _simulate(self, state: EstimatorState, actions: tuple, trials: int, rng) -> Dict:
+        """Tüm denemeleri eylem eylem birlikte ilerletir"""
+        start = np.array(state.needs + (state.money,), dtype=np.float64)
+        needs = np.tile(start[:-1], (trials, 1))
+        money = np.full(trials, start[-1])
+        elapsed = np.zeros(trials)
+        critical_since = np.tile(np.array(state.critical_since, dtype=np.float64), (trials, 1))  # None -> nan
+        alive = np.full(trials, state.is_alive)
+        hit_critical = np.zeros(trials, dtype=bool)
+        failed = np.zeros(trials, dtype=bool)
+
+        scale = np.where(DAMPENED_MASK, state.negative_scale, 1.0)
+        decay = DECAY_PER_HOUR * scale
+
+        for action, amount in actions:
+            a = ACTIONS.index(action)
+            profile = ACTION_PROFILES[action]
+            ranges = ACTION_RANGES.get(action, {})
+            duration = self._sample(rng, ranges.get('duration'), profile['duration'], trials)
+            done = alive.copy()
+
+            if action == 'go_to_work':
+                done &= (state.salary > 0) & (needs[:, _ENERGY] >= state.work_energy)
+                needs[done, _ENERGY] -= state.work_energy
+                money[done] += self._salaries(state, rng, int(done.sum()))
+            elif action in ('bet', 'slots'):
+                stake = np.full(trials, float(amount)) if amount else np.maximum(1, np.round(money * GAMBLE_FRACTION))
+                done &= (stake > 0) & (stake <= money)
+                count = int(done.sum())
+                if action == 'bet':
+                    winnings = _BET_MULTIPLIERS[rng.choice(len(_BET_MULTIPLIERS), count, p=_BET_PROBABILITIES)] - 1
+                else:
+                    winnings = _SLOT_PAYOUTS[rng.integers(0, len(_SLOT_PAYOUTS), count)] - 1
+                winnings = winnings * stake[done]
+                money[done] = np.maximum(0, money[done] + winnings)
+                # GamblingGames.apply_result ile aynı ruh hali etkisi
+                mood_change = np.where(winnings > 0, 10.0, -15.0)
+                if action == 'slots':
+                    mood_change[winnings >= stake[done] * 5] = 20.0
+                needs[done, _MOOD] = np.clip(needs[done, _MOOD] + mood_change, 0, 100)
+            else:
+                if 'cost' in ranges:
+                    money[done] -= self._sample(rng, ranges['cost'], 0, trials)[done]
+                immediate = np.where(IMMEDIATE_EFFECTS[a] < 0, IMMEDIATE_EFFECTS[a] * scale, IMMEDIATE_EFFECTS[a])
+                needs[done] = np.round(np.clip(needs[done] + immediate, 0, 100), 2)
+
+            # Aktivite ilerlemesi: süreye bağlı (T + 1) / 2T oranı, tek yönlü adımlarda sınırlama sonda yapılabilir
+            effects = _ACTIVITY_EFFECTS[a]
+            if action == 'go_to_work':
+                effects = effects.copy()
+                effects[_ENERGY] = -state.work_energy
+            steps = np.maximum(1, duration * STEPS_PER_HOUR)
+            ramp = (steps + 1) / (2 * steps)
+            needs[done] = np.round(np.clip(needs[done] + ramp[done, None] * effects, 0, 100), 2)
+
+            # Yapılamayan eylemde Sim bir saat boşta kalır
+            failed |= alive & ~done
+            duration = np.where(done, duration, IDLE_HOURS)
+            needs[alive] = np.round(np.clip(needs[alive] + duration[alive, None] * decay, 0, 100), 2)
+            elapsed[alive] += duration[alive]
+
+            # Kritik süre sayaçları ve ölüm - Sim._check_death_conditions ile aynı kural
+            critical = (needs <= _CRITICAL_LEVELS) & alive[:, None]
+            critical_since = np.where(critical, np.where(np.isnan(critical_since), elapsed[:, None], critical_since), np.nan)
+            hit_critical |= critical.any(axis=1)
+            alive &= ~(critical & (elapsed[:, None] - critical_since >= _DEATH_HOURS)).any(axis=1)
+
+        final = np.column_stack([needs, money])
+        deltas = final - start
+        return {
+            'trials': trials,
+            'actions': [action for action, _ in actions],
+            'expected': {field: round(float(deltas[:, i].mean()), 2) for i, field in enumerate(RESULT_FIELDS)},
+            'variance': {field: round(float(deltas[:, i].var()), 2) for i, field in enumerate(RESULT_FIELDS)},
+            'expected_hours': round(float(elapsed.mean()), 2),
+            'p_critical': float(hit_critical.mean()),
+            'p_death': float((~alive).mean()) if state.is_alive else 0.0,
+            'p_failed': float(failed.mean())
+        }
+
+    @staticmethod
+    def _sample(rng, bounds, default, trials: int) -> np.ndarray:
+        """Aralıktan (uçlar dahil) tamsayı örnekler - aralık yoksa sabit değer"""
+        if bounds is None:
+            return np.full(trials, float(default))
+        low, high = bounds
+        return rng.integers(low, high + 1, trials).astype(np.float64)
+
+    @staticmethod
+    def _salaries(state: EstimatorState, rng, count: int) -> np.ndarray:
+        """Mesleğin maaş dağılımı - doktor bonusu ve sanatçı çarpanı dahil"""
+        salary = np.full(count, float(state.salary))
+        if isinstance(state.job, HealthcareJob):
+            salary[rng.random(count) < 0.3] *= 1.5
+        elif isinstance(state.job, CreativeJob):
+            salary = np.floor(salary * rng.uniform(0.5, 2.0, count))
+        return salary
+
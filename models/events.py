@@ -1,15 +1,16 @@
 import random
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
+from models.rng import EVENTS_STREAM, subsystem_rng
 
 class Events:
     def __init__(self, game):
         self.game = game
         self.console = game.ui.console
         self.last_event_time = None
-        self.event_cooldown = 300  # 5 dakika
+        self.event_cooldown = timedelta(hours=4)  # Oyun zamanı - her eylem en az bir oyun saati sürer
         self.is_action_in_progress = False
         
         # Günün saatlerine göre event olasılıkları
@@ -29,13 +30,13 @@ class Events:
                         'name': 'İşten Zam',
                         'description': 'Patronunuz performansınızdan memnun ve size zam teklif ediyor!',
                         'condition': lambda sim: sim.job != "İşsiz" and sim.job_satisfaction > 70,
-                        'effect': lambda sim: {'money': random.randint(500, 1000)}
+                        'effect': lambda sim, rng: {'money': rng.randint(500, 1000)}
                     },
                     {
                         'name': 'İşten Kovulma Riski',
                         'description': 'Performansınız düşük, işinizden olabilirsiniz!',
                         'condition': lambda sim: sim.job != "İşsiz" and sim.job_satisfaction < 30,
-                        'effect': lambda sim: {'job_satisfaction': -20}
+                        'effect': lambda sim, rng: {'job_satisfaction': -20}
                     }
                 ]
             },
@@ -46,13 +47,30 @@ class Events:
                         'name': 'Eski Arkadaş',
                         'description': 'Eski bir arkadaşınızla karşılaştınız!',
                         'condition': lambda sim: sim.social < 70,
-                        'effect': lambda sim: {'social': 15, 'mood': 10}
+                        'effect': lambda sim, rng: {'social': 15, 'mood': 10}
                     },
                     {
                         'name': 'Yeni Arkadaş',
                         'description': 'Yeni bir arkadaş edindiniz!',
                         'condition': lambda sim: sim.social < 50,
-                        'effect': lambda sim: {'social': 10, 'mood': 5}
+                        'effect': lambda sim, rng: {'social': 10, 'mood': 5}
+                    }
+                ]
+            },
+            'relationship': {
+                'probability': 0.1,  # %10
+                'events': [
+                    {
+                        'name': 'Yakınlaşma',
+                        'description': lambda sim: self.describe_closeness(sim),
+                        'condition': lambda sim: bool(sim.relationship_graph.near_next_level(sim.name)),
+                        'effect': lambda sim, rng: {'social': 10, 'mood': 10}
+                    },
+                    {
+                        'name': 'Düğün Daveti',
+                        'description': lambda sim: self.describe_wedding(sim),
+                        'condition': lambda sim: self.couple_to_celebrate(sim) is not None,
+                        'effect': lambda sim, rng: {'social': 15, 'mood': 10, 'money': -rng.randint(50, 150)}
                     }
                 ]
             },
@@ -63,13 +81,13 @@ class Events:
                         'name': 'Şanslı Gün',
                         'description': 'Bugün şanslısınız! Cebinizde para buldunuz.',
                         'condition': lambda sim: True,
-                        'effect': lambda sim: {'money': random.randint(100, 500), 'mood': 15}
+                        'effect': lambda sim, rng: {'money': rng.randint(100, 500), 'mood': 15}
                     },
                     {
                         'name': 'Şanssız Gün',
                         'description': 'Bugün şanssızsınız! Cüzdanınızı kaybettiniz.',
                         'condition': lambda sim: sim.money > 100,
-                        'effect': lambda sim: {'money': -random.randint(50, 200), 'mood': -10}
+                        'effect': lambda sim, rng: {'money': -rng.randint(50, 200), 'mood': -10}
                     }
                 ]
             },
@@ -80,13 +98,13 @@ class Events:
                         'name': 'Hasta Olma',
                         'description': 'Hasta oldunuz! Dinlenmeniz gerekiyor.',
                         'condition': lambda sim: sim.energy < 30,
-                        'effect': lambda sim: {'energy': -20, 'mood': -10, 'hygiene': -15}
+                        'effect': lambda sim, rng: {'energy': -20, 'mood': -10, 'hygiene': -15}
                     },
                     {
                         'name': 'Sağlıklı Gün',
                         'description': 'Kendinizi çok iyi hissediyorsunuz!',
                         'condition': lambda sim: sim.energy > 70,
-                        'effect': lambda sim: {'energy': 10, 'mood': 5}
+                        'effect': lambda sim, rng: {'energy': 10, 'mood': 5}
                     }
                 ]
             }
@@ -109,18 +127,22 @@ class Events:
         if self.is_action_in_progress:
             return
             
-        current_time = datetime.now()
-        if self.last_event_time and (current_time - self.last_event_time).total_seconds() < self.event_cooldown:
+        # Bekleme süresi oyun zamanıyla ölçülür - tüm eşlerde aynı sonucu verir
+        current_time = self.game.game_time
+        if self.last_event_time and current_time - self.last_event_time < self.event_cooldown:
             return
             
         # Günün saatine göre event olasılığını belirle
         time_of_day = self.get_time_of_day()
         time_prob = self.time_based_probabilities[time_of_day]
         
+        # Olayların Sim'e özel akışı (seed verildiyse), yoksa Sim.rng veya global random
+        rng = subsystem_rng(getattr(self.game, 'rng_service', None), sim, EVENTS_STREAM) or random
+        
         # Event olasılığını kontrol et
-        if random.random() < time_prob:
+        if rng.random() < time_prob:
             # Kategori seç
-            category = random.choices(
+            category = rng.choices(
                 list(self.event_categories.keys()),
                 weights=[cat['probability'] for cat in self.event_categories.values()]
             )[0]
@@ -132,17 +154,37 @@ class Events:
             ]
             
             if available_events:
-                event = random.choice(available_events)
-                self.show_event(event, sim)
+                event = rng.choice(available_events)
+                self.show_event(event, sim, rng)
                 self.last_event_time = current_time
 
-    def show_event(self, event, sim):
+    def describe_closeness(self, sim):
+        """Bir sonraki seviyeye yaklaşan ilk ilişkiyi anlatır"""
+        other, next_type = sim.relationship_graph.near_next_level(sim.name)[0]
+        return f"{other} ile aranız çok iyi gidiyor - yakında {next_type} olabilirsiniz!"
+
+    def couple_to_celebrate(self, sim):
+        """Sim'in iki tarafını da tanıdığı ilk sevgili çifti - nüfustaki sevgili çiftleri indeksinden"""
+        for pair in sorted(sim.relationship_graph.pairs_of_type("Sevgili")):
+            if sim.name not in pair and all(name in sim.relationships for name in pair):
+                return pair
+        return None
+
+    def describe_wedding(self, sim):
+        """Düğün davetini anlatır"""
+        first, second = self.couple_to_celebrate(sim)
+        return f"{first} ve {second} evleniyor ve sizi de düğünlerine davet ettiler! Hediye almayı unutmayın."
+
+    def show_event(self, event, sim, rng=None):
         """Olayı gösterir ve etkilerini uygular"""
         # UI ile event göster
-        self.game.ui.show_event(event['name'], event['description'])
+        description = event['description']
+        if callable(description):
+            description = description(sim)
+        self.game.ui.show_event(event['name'], description)
         
         # Etkileri uygula
-        effects = event['effect'](sim)
+        effects = event['effect'](sim, rng or random)
         
         # Sim'in durumunu güncelle
         for attr, value in effects.items():
@@ -37,7 +37,7 @@ class GamblingGames:
             ('7️⃣', '7️⃣'): 10
         }
     
-    def play_bet_game(self, bet_amount: float) -> Dict:
+    def play_bet_game(self, bet_amount: float, rng=None) -> Dict:
         """Basit bahis oyunu - şansına güven!"""
         if bet_amount <= 0:
             return {
@@ -79,7 +79,21 @@ class GamblingGames:
         time.sleep(1)
         
         # Sonucu belirle
-        rand = random.randint(1, 100)
+        result = self.resolve_bet(bet_amount, rng)
+        if result['success']:
+            self.ui.console.print(result['message'])
+        return result
+    
+    def resolve_bet(self, bet_amount: float, rng=None) -> Dict:
+        """Bahis sonucunu animasyonsuz belirler (rng: Sim'in rastgele akışı)"""
+        if bet_amount <= 0:
+            return {
+                'success': False,
+                'message': "Geçerli bir bahis miktarı girin!",
+                'winnings': 0
+            }
+        
+        rand = (rng or random).randint(1, 100)
         cumulative = 0
         
         for chance, multiplier in self.bet_odds:
@@ -89,13 +103,11 @@ class GamblingGames:
                     # Kaybetti
                     winnings = -bet_amount
                     result_message = f"💔 [bright_red]Kaybettiniz! -{bet_amount}₺[/bright_red]"
-                    self.ui.console.print(result_message)
                 else:
                     # Kazandı
                     profit = bet_amount * (multiplier - 1)
                     winnings = profit
                     result_message = f"🎉 [bright_green]Kazandınız! x{multiplier} = +{profit}₺[/bright_green]"
-                    self.ui.console.print(result_message)
                 
                 return {
                     'success': True,
@@ -112,7 +124,7 @@ class GamblingGames:
             'winnings': 0
         }
     
-    def play_slots(self, bet_amount: float) -> Dict:
+    def play_slots(self, bet_amount: float, rng=None) -> Dict:
         """Slot makinesi oyunu"""
         if bet_amount <= 0:
             return {
@@ -145,19 +157,36 @@ class GamblingGames:
                 self.ui.console.print("\n🎰 Çeviriyor... 🎰")
         
         # Final sonuç
-        final_slot1 = random.choice(self.slot_symbols)
-        final_slot2 = random.choice(self.slot_symbols)
-        final_slot3 = random.choice(self.slot_symbols)
-        
-        slots = (final_slot1, final_slot2, final_slot3)
+        result = self.resolve_slots(bet_amount, rng)
+        final_slot1, final_slot2, final_slot3 = result['slots']
         
         self.ui.console.print("\n🎰 [bright_yellow]SONUÇ:[/bright_yellow] 🎰")
         self.ui.console.print(f"┌─────────────┐")
         self.ui.console.print(f"│  {final_slot1}  │  {final_slot2}  │  {final_slot3}  │")
         self.ui.console.print(f"└─────────────┘")
         
+        self.ui.console.print(f"\n{result['message']}")
+        
+        return result
+    
+    def resolve_slots(self, bet_amount: float, rng=None) -> Dict:
+        """Slot sonucunu animasyonsuz belirler (rng: Sim'in rastgele akışı)"""
+        if bet_amount <= 0:
+            return {
+                'success': False,
+                'message': "Geçerli bir bahis miktarı girin!",
+                'winnings': 0
+            }
+        
+        rng = rng or random
+        slots = (
+            rng.choice(self.slot_symbols),
+            rng.choice(self.slot_symbols),
+            rng.choice(self.slot_symbols)
+        )
+        
         # Kazancı hesapla
-        winnings = self._calculate_slot_winnings(slots, bet_amount)
+        winnings = self.calculate_slot_winnings(slots, bet_amount)
         
         if winnings > bet_amount:
             profit = winnings - bet_amount
@@ -179,8 +208,6 @@ class GamblingGames:
             profit = -bet_amount
             result_message = f"💔 [bright_red]Kaybettiniz! -{bet_amount}₺[/bright_red]"
         
-        self.ui.console.print(f"\n{result_message}")
-        
         return {
             'success': True,
             'message': result_message,
@@ -189,7 +216,23 @@ class GamblingGames:
             'duration': 1  # 1 saat zaman geçişi
         }
     
-    def _calculate_slot_winnings(self, slots: Tuple, bet_amount: float) -> float:
+    def apply_result(self, sim, result: Dict, bet_amount: float):
+        """Oyun sonucunu Sim'in parasına ve ruh haline uygular"""
+        # Para güncelle
+        sim.money += result['winnings']
+        sim.money = max(0, sim.money)  # Negatif para olmayacak
+        
+        # Mood etkisi
+        if result['winnings'] > 0:
+            # Slotta büyük kazançlarda daha çok mutluluk
+            if 'slots' in result and result['winnings'] >= bet_amount * 5:
+                sim.mood = min(100, sim.mood + 20)  # Büyük kazanç
+            else:
+                sim.mood = min(100, sim.mood + 10)  # Normal kazanç
+        else:
+            sim.mood = max(0, sim.mood - 15)    # Kaybedince üzgün
+    
+    def calculate_slot_winnings(self, slots: Tuple, bet_amount: float) -> float:
         """Slot sonuçlarına göre kazancı hesaplar"""
         # Tam üçlü kontrol et
         if slots in self.slot_payouts:
@@ -3,24 +3,44 @@ import sys
 import time
 import random
 import threading
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 
 from models.sim import Sim
+from models.activity import compile_activity
 from models.actions import Actions
 from models.events import Events
 from models.network import Network
 from models.ui import SimsUI
 from models.stats_display import StatsDisplay
-from models.jobs import JobFactory
+from models.jobs import JobChoice, JobFactory
 from models.gambling import GamblingGames
 from rich.align import Align
 from models.character_types import CharacterFactory
+from models.prediction import NeedsPredictor, PREDICTED_NEEDS, DEFAULT_TOLERANCE
+from models.authority import AuthoritativeSimulation, ACTION_INTENTS, apply_sim_state
+from models.clock import WorldClock, format_world_time, parse_world_time
+from models.lockstep import LockstepSession
+from models.relationships import RelationshipGraph
+from models.action_engine import ACTION_TABLE
+from models.rng import GAMBLING_STREAM, RandomService, subsystem_rng
 import inquirer
 
+# Eylem Tahminleri ekranında Sim'in kendisinde bir kez denenip geri alınan tablo eylemleri
+REHEARSED_ACTIONS = tuple(action for action in ACTION_INTENTS if action in ACTION_TABLE)
+
+# Denemede değişimi gösterilen alanlar
+REHEARSAL_FIELDS = ('mood', 'energy', 'hunger', 'hygiene', 'social', 'money')
+
 class Game:
-    def __init__(self, dev_mode: bool = False):
+    def __init__(self, dev_mode: bool = False, record_path: Optional[str] = None,
+                 authoritative: bool = False, lockstep: bool = False, seed: Optional[int] = None):
         self.sim = None
+        # Oyunun ilişki deposu - her yeni/yüklenen oyunda yenilenir, önceki oyunun kenarları taşınmaz
+        self.relationship_graph = RelationshipGraph()
+        # Seed verildiyse tüm rastgelelik alt sistem/Sim başına seed'li akışlardan gelir
+        self.rng_service = RandomService(seed) if seed is not None else None
         self.event_generator = None
         self.day_counter = 1
         self.quit_game = False
@@ -35,21 +55,91 @@ class Game:
         self.actions = Actions(self)
         self.events = Events(self)
         self.gambling = GamblingGames(self.ui)  # Bahis oyunları sistemi
+        self.seed = seed
+        self.estimator = None  # Eylem sonuçlarının önbellekli tahmini - ilk kullanımda kurulur
         self.network: Optional[Network] = None  # Ağ bağlantısı
+        self.record_path = record_path  # Ağ oturumu kayıt dosyası (None ise kayıt yok)
         
         # Multiplayer özel özellikler
         self.is_host = False
+        self.authoritative = authoritative  # Host tüm Sim'leri çalıştırır, istemciler sadece istek gönderir
+        self.authority: Optional[AuthoritativeSimulation] = None
+        self.lockstep = lockstep  # Tüm eşler aynı eylem kaydını uygular, sadece eylemler gönderilir
+        self.lockstep_session: Optional[LockstepSession] = None
         self.auto_sync_enabled = True
         self.last_player_update = time.time()
         self.player_update_interval = 2  # 2 saniyede bir oyuncu durumu güncelle
         
+        # Dead reckoning - diğer oyuncuların tahmini ile gerçek değer arasındaki fark
+        # tolerans içindeyse güncelleme gönderilmez
+        self.sync_tolerance = DEFAULT_TOLERANCE
+        self.max_sync_silence = 30  # Saniye - fark olmasa da en geç bu sürede bir gönder
+        self._sent_predictor = NeedsPredictor()
+        self._last_sent_data = None
+        self._last_sent_time = 0.0
+        self._activity_state = {}  # Devam eden aktivitenin tahmin parametreleri
+        
         # Sabit zaman (1960 yılında sabit bir zaman)
         self.game_time = datetime(1960, 1, 1, 6, 0)
+        # Oyun zamanı ağ ve otorite thread'lerinden de yazılır
+        self.time_lock = threading.RLock()
+        # Host'un dünya saati - çok oyunculu oyun başlayınca kurulur, istemciler ClockSync ile tahmin eder
+        self.world_clock: Optional[WorldClock] = None
     
     def format_time(self):
         """Oyun zamanını formatlar"""
         return self.game_time.strftime("%d %B %Y, %H:%M")
     
+    def world_now(self) -> Optional[datetime]:
+        """Paylaşılan dünya saati - host kendi saatini, istemci ClockSync tahminini okur (yoksa None)"""
+        if self.world_clock:
+            return self.world_clock.now()
+        # Lockstep'te zaman eylem kaydından türetilir, tek oyunculuda dünya saati yoktur
+        if self.lockstep or self.is_host or not self.network:
+            return None
+        return self.network.clock_sync.world_now()
+    
+    def sync_world_time(self) -> bool:
+        """Oyun zamanını dünya saatine eşitler - dünya saatinin önüne geçen yerel zaman geri çekilir"""
+        world_time = self.world_now()
+        if world_time is None:
+            return False
+        
+        with self.time_lock:
+            if world_time == self.game_time:
+                return False
+            
+            self.game_time = world_time
+            if self.sim and not self.lockstep_session:
+                self.sim.game_time = self.game_time
+            return True
+    
+    def apply_world_time(self, world_time: datetime) -> bool:
+        """Host dünya saatini yerel oyun zamanına katar - dünya saati varsa zaman ondan türetilir"""
+        if self.world_now() is not None:
+            return self.sync_world_time()
+        
+        with self.time_lock:
+            if world_time <= self.game_time:
+                return False
+            
+            self.game_time = world_time
+            # Lockstep'te Sim'in zamanı sadece eylem kaydıyla ilerler
+            if self.sim and not self.lockstep_session:
+                self.sim.game_time = self.game_time
+            return True
+    
+    def advance_game_time(self, hours: float):
+        """Oyun zamanını ve Sim'in zamanını birlikte ilerletir - çok oyunculuda zaman dünya saatinden gelir"""
+        world_time = self.world_now()
+        with self.time_lock:
+            if world_time is None:
+                self.game_time += timedelta(hours=hours)
+            else:
+                # Eylem süresi yerel saati dünya saatinin önüne geçiremez
+                self.game_time = world_time
+            self.sim.game_time = self.game_time
+    
     def _dev_sleep(self, normal_duration: float):
         """Dev mode'a göre uyku süresi ayarlar"""
         if self.dev_mode:
@@ -244,12 +334,31 @@ class Game:
             if not self.is_host or not self.network:
                 return False
                 
+            # Dünya saati host Sim'inin eylemlerinden bağımsız ilerler (lockstep'te eylem kaydı belirler)
+            if self.authoritative or not self.lockstep:
+                self.world_clock = WorldClock(self.game_time)
+            
+            # Otoriter modda tüm Sim'ler host'ta çalışır
+            if self.authoritative:
+                self._start_authority()
+            
             # Tüm oyunculara oyun başlama mesajı gönder
             start_message = {
                 'type': 'game_start',
                 'message': 'Oyun başlıyor!',
-                'host': self.sim.name if self.sim else 'Sunucu'
+                'host': self.sim.name if self.sim else 'Sunucu',
+                'mode': 'authoritative' if self.authoritative else 'lockstep' if self.lockstep else 'sync'
             }
+            
+            # Lockstep modda herkes aynı seed, başlangıç zamanı ve oyuncu listesiyle başlar
+            if self.lockstep and not self.authoritative:
+                start_message.update({
+                    'seed': random.randrange(2 ** 32),
+                    'start_time': format_world_time(self.game_time),
+                    'roster': self.network.get_predicted_players()
+                })
+                self._start_lockstep(start_message)
+            
             self.network._broadcast(start_message)
             
             self.ui.show_notification("Multiplayer oyun başlatılıyor...", "info")
@@ -264,10 +373,66 @@ class Game:
             self.ui.show_notification(f"Oyun başlatılırken hata: {str(e)}", "error")
             return False
     
+    def _start_authority(self):
+        """Host tarafında otoriter simülasyonu kurar ve başlatır"""
+        self.authority = AuthoritativeSimulation(self)
+        
+        # Host'un kendi Sim'i doğrudan simülasyona dahil edilir
+        for player_name, player_data in self.network.get_predicted_players().items():
+            if self.sim and player_name == self.sim.name:
+                self.authority.add_player(player_name, player_data, sim=self.sim)
+            else:
+                self.authority.add_player(player_name, player_data)
+        
+        self.authority.start()
+    
+    def _start_lockstep(self, start_message: dict):
+        """Oyun başlangıç bilgisinden lockstep oturumunu kurar"""
+        self.lockstep_session = LockstepSession(
+            self,
+            start_message['seed'],
+            start_time=parse_world_time(start_message['start_time'])
+        )
+        
+        # İsim sırasıyla eklenir - tüm eşlerde aynı kopyalar oluşur
+        roster = start_message.get('roster', {})
+        for player_name in sorted(roster):
+            self.lockstep_session.add_player(player_name, roster[player_name])
+        
+        # Kendi Sim'imiz de kopyalardan biridir, aksi halde eşlerden ayrışır
+        if self.sim and self.sim.name in self.lockstep_session.sims:
+            self.sim = self.lockstep_session.sims[self.sim.name]
+        
+        if self.is_host:
+            self.lockstep_session.start()
+    
+    def _sim_access(self):
+        """Host'ta otoriter simülasyon çalışıyorsa Sim'e erişimi onun adımlarıyla sıralayan kilit"""
+        return self.authority.sim_lock if self.authority else nullcontext()
+    
+    def _uses_intents(self) -> bool:
+        """Eylemler yerelde değil istek olarak mı işleniyor? (otoriter/lockstep)"""
+        return bool((self.authoritative or self.lockstep) and self.network)
+
+    def _bind_rng(self):
+        """Seed verildiyse oyuncunun Sim'ine kendi rastgele akışını bağlar"""
+        if self.rng_service is not None and self.sim:
+            self.rng_service.bind_sim(self.sim)
+
+    def _attach_new_sim(self):
+        """Yeni oluşturulan Sim için yeni ilişki deposu açar ve Sim'i bağlar"""
+        self.relationship_graph = RelationshipGraph()
+        self.relationship_graph.attach(self.sim)
+
+    def _gambling_rng(self):
+        """Yerel bahislerin rastgele akışı - seed yoksa Sim.rng veya global random"""
+        return subsystem_rng(self.rng_service, self.sim, GAMBLING_STREAM)
+
     def _start_multiplayer_game_loop(self):
         """Multiplayer oyun döngüsü"""
-        # Auto-sync thread'i başlat
-        if self.is_host:
+        # Auto-sync thread'i başlat - istemciler de host saatine hizalı gönderir.
+        # Otoriter modda durumları host'un simülasyonu yayınlar, lockstep'te herkes hesaplar.
+        if not self.authoritative and not self.lockstep:
             sync_thread = threading.Thread(target=self._auto_sync_players)
             sync_thread.daemon = True
             sync_thread.start()
@@ -278,21 +443,26 @@ class Game:
     
     def _auto_sync_players(self):
         """Oyuncu durumlarını otomatik olarak senkronize eder"""
+        last_slot = None
+        
         while (self.is_multiplayer and self.network and 
                self.network.is_connected() and self.auto_sync_enabled):
             
-            current_time = time.time()
-            if current_time - self.last_player_update > self.player_update_interval:
+            # Senkronizasyon dilimleri host saatine göre hesaplanır,
+            # böylece tüm lobi aynı anda gönderir
+            current_slot = int(self.network.host_time() // self.player_update_interval)
+            if current_slot != last_slot:
                 if self.sim:
                     self._sync_player_state()
-                self.last_player_update = current_time
+                self.last_player_update = time.time()
+                last_slot = current_slot
             
             self._dev_sleep(1)
     
-    def _sync_player_state(self):
-        """Kendi oyuncu durumunu diğerlerine gönderir"""
-        if not self.network or not self.sim:
-            return
+    def _sync_player_state(self, force: bool = False) -> bool:
+        """Kendi oyuncu durumunu diğerlerine gönderir - tahmin tutuyorsa göndermez"""
+        if not self.network or not self.sim or self.authoritative or self.lockstep:
+            return False
             
         player_data = {
             'mood': self.sim.mood,
@@ -306,10 +476,37 @@ class Game:
             'job_experience': getattr(self.sim, 'job_experience', 0),
             'job_satisfaction': getattr(self.sim, 'job_satisfaction', 50),
             'location': getattr(self.sim, 'location', 'Ev'),
-            'activity': getattr(self.sim, 'current_activity', 'Boşta')
+            'activity': getattr(self.sim, 'current_activity', 'Boşta'),
+            'rates': self._activity_state.get('rates', {}),
+            'activity_hours': self._activity_state.get('activity_hours', 0),
+            'pace': self._activity_state.get('pace', 0)
         }
         
+        if not force and not self._needs_player_update(player_data):
+            return False
+        
         self.network.send_player_update(self.sim.name, player_data)
+        
+        # Diğer oyuncuların yapacağı tahmini burada da takip et
+        self._sent_predictor.reset(player_data)
+        self._last_sent_data = player_data
+        self._last_sent_time = time.time()
+        return True
+    
+    def _needs_player_update(self, player_data: dict) -> bool:
+        """Son gönderilen veriden yapılan tahmin artık tutmuyor mu?"""
+        if self._last_sent_data is None:
+            return True
+        
+        if time.time() - self._last_sent_time >= self.max_sync_silence:
+            return True
+        
+        # Tahmin edilmeyen alanlar (para, iş, aktivite...) birebir aynı olmalı
+        for key, value in player_data.items():
+            if key not in PREDICTED_NEEDS and self._last_sent_data.get(key) != value:
+                return True
+        
+        return self._sent_predictor.drift(player_data) > self.sync_tolerance
     
     def _refresh_multiplayer_state(self):
         """Multiplayer durumunu yeniler ve senkronize eder"""
@@ -320,7 +517,7 @@ class Game:
         self.sim.calculate_mood()
         
         # Durumu diğer oyunculara gönder
-        self._sync_player_state()
+        self._sync_player_state(force=True)
         
         # Başarı mesajı göster
         player_count = self.network.get_player_count()
@@ -339,8 +536,9 @@ class Game:
         # Ana menüye dön
         self.show_main_menu()
     
-    def _handle_game_start(self):
+    def _handle_game_start(self, mode: Optional[str] = None, start_message: Optional[dict] = None):
         """Client tarafında oyun başlatma mesajını işler"""
+        self.apply_game_mode(mode, start_message)
         self.ui.show_notification("🎮 Oyun başlıyor! Multiplayer moda geçiliyor...", "success")
         
         # Thread-safe flag ayarlama
@@ -350,6 +548,13 @@ class Game:
         # Kullanıcıya bilgi ver
         self.ui.console.print("\n[bright_green]✅ Devam etmek için enter'a basınız...[/bright_green]")
     
+    def apply_game_mode(self, mode: Optional[str] = None, start_message: Optional[dict] = None):
+        """Host'un başlattığı oyunun modunu uygular (arayüze dokunmaz)"""
+        self.authoritative = mode == 'authoritative'
+        self.lockstep = mode == 'lockstep'
+        if self.lockstep and start_message:
+            self._start_lockstep(start_message)
+    
     def create_new_sim(self):
         """Yeni bir Sim oluşturur."""
         # UI üzerinden karakter oluşturma
@@ -366,6 +571,8 @@ class Game:
         # Yeni job sistemi ile meslek atama
         self.sim.change_job(answers['job'])
         self.sim.game_time = self.game_time  # Başlangıç zamanını ayarla
+        self._attach_new_sim()
+        self._bind_rng()
         
         # Karakter tipi bilgisini göster
         self.ui.show_notification(
@@ -401,8 +608,10 @@ class Game:
             self.show_main_menu()
             return
         
-        self.sim = Sim.load(save_name)
+        self.relationship_graph = RelationshipGraph()
+        self.sim = Sim.load(save_name, self.relationship_graph)
         if self.sim:
+            self._bind_rng()
             # Sim'den yüklenen zamanı Game'e senkronize et
             if self.sim.game_time:
                 self.game_time = self.sim.game_time
@@ -449,7 +658,8 @@ class Game:
             self.ui.console.clear()
             
             # Multiplayer stats göster (diğer oyuncuları da dahil et)
-            self.stats_display.display_multiplayer_stats(self.network.players)
+            with self._sim_access():
+                self.stats_display.display_multiplayer_stats(self.network.get_predicted_players())
             
             # Multiplayer eylem menüsünü göster
             action = self.ui.show_multiplayer_action_menu()
@@ -464,6 +674,10 @@ class Game:
                 clean_action = "Oyuncu Listesi"
             elif "🔌" in action:
                 clean_action = "Bağlantıyı Kes"
+            elif "📡" in action:
+                clean_action = "Network Diagnostikleri"
+            elif "🔮" in action:
+                clean_action = "Eylem Tahminleri"
             elif "🍽️" in action:
                 clean_action = "Ye"
             elif "😴" in action or "Uyu" in action:
@@ -489,6 +703,8 @@ class Game:
                     self.network.send_chat_message(self.sim.name, message)
             elif clean_action == "Oyuncu Listesi":
                 self.ui.show_detailed_player_list(self.network.get_players_list())
+            elif clean_action == "Network Diagnostikleri":
+                self.ui.show_network_diagnostics(self.network.get_diagnostics())
             elif clean_action == "Bağlantıyı Kes":
                 self._leave_multiplayer_game()
                 return
@@ -514,6 +730,38 @@ class Game:
             self.handle_social_actions()
         elif action == "Bahis Oyunları":
             self.handle_gambling_actions()
+        elif action == "Eylem Tahminleri":
+            self.show_action_estimates()
+    
+    def show_action_estimates(self):
+        """Eylemlerin olası sonuçlarını Monte Carlo tahminiyle gösterir"""
+        if not self.sim.can_perform_action():
+            return
+        if self.estimator is None:
+            from models.estimator import ActionEstimator
+            self.estimator = ActionEstimator(seed=self.seed or 0)
+        with self._sim_access():
+            estimates = self.estimator.estimate_each(self.sim)
+            rehearsals = self.rehearse_actions()
+        self.ui.show_action_estimates(estimates, self.estimator.get_diagnostics(), rehearsals)
+    
+    def rehearse_actions(self) -> Dict[str, dict]:
+        """Tablo eylemlerini Sim'in kendisinde gerçek kurallarla bir kez dener - her deneme çıkışta geri alınır"""
+        rehearsals = {}
+        for action in REHEARSED_ACTIONS:
+            with self.sim.speculate():
+                before = [getattr(self.sim, field) for field in REHEARSAL_FIELDS]
+                result = self.actions.engine.perform(self.sim, action)
+                steps, _ = self.ui.get_progress_plan(result['duration'])
+                self.sim.run_activity(result, steps)
+                rehearsal = {
+                    field: round(getattr(self.sim, field) - value, 2)
+                    for field, value in zip(REHEARSAL_FIELDS, before)
+                }
+                rehearsal['duration'] = result['duration']
+                rehearsal['relationship'] = result.get('relationship')
+                rehearsals[action] = rehearsal
+        return rehearsals
     
     def _return_to_main_menu(self):
         """Ana menüye dönüş işlemi"""
@@ -561,6 +809,12 @@ class Game:
     def _leave_multiplayer_game(self):
         """Multiplayer oyundan ayrılır"""
         self.ui.show_notification("Multiplayer oyundan ayrılıyorsunuz...", "info")
+        if self.authority:
+            self.authority.stop()
+            self.authority = None
+        if self.lockstep_session:
+            self.lockstep_session.stop()
+            self.lockstep_session = None
         if self.network:
             self.network.disconnect()
             self.network = None
@@ -634,26 +888,95 @@ class Game:
         if self.events.is_action_in_progress:
             return
         
+        # Otoriter/lockstep modda eylem istek olarak gönderilir
+        if self._uses_intents():
+            self._perform_authoritative_action(action_func)
+            return
+        
         # Aksiyonu çalıştır
         result = action_func(self.sim)
         
         # Aktivite ilerlemesi göster
         if isinstance(result, dict) and 'duration' in result:
-            self.ui.show_activity_progress(
-                result.get('name', 'Aktivite'), 
-                result.get('duration', 3),
-                lambda i, total: self.sim.update_stats_during_activity(result, i, total)
-            )
+            duration = result.get('duration', 3)
+            # Etki adım başına değişimlere bir kez derlenir, çubuk her adımda yalnızca uygular
+            steps, _ = self.ui.get_progress_plan(duration)
+            plan = compile_activity(result, steps)
+            
+            # Diğer oyuncular aktivite boyunca ihtiyaçları tahmin edebilsin
+            if self.is_multiplayer and self.network:
+                self.sim.current_activity = result.get('name', 'Aktivite')
+                self._activity_state = {
+                    'rates': self.sim.get_activity_rates(result, steps),
+                    'activity_hours': duration,
+                    'pace': self.ui.get_activity_pace(duration)
+                }
+                self._sync_player_state()
+            
+            try:
+                self.ui.show_activity_progress(
+                    result.get('name', 'Aktivite'), 
+                    duration,
+                    lambda i, total: plan.apply_step(self.sim, i)
+                )
+            finally:
+                self.sim.current_activity = 'Boşta'
+                self._activity_state = {}
             
             # Zamanı ilerlet
             hours_passed = result.get('duration', 0)
-            self.game_time += timedelta(hours=hours_passed)
-            self.sim.game_time = self.game_time  # Sim'in zamanını da güncelle
+            self.advance_game_time(hours_passed)
+        
+        # Eylemden sonra rastgele olay (bekleme süresi oyun saatiyle ölçülür)
+        if self.sim.is_alive:
+            self.events.check_for_events(self.sim)
         
         # Çok oyunculu modda durumu güncelle
         if self.is_multiplayer and self.network:
             self._sync_player_state()
     
+    def _submit_intent(self, intent: dict) -> bool:
+        """Eylem isteğini host simülasyonuna iletir"""
+        if self.authority:
+            # Host kendi isteğini doğrudan kuyruğa ekler
+            self.authority.submit_intent(self.sim.name, intent)
+            return True
+        if self.lockstep_session:
+            return self.lockstep_session.submit(self.sim.name, intent)
+        return self.network.send_action_intent(self.sim.name, intent)
+    
+    def _perform_authoritative_action(self, action_func):
+        """Otoriter/lockstep modda eylemi istek olarak gönderir"""
+        action_name = action_func.__name__
+        
+        if action_name in ACTION_INTENTS:
+            intent = {'action': action_name}
+        else:
+            # İş arama/istifa gibi menülü eylemler yerelde seçilir, sonucu host'a bildirilir.
+            # Seçim Sim'e değil bir kayda yapılır - Sim'i simülasyon thread'i istekle değiştirir
+            choice = JobChoice(self.sim)
+            action_func(choice)
+            intent = {'action': 'change_job', 'job': choice.job}
+        
+        if self._submit_intent(intent):
+            self.ui.show_notification("⏳ İsteğiniz host'a iletildi.", "info")
+    
+    def apply_authoritative_state(self, state: dict):
+        """Host'un hesapladığı durumu kendi Sim'ine uygular"""
+        if not self.sim:
+            return
+        
+        apply_sim_state(self.sim, state)
+        
+        if state.get('game_time'):
+            self.apply_world_time(parse_world_time(state['game_time']))
+        
+        # Ölüm kararını host verir
+        if not state.get('is_alive', True) and self.sim.is_alive:
+            self.sim.is_alive = False
+            self.sim.death_reason = state.get('death_reason')
+            self.sim.death_time = self.game_time
+    
     def create_multiplayer_game(self, auto_join=False):
         """Çok oyunculu mod için yeni oyun oluşturur."""
         if not self.network:
@@ -676,6 +999,8 @@ class Game:
         # Yeni job sistemi ile meslek atama
         self.sim.change_job(answers['job'])
         self.sim.game_time = self.game_time
+        self._attach_new_sim()
+        self._bind_rng()
         
         # Oyuna katıl
         player_data = {
@@ -688,7 +1013,8 @@ class Game:
             'hunger': self.sim.hunger,
             'hygiene': self.sim.hygiene,
             'social': self.sim.social,
-            'money': self.sim.money
+            'money': self.sim.money,
+            'character_type': answers['character_type']
         }
         
         if self.network.join_game(self.sim.name, player_data):
@@ -857,25 +1183,21 @@ class Game:
         if gambling_action == "Bahis Oyunu (Şans)" or gambling_action == "Şans":
             # Bahis miktarı al
             bet_amount = self.ui.get_bet_amount_input(self.sim.money)
-            if bet_amount > 0:
+            if bet_amount > 0 and self._uses_intents():
+                # Otoriter modda sonucu host belirler
+                if self._submit_intent({'action': 'bet', 'amount': bet_amount}):
+                    self.ui.show_notification("⏳ Bahsiniz host'a iletildi.", "info")
+            elif bet_amount > 0:
                 # Bahis oyununu oyna
-                result = self.gambling.play_bet_game(bet_amount)
+                result = self.gambling.play_bet_game(bet_amount, self._gambling_rng())
                 if result['success']:
-                    # Para güncelle
-                    self.sim.money += result['winnings']
-                    self.sim.money = max(0, self.sim.money)  # Negatif para olmayacak
-                    
-                    # Mood etkisi
-                    if result['winnings'] > 0:
-                        self.sim.mood = min(100, self.sim.mood + 10)  # Kazanınca mutlu
-                    else:
-                        self.sim.mood = max(0, self.sim.mood - 15)    # Kaybedince üzgün
+                    # Para ve mood güncelle
+                    self.gambling.apply_result(self.sim, result, bet_amount)
                     
                     # Zaman geçişi
                     if 'duration' in result:
                         hours_passed = result['duration']
-                        self.game_time += timedelta(hours=hours_passed)
-                        self.sim.game_time = self.game_time
+                        self.advance_game_time(hours_passed)
                         self.sim.advance_time(hours_passed)
                     
                     # Sonuç sonrası durumu güncelle
@@ -888,29 +1210,21 @@ class Game:
         elif gambling_action == "Slot Makinesi" or gambling_action == "Makinesi":
             # Slot makinesi için bahis miktarı al
             bet_amount = self.ui.get_bet_amount_input(self.sim.money)
-            if bet_amount > 0:
+            if bet_amount > 0 and self._uses_intents():
+                # Otoriter modda sonucu host belirler
+                if self._submit_intent({'action': 'slots', 'amount': bet_amount}):
+                    self.ui.show_notification("⏳ Bahsiniz host'a iletildi.", "info")
+            elif bet_amount > 0:
                 # Slot oyununu oyna
-                result = self.gambling.play_slots(bet_amount)
+                result = self.gambling.play_slots(bet_amount, self._gambling_rng())
                 if result['success']:
-                    # Para güncelle
-                    self.sim.money += result['winnings']
-                    self.sim.money = max(0, self.sim.money)  # Negatif para olmayacak
-                    
-                    # Mood etkisi
-                    if result['winnings'] > 0:
-                        # Büyük kazançlarda daha çok mutluluk
-                        if result['winnings'] >= bet_amount * 5:
-                            self.sim.mood = min(100, self.sim.mood + 20)  # Büyük kazanç
-                        else:
-                            self.sim.mood = min(100, self.sim.mood + 10)  # Normal kazanç
-                    else:
-                        self.sim.mood = max(0, self.sim.mood - 15)    # Kaybedince üzgün
+                    # Para ve mood güncelle
+                    self.gambling.apply_result(self.sim, result, bet_amount)
                     
                     # Zaman geçişi
                     if 'duration' in result:
                         hours_passed = result['duration']
-                        self.game_time += timedelta(hours=hours_passed)
-                        self.sim.game_time = self.game_time
+                        self.advance_game_time(hours_passed)
                         self.sim.advance_time(hours_passed)
                     
                     # Sonuç sonrası durumu güncelle
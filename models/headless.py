@@ -0,0 +1,328 @@
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from models.authority import HeadlessSimulation, ACTION_INTENTS, GAMBLING_INTENTS
+from models.character_types import CharacterFactory
+from models.relationships import pair_key
+from models.rng import POLICY_STREAM, RandomService
+from models.scheduler import EventScheduler
+from models.sim import Sim
+
+# Oyunun başladığı tarih (Game ile aynı)
+DEFAULT_START_TIME = datetime(1960, 1, 1, 6, 0)
+
+# Rastgele politikada seçilebilecek eylemler - menü gerektirenler hariç
+RANDOM_ACTIONS = tuple(ACTION_INTENTS) + GAMBLING_INTENTS
+
+# Toplu çalıştırmada Sim'lere sırayla verilen meslekler
+DEFAULT_JOBS = ("Yazılımcı", "Öğretmen", "Doktor", "Sanatçı", "Mühendis", "İşsiz")
+
+# Eylem sonuç vermezse (ör. işsizken işe gitme) geçen boş süre
+IDLE_HOURS = 1
+
+# Senaryoda boşta bekleme eylemi (ör. 'wait:8') - eşikler arası tek adımda atlanır
+WAIT_ACTION = 'wait'
+
+# Başka bir Sim'le ilişki mesajı üreten eylemler ve ilişki değişimi
+SOCIAL_INTERACTIONS = {
+    'meet_friends': 5,
+    'go_to_party': 3
+}
+
+# İlişki mesajı akışları
+SOCIAL_STREAM = 'social'  # Sim'in etkileşeceği kişiyi seçer
+RELATIONSHIP_STREAM = 'relationship'  # Çiftin uyumu - her bölümde aynı sonucu verir
+
+
+def parse_script(script: str) -> List[dict]:
+    """'eat,go_to_work,bet:100' veya satır başına bir eylem içeren dosyayı isteklere çevirir"""
+    if os.path.exists(script):
+        with open(script, 'r', encoding='utf-8') as f:
+            tokens = [line.strip() for line in f]
+    else:
+        tokens = [token.strip() for token in script.split(',')]
+
+    intents = []
+    for token in tokens:
+        if not token or token.startswith('#'):
+            continue
+        action, _, argument = token.partition(':')
+        intent = {'action': action}
+        if argument and action == 'change_job':
+            intent['job'] = argument
+        elif argument:
+            intent['amount'] = float(argument)
+        intents.append(intent)
+    return intents
+
+
+class HeadlessEngine(HeadlessSimulation):
+    """Arayüz, menü ve bekleme olmadan Sim'leri oyun günleri boyunca çalıştıran motor"""
+
+    def __init__(self, script: Optional[List[dict]] = None, seed=None,
+                 start_time: Optional[datetime] = None, decay: bool = True, autopilot=None):
+        self._world_time = start_time or DEFAULT_START_TIME
+        # Tüm rastgelelik seed'li akışlardan gelir - aynı seed aynı iş yükünü üretir
+        self.rng_service = RandomService(seed)
+        super().__init__(self)
+        self.script = script  # None ise eylemler otomatik pilotla veya rastgele seçilir
+        self.autopilot = autopilot  # İhtiyaçlara göre eylem seçen denetleyici (models/autopilot.py)
+        self.decay = decay  # Eylem süresince ihtiyaçlar azalsın mı?
+        # Sim sıraları, bekleme bitişleri ve ölüm anları oyun zamanına göre tek kuyrukta
+        self.scheduler = EventScheduler(self._world_time)
+
+        # Sosyal eylemlerde etkileşilecek Sim adları (None ise ilişki mesajı üretilmez)
+        self.social_peers: Optional[List[str]] = None
+        self.outbox: List[tuple] = []  # (zaman, Sim, diğer, değişim) ilişki mesajları
+        self._peer_stubs: Dict[str, 'PeerStub'] = {}
+        self._dead: Set[str] = set()  # Ölümü bildirilmiş Sim'ler - ilişki mesajları artık uygulanmaz
+
+        # Ayrıntı seviyeleri (models/lod.py) - None ise tüm Sim'ler tam ayrıntıda çalışır
+        self.lod = None
+
+        # Rapor sayaçları
+        self.actions_performed = 0
+        self.sim_hours = 0.0
+        self.death_events = 0
+        self.messages_applied = 0
+
+    @property
+    def game_time(self):
+        """Motorun dünya zamanı - en ileri Sim'in zamanı"""
+        return self._world_time
+
+    def populate(self, count: int, character_types: Optional[List[str]] = None,
+                 jobs=DEFAULT_JOBS, indices=None) -> List:
+        """Karakter tipleri ve meslekleri sırayla dağıtarak Sim'ler oluşturur (indices: nüfustaki sıraları)"""
+        character_types = character_types or CharacterFactory.get_available_types()
+        sims = []
+        for i in (range(count) if indices is None else indices):
+            player_data = {
+                'character_type': character_types[i % len(character_types)],
+                'job': jobs[i % len(jobs)],
+                'gender': 'Erkek' if i % 2 == 0 else 'Kadın'
+            }
+            sims.append(self.add_player(f"Sim{i + 1}", player_data))
+        return sims
+
+    def _next_intent(self, sim, step: int) -> dict:
+        """Senaryodaki sıradaki eylem, otomatik pilotun seçimi veya rastgele bir eylem"""
+        if self.script:
+            return self.script[step % len(self.script)]
+        if self.autopilot is not None:
+            return self.autopilot.choose(sim) or {'action': WAIT_ACTION, 'amount': IDLE_HOURS}
+
+        # Sim başına politika akışı - sonuç Sim'lerin sırasından ve bölümlenmesinden bağımsız
+        action = self.rng_service.stream(POLICY_STREAM, sim.name).choice(RANDOM_ACTIONS)
+        if action in GAMBLING_INTENTS:
+            return {'action': action, 'amount': max(1, round(sim.money * 0.1))}
+        return {'action': action}
+
+    def _advance_sim_time(self, sim, hours):
+        """Sim zamanını ilerletir, motorun dünya zamanını öne alır"""
+        base = sim.game_time or self._world_time
+        sim.game_time = base + timedelta(hours=hours)
+        if sim.game_time > self._world_time:
+            self._world_time = sim.game_time
+
+    def idle(self, sim, hours: float):
+        """Sim'i boşta bekletir - azalma açıksa sıradaki eşiklere doğrudan atlanır"""
+        if not self.decay:
+            self._advance_sim_time(sim, hours)
+            return
+        sim.game_time = sim.game_time or self._world_time
+        sim.fast_forward(hours)
+        if sim.game_time > self._world_time:
+            self._world_time = sim.game_time
+
+    def step_sim(self, sim, step: int) -> float:
+        """Sim'e tek bir eylem uygular, geçen oyun saatini döndürür"""
+        return self.perform(sim, self._next_intent(sim, step))
+
+    def perform(self, sim, intent: dict) -> float:
+        """Eylem isteğini hemen uygular, geçen oyun saatini döndürür"""
+        if intent.get('action') == WAIT_ACTION:
+            hours = intent.get('amount', IDLE_HOURS)
+            self.idle(sim, hours)
+            self.actions_performed += 1
+            self.sim_hours += hours
+            return hours
+
+        result = self._apply_intent(sim, intent)
+        hours = result.get('duration', 0) if isinstance(result, dict) else 0
+        if hours > 0 and self.social_peers and intent.get('action') in SOCIAL_INTERACTIONS:
+            self._post_interaction(sim, intent['action'])
+
+        if hours <= 0:
+            # Eylem yapılamadı - Sim bir saat boşta kalır
+            hours = IDLE_HOURS
+            self.idle(sim, hours)
+        elif self.decay and intent.get('action') not in GAMBLING_INTENTS:
+            # Kumar eylemleri zaman geçişini kendisi uygular
+            sim.advance_time(hours)
+
+        self.actions_performed += 1
+        self.sim_hours += hours
+        return hours
+
+    # Sim'ler arası ilişki mesajları
+
+    def _post_interaction(self, sim, action: str):
+        """Sosyal eylem sonrası rastgele bir Sim'le ilişki mesajı üretir - hemen uygulanmaz"""
+        peer = self.rng_service.stream(SOCIAL_STREAM, sim.name).choice(self.social_peers)
+        if peer != sim.name:
+            self.outbox.append((sim.game_time, sim.name, peer, SOCIAL_INTERACTIONS[action]))
+
+    def take_outbox(self) -> List[tuple]:
+        """Biriken ilişki mesajlarını ve yeni ölüm bildirimlerini verir, kutuyu boşaltır"""
+        for name, sim in self.sims.items():
+            if not sim.is_alive and name not in self._dead:
+                # Ölüm bildirimi: kendine gönderilen mesaj - kopya kenarları tutan tüm bölümlere gider
+                self._dead.add(name)
+                self.outbox.append((sim.death_time, name, name, 0))
+        messages, self.outbox = self.outbox, []
+        return messages
+
+    def _participant(self, name: str, at: datetime):
+        """Yerel Sim veya başka bölümdeki Sim'in ilişki kopyasını tutan vekil"""
+        sim = self.sims.get(name)
+        if sim is not None:
+            # Kaba seviyedeki Sim mesaj anına kadar ilerletilir
+            return self.lod.observe(name, at) if self.lod is not None else sim
+        stub = self._peer_stubs.get(name)
+        if stub is None:
+            stub = self._peer_stubs[name] = PeerStub(name)
+        stub.game_time = at
+        return stub
+
+    def deliver(self, messages: List[tuple]) -> int:
+        """Bariyerde ilişki mesajlarını deterministik sırayla uygular - en az bir tarafı yerel olanlar"""
+        graph = self.relationship_graph
+        # Önce ölüm bildirimleri - ölen Sim'in kenarları siler ve mesajları zamanından bağımsız atlanır
+        for _, name, peer, _ in messages:
+            if name == peer and name not in self.sims:
+                self._dead.add(name)
+                graph.remove_sim(name)
+
+        applied = 0
+        for at, name, peer, change in sorted(messages):
+            if name == peer or (name not in self.sims and peer not in self.sims):
+                continue
+            if name in self._dead or peer in self._dead or not all(
+                    self.sims[local].is_alive for local in (name, peer) if local in self.sims):
+                continue
+            sim = self._participant(name, at)
+            other = self._participant(peer, at)
+            # Uyum çift başına akıştan gelir - iki bölümdeki kopya aynı kenarı üretir
+            rng = self.rng_service.stream(RELATIONSHIP_STREAM, '|'.join(pair_key(name, peer)))
+            graph.update(sim, other, change, None, rng)
+            for local, remote in ((sim, other), (other, sim)):
+                if isinstance(local, Sim):
+                    local.check_relationship_goals(remote)
+            if name in self.sims:
+                applied += 1  # Bölümler arası mesaj iki bölümde uygulanır, gönderenin bölümü sayar
+        self.messages_applied += applied
+        return applied
+
+    # Olay kuyruğu ile çalıştırma
+
+    def _take_turn(self, sim, end_time: datetime, step: int):
+        """Sim'in sırası geldi - eylemini uygular ve sıradaki sırasını kurar"""
+        # Bekleyen Sim'in ihtiyaçları sırası gelince toplu hesaplanır
+        self._catch_up(sim)
+        if not sim.is_alive or sim.game_time >= end_time:
+            self.scheduler.cancel_key((sim, 'death'))
+            return
+
+        intent = self._next_intent(sim, step)
+        if intent.get('action') == WAIT_ACTION and self.decay:
+            # Bekleme tembeldir: Sim uyanınca (veya ölüm anında) tek adımda hesaplanır
+            hours = intent.get('amount', IDLE_HOURS)
+            wake_time = min(sim.game_time + timedelta(hours=hours), end_time)
+            self.actions_performed += 1
+            self.sim_hours += (wake_time - sim.game_time).total_seconds() / 3600
+            sim.schedule_death(self.scheduler, self._on_death)
+            self.scheduler.schedule(wake_time, self._take_turn, sim, end_time, step + 1, key=(sim, 'turn'))
+            return
+
+        self.perform(sim, intent)
+        self.scheduler.cancel_key((sim, 'death'))
+        if sim.is_alive:
+            self.scheduler.schedule(sim.game_time, self._take_turn, sim, end_time, step + 1, key=(sim, 'turn'))
+
+    def _on_death(self, sim, attribute: str):
+        """Bekleyen Sim'in ölüm anı geldi - o ana kadar ilerletilir ve sırası iptal edilir"""
+        self.death_events += 1
+        self._catch_up(sim)
+        if not sim.is_alive:
+            self.scheduler.cancel_key((sim, 'turn'))
+
+    def _catch_up(self, sim):
+        """Tembel bekleyen Sim'i kuyruğun saatine getirir, dünya zamanını öne alır"""
+        sim.catch_up(self.scheduler.now)
+        if sim.game_time > self._world_time:
+            self._world_time = sim.game_time
+
+    def start(self, days: float):
+        """Her Sim'in ilk sırasını kurar - Sim'ler verilen oyun günü kadar çalışır"""
+        for sim in list(self.sims.values()):
+            end_time = sim.game_time + timedelta(days=days)
+            self.scheduler.schedule(sim.game_time, self._take_turn, sim, end_time, 0, key=(sim, 'turn'))
+        if self.lod is not None:
+            self.lod.start()
+
+    def advance(self, until: Optional[datetime] = None) -> int:
+        """Kuyruğu verilen oyun zamanına kadar (yoksa sonuna kadar) çalıştırır"""
+        return self.scheduler.run_until(until)
+
+    def run(self, days: float) -> Dict:
+        """Tüm Sim'leri verilen oyun günü kadar oyun zamanı sırasıyla çalıştırır ve raporu döndürür"""
+        started = time.perf_counter()
+
+        self.start(days)
+        self.advance()
+        if self.lod is not None:
+            self.lod.settle()
+        if self.social_peers:
+            self.deliver(self.take_outbox())
+
+        elapsed = time.perf_counter() - started
+        return self.get_report(elapsed)
+
+    def get_report(self, elapsed: float) -> Dict:
+        """Çalıştırma raporu - Sim-saat/saniye dahil"""
+        sims = list(self.sims.values())
+        alive = [sim for sim in sims if sim.is_alive]
+
+        averages = {}
+        for need in ('mood', 'energy', 'hunger', 'hygiene', 'social', 'money'):
+            averages[need] = round(sum(getattr(sim, need) for sim in sims) / len(sims), 2) if sims else 0
+
+        return {
+            'seed': self.rng_service.seed,
+            'sims': len(sims),
+            'alive': len(alive),
+            'deaths': len(sims) - len(alive),
+            'actions': self.actions_performed,
+            'sim_hours': self.sim_hours,
+            'elapsed': elapsed,
+            'sim_hours_per_second': self.sim_hours / elapsed if elapsed > 0 else 0.0,
+            'scheduled_events': self.scheduler.processed,
+            'death_events': self.death_events,
+            'messages_applied': self.messages_applied,
+            'averages': averages,
+            'lod': self.lod.get_diagnostics() if self.lod is not None else None
+        }
+
+
+class PeerStub:
+    """Başka bölümde çalışan Sim'in ilişki kenarlarını tutan hafif vekil"""
+
+    __slots__ = ('name', 'relationships', 'game_time')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.relationships = {}
+        self.game_time = None
@@ -24,8 +24,8 @@ class Job(ABC):
         """Her meslek kendi becerilerini döndürür"""
         pass
     
-    def work(self) -> dict:
-        """Çalışma sonucu döndürür"""
+    def work(self, rng=None) -> dict:
+        """Çalışma sonucu döndürür (rng: Sim'in rastgele akışı)"""
         salary = self.calculate_salary()
         self.experience += self.experience_gain
         
@@ -40,6 +40,10 @@ class Job(ABC):
         """Seviyeye göre maaş hesaplar"""
         return int(self.base_salary * (1 + (self.level - 1) * 0.2))
     
+    def expected_salary(self) -> float:
+        """Bir iş gününün ortalama maaşı (planlama için)"""
+        return float(self.calculate_salary())
+    
     def can_promote(self) -> bool:
         """Terfi edilebilir mi kontrol eder"""
         return self.experience >= self.promotion_threshold * self.level
@@ -95,14 +99,18 @@ class HealthcareJob(Job):
     def get_skills(self) -> list:
         return ["Teşhis", "Tedavi", "Hasta Bakımı"]
     
-    def work(self) -> dict:
+    def work(self, rng=None) -> dict:
         """Doktorlar için özel çalışma bonusu"""
-        result = super().work()
+        result = super().work(rng)
         # Doktorlar bazen acil durum bonusu alabilir
-        if random.random() < 0.3:
+        if (rng or random).random() < 0.3:
             result['salary'] *= 1.5
             result['emergency_bonus'] = True
         return result
+    
+    def expected_salary(self) -> float:
+        """%30 ihtimalle 1.5 kat bonus"""
+        return self.calculate_salary() * (1 + 0.3 * 0.5)
 
 class EducationJob(Job):
     """Eğitim sektörü meslekleri"""
@@ -128,14 +136,18 @@ class CreativeJob(Job):
     def get_skills(self) -> list:
         return ["Yaratıcılık", "Tasarım", "Sergi Yönetimi"]
     
-    def work(self) -> dict:
+    def work(self, rng=None) -> dict:
         """Sanatçılar için değişken gelir"""
-        result = super().work()
+        result = super().work(rng)
         # Sanatçıların geliri daha değişken
-        multiplier = random.uniform(0.5, 2.0)
+        multiplier = (rng or random).uniform(0.5, 2.0)
         result['salary'] = int(result['salary'] * multiplier)
         result['variable_income'] = True
         return result
+    
+    def expected_salary(self) -> float:
+        """Çarpan 0.5-2.0 arasında düzgün dağılır (ortalama 1.25)"""
+        return self.calculate_salary() * 1.25
 
 class JobFactory:
     """Job nesneleri oluşturmak için factory sınıfı"""
@@ -156,4 +168,16 @@ class JobFactory:
             job_class = job_map[job_name]
             return job_class() if callable(job_class) else job_class
         else:
-            return UnemployedJob() 
\ No newline at end of file
+            return UnemployedJob() 
+
+class JobChoice:
+    """İş menülerinin seçimi için Sim yerine geçen kayıt - Sim'i sadece host'a giden istek değiştirir"""
+    
+    def __init__(self, sim):
+        self.job_instance = sim.job_instance
+        self.job = sim.job
+    
+    def change_job(self, new_job_name: str):
+        """Seçilen mesleği kaydeder"""
+        self.job_instance = JobFactory.create_job(new_job_name)
+        self.job = self.job_instance.name
@@ -0,0 +1,227 @@
+import random
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from models.authority import HeadlessSimulation, apply_sim_state, get_sim_state
+from models.clock import parse_world_time
+from models.rng import RandomService
+
+# Eylem kayıtlarında isteğin ek parametresi bu alanlardan okunur
+RECORD_ARGUMENTS = ('amount', 'job')
+
+
+def player_rng(seed, player_name: str) -> random.Random:
+    """Oyuncuya özel, tüm eşlerde aynı sırayı üreten rastgele akış"""
+    return random.Random(f"{seed}:{player_name}")
+
+
+def encode_record(player_name: str, intent: dict) -> list:
+    """Eylem isteğini ağ için kompakt [oyuncu, eylem, parametre] kaydına çevirir"""
+    argument = None
+    for key in RECORD_ARGUMENTS:
+        if key in intent:
+            argument = intent[key]
+            break
+    return [player_name, intent.get('action'), argument]
+
+
+def decode_record(record: list):
+    """Kompakt kaydı (oyuncu, istek) çiftine geri çevirir"""
+    player_name, action, argument = record
+    intent = {'action': action}
+    if argument is not None:
+        intent['job' if action == 'change_job' else 'amount'] = argument
+    return player_name, intent
+
+
+class LockstepSession(HeadlessSimulation):
+    """Deterministik lockstep: her eş tüm Sim'leri aynı sıralı eylem kaydıyla kendisi hesaplar"""
+
+    def __init__(self, game, seed, start_time=None, turn_interval: float = 0.2):
+        super().__init__(game)
+        self.rng_service = None  # Eşler arasında sadece Sim.rng akışı paylaşılır (resync ile taşınır)
+        self.seed = seed
+        # NPC havuzu oturum seed'inden - tüm eşlerde aynı NPC'ler
+        self.actions.engine.rng_service = RandomService(seed)
+        self.turn_interval = turn_interval
+        self._world_time = start_time or game.game_time  # Tüm eşlerde aynı başlangıç
+
+        self.turn = 0  # Son uygulanan tur
+        self._pending = deque()  # Host: sıradaki tura girecek kayıtlar
+        self._future: Dict[int, list] = {}  # Sırası henüz gelmemiş turlar
+        self._turn_lock = threading.Lock()
+        self.running = False
+
+        # Diagnostik sayaçları
+        self.records_applied = 0
+        self.turns_sent = 0
+
+    @property
+    def game_time(self):
+        """Olaylar için deterministik dünya zamanı - ping ile kayan yerel saate bağlı değil"""
+        return self._world_time
+
+    def add_player(self, player_name: str, player_data: dict, sim=None):
+        """Oyuncunun kopyasını oluşturur ve seed'li akışını bağlar"""
+        sim = super().add_player(player_name, player_data)
+        sim.rng = player_rng(self.seed, player_name)
+        return sim
+
+    # Eylem kaydı
+
+    def submit(self, player_name: str, intent: dict):
+        """Oyuncunun isteğini sıraya alır (host) veya host'a iletir (istemci)"""
+        network = self.game.network
+        if network and not network.is_server:
+            return network.send_action_intent(player_name, intent)
+        with self._lock:
+            self._pending.append(encode_record(player_name, intent))
+        return True
+
+    def start(self):
+        """Host tarafında tur döngüsünü başlatır"""
+        if self.running:
+            return
+        self.running = True
+        turn_thread = threading.Thread(target=self._run)
+        turn_thread.daemon = True
+        turn_thread.start()
+
+    def stop(self):
+        """Tur döngüsünü durdurur"""
+        self.running = False
+
+    def _run(self):
+        """Sabit aralıklarla biriken kayıtları tur olarak yayınlar"""
+        while self.running:
+            started = time.monotonic()
+            try:
+                self.close_turn()
+            except Exception as e:
+                self.game.ui.console.print(f"[red]Lockstep hatası: {e}[/red]")
+            time.sleep(max(0.0, self.turn_interval - (time.monotonic() - started)))
+
+    def close_turn(self) -> Optional[int]:
+        """Host: bekleyen kayıtları sıradaki tur olarak yayınlar ve uygular"""
+        with self._lock:
+            if not self._pending:
+                return None  # Boş turlar gönderilmez
+            records = list(self._pending)
+            self._pending.clear()
+
+        turn = self.turn + 1
+        network = self.game.network
+        if network:
+            network._broadcast({
+                'type': 'lockstep_turn',
+                'turn': turn,
+                'actions': records
+            })
+        self.turns_sent += 1
+        self.receive_turn(turn, records)
+        return turn
+
+    def receive_turn(self, turn: int, records: list) -> List[str]:
+        """Gelen turu saklar ve sırası gelen tüm turları uygular"""
+        changed = set()
+        with self._turn_lock:
+            if turn > self.turn:
+                self._future[turn] = records
+            while self.turn + 1 in self._future:
+                self.turn += 1
+                changed.update(self._apply_turn(self._future.pop(self.turn)))
+
+        if changed:
+            self._refresh_players(changed)
+        return sorted(changed)
+
+    def _apply_turn(self, records: list) -> set:
+        """Bir turun kayıtlarını sırasıyla uygular - tüm eşlerde aynı sonucu üretir"""
+        changed = set()
+        for record in records:
+            player_name, intent = decode_record(record)
+            sim = self.sims.get(player_name)
+            if sim is None or not sim.is_alive:
+                continue
+            self._apply_intent(sim, intent)
+            self.events.check_for_events(sim)
+            self.records_applied += 1
+            changed.add(player_name)
+        return changed
+
+    def _advance_sim_time(self, sim, hours):
+        """Sim zamanını ilerletir, deterministik dünya zamanını da öne alır"""
+        base = sim.game_time or self._world_time
+        sim.game_time = base + timedelta(hours=hours)
+        if sim.game_time > self._world_time:
+            self._world_time = sim.game_time
+        if hasattr(self.game, 'apply_world_time'):
+            self.game.apply_world_time(sim.game_time)
+
+    def _refresh_players(self, names):
+        """Ekrandaki oyuncu listesini yerel hesaplanan durumlarla günceller"""
+        network = self.game.network
+        if not network:
+            return
+        states = {name: get_sim_state(self.sims[name]) for name in names}
+        with network.lock:
+            for player_name, state in states.items():
+                if player_name in network.players:
+                    network.players[player_name].update(state)
+
+    # Desync tespiti
+
+    def state_hashes(self):
+        """(tur, oyuncu -> hash) - tur uygulanırken okunmaz"""
+        with self._turn_lock:
+            return self.turn, {name: sim.state_hash for name, sim in self.sims.items()}
+
+    def get_resync_states(self, names):
+        """(tur, uyuşmayan oyuncuların tam durumu) - rastgele akış konumu dahil"""
+        states = {}
+        with self._turn_lock:
+            for player_name in names:
+                sim = self.sims.get(player_name)
+                if sim is None:
+                    continue
+                state = get_sim_state(sim)
+                state['rng_state'] = sim.rng.getstate() if sim.rng else None
+                states[player_name] = state
+            return self.turn, states
+
+    def apply_resync(self, turn: int, states: Dict[str, dict]) -> int:
+        """Host'un gönderdiği durumları kopyalara uygular - tur uyuşmuyorsa bekletir"""
+        with self._turn_lock:
+            if turn != self.turn:
+                return 0
+            for player_name, state in states.items():
+                sim = self.sims.get(player_name)
+                if sim is None:
+                    sim = self.add_player(player_name, state)
+                apply_sim_state(sim, state)
+                sim.is_alive = state.get('is_alive', sim.is_alive)
+                sim.death_reason = state.get('death_reason', sim.death_reason)
+                if state.get('game_time'):
+                    sim.game_time = parse_world_time(state['game_time'])
+                rng_state = state.get('rng_state')
+                if rng_state and sim.rng:
+                    # JSON listeleri random.setstate'in beklediği tuple'lara çevrilir
+                    sim.rng.setstate((rng_state[0], tuple(rng_state[1]), rng_state[2]))
+        self._refresh_players(states.keys())
+        return len(states)
+
+    def get_diagnostics(self) -> dict:
+        """Diagnostik ekranı için lockstep sayaçları"""
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            'seed': self.seed,
+            'turn': self.turn,
+            'turns_sent': self.turns_sent,
+            'records_applied': self.records_applied,
+            'pending_records': pending,
+            'buffered_turns': len(self._future)
+        }
@@ -0,0 +1,280 @@
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Set
+
+from models.action_engine import ACTION_TABLE, sample
+from models.activity import compile_activity
+from models.authority import ACTION_INTENTS
+from models.autopilot import ACTION_PROFILES, GAMBLE_EXPECTATIONS
+from models.headless import IDLE_HOURS, SOCIAL_INTERACTIONS, WAIT_ACTION
+from models.rng import LOD_STREAM, subsystem_rng
+
+# Ayrıntı seviyeleri
+TIER_FULL = 'full'  # Olay kuyruğunda eylem eylem, adım adım çalışır
+TIER_COARSE = 'coarse'  # Kuyrukta değildir, gözlendiğinde geçen süre örneklenmiş toplam etki ve kapalı formülle hesaplanır
+
+# Odaktaki Sim'lere kaç ilişki halkası uzaklıktakiler de tam ayrıntıda çalışır
+FOCUS_RADIUS = 1
+
+# Seviyelerin ilişkilere göre yeniden hesaplandığı aralık (oyun saati)
+REFRESH_HOURS = 24
+
+# Kaba ilerlemede eylemleri tek kapalı formül adımında toplanan en uzun süre (oyun saati)
+COARSE_SPAN_HOURS = 12
+
+
+class CoarseState:
+    """Kuyruktan çıkarılan Sim'in devam bilgisi"""
+
+    __slots__ = ('end_time', 'step', 'wake')
+
+    def __init__(self, end_time: datetime, step: int, wake: datetime):
+        self.end_time = end_time  # Sim'in çalışmasının bittiği an
+        self.step = step  # Senaryodaki sıradaki eylem
+        self.wake = wake  # İptal edilen sıranın zamanı - öncesi süren bekleme
+
+
+class LevelOfDetail:
+    """HeadlessEngine için ayrıntı seviyeleri: odaktaki Sim'ler kuyrukta tam, diğerleri gözlendiklerinde kaba ilerler"""
+
+    def __init__(self, engine, focus: Iterable[str] = (), radius: int = FOCUS_RADIUS,
+                 refresh_hours: float = REFRESH_HOURS, span_hours: float = COARSE_SPAN_HOURS):
+        self.engine = engine
+        self.focus: Set[str] = set(focus)
+        self.radius = radius
+        self.refresh_hours = refresh_hours
+        self.span_hours = span_hours
+        self._coarse: Dict[str, CoarseState] = {}
+        engine.lod = self
+
+        # Diagnostik sayaçları
+        self.promotions = 0
+        self.demotions = 0
+        self.coarse_actions = 0
+
+    def tier(self, name: str) -> str:
+        return TIER_COARSE if name in self._coarse else TIER_FULL
+
+    def full_names(self) -> Set[str]:
+        """Tam ayrıntıda çalışması gereken Sim'ler: odak ve ilişki halkaları"""
+        sims = self.engine.sims
+        graph = self.engine.relationship_graph
+        full = {name for name in self.focus if name in sims}
+        frontier = set(full)
+        for _ in range(self.radius):
+            frontier = {other for name in frontier for other, _ in graph.neighbors(name)
+                        if other in sims and other not in full}
+            full |= frontier
+        return full
+
+    # Seviye geçişleri
+
+    def set_focus(self, names: Iterable[str]):
+        """Odaktaki Sim'leri değiştirir ve seviyeleri hemen günceller"""
+        self.focus = set(names)
+        self.refresh()
+
+    def refresh(self):
+        """Seviyeleri odağa göre günceller - kuyruk saatinde gözlenen Sim'ler yükselir, diğerleri düşer"""
+        full = self.full_names()
+        for name, sim in self.engine.sims.items():
+            if name in full:
+                if name in self._coarse:
+                    self.promote(sim)
+            elif name not in self._coarse:
+                self.demote(sim)
+
+    def start(self):
+        """Motor başladıktan sonra ilk seviyeleri kurar ve düzenli yenilemeyi zamanlar"""
+        self.refresh()
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        scheduler = self.engine.scheduler
+        end = max((state.end_time for state in self._coarse.values()), default=None)
+        for sim in self.engine.sims.values():
+            event = scheduler.get((sim, 'turn'))
+            if event is not None and (end is None or event.args[1] > end):
+                end = event.args[1]
+        at = scheduler.now + timedelta(hours=self.refresh_hours)
+        if end is not None and at < end:
+            scheduler.schedule(at, self._on_refresh, key=(self, 'refresh'))
+
+    def _on_refresh(self):
+        self.refresh()
+        self._schedule_refresh()
+
+    def demote(self, sim):
+        """Sim'i kuyruktan çıkarır - sırası ve ölüm anı iptal edilir, durumu olduğu gibi kalır"""
+        scheduler = self.engine.scheduler
+        turn = scheduler.get((sim, 'turn'))
+        if turn is None:
+            return  # Çalışması bitmiş veya ölmüş - tutulacak bir şey yok
+        _, end_time, step = turn.args
+        scheduler.cancel(turn)
+        scheduler.cancel_key((sim, 'death'))
+        self._coarse[sim.name] = CoarseState(end_time, step, turn.time)
+        self.demotions += 1
+
+    def promote(self, sim):
+        """Sim'i kuyruk saatine kadar kaba ilerletip kaldığı yerden kuyruğa geri koyar"""
+        scheduler = self.engine.scheduler
+        self.observe(sim.name)
+        state = self._coarse.pop(sim.name)
+        if sim.is_alive and sim.game_time < state.end_time:
+            at = max(sim.game_time, scheduler.now)
+            scheduler.schedule(at, self.engine._take_turn, sim, state.end_time, state.step, key=(sim, 'turn'))
+        self.promotions += 1
+
+    # Kaba ilerleme
+
+    def observe(self, name: str, until: Optional[datetime] = None):
+        """Sim'i döndürür - kaba seviyedeyse önce verilen ana (yoksa kuyruk saatine) kadar ilerletilir"""
+        sim = self.engine.sims[name]
+        state = self._coarse.get(name)
+        if state is not None:
+            self._advance(sim, state, until or self.engine.scheduler.now)
+        return sim
+
+    def settle(self):
+        """Kaba seviyedeki tüm Sim'leri çalışmalarının sonuna kadar ilerletir (rapordan önce)"""
+        for name, state in self._coarse.items():
+            self._advance(self.engine.sims[name], state, state.end_time)
+
+    def _advance(self, sim, state: CoarseState, until: datetime):
+        """Kaba ilerleme: son gözlemden beri geçen süre dilim dilim - eylem sonuçları örneklenip toplanır, azalma kapalı formülle"""
+        engine = self.engine
+        until = min(until, state.end_time)
+        if sim.is_alive and sim.game_time < state.wake:
+            # Düşürülmeden önce başlamış bekleme - saatleri zaten sayıldı
+            engine.idle(sim, (min(state.wake, until) - sim.game_time).total_seconds() / 3600)
+        if not sim.is_alive or sim.game_time >= until:
+            return
+
+        if engine.autopilot is not None:
+            # Otomatik pilot her seçimde Sim'in o anki durumuna bakar - eylem eylem, ara adımsız ilerlenir
+            while sim.is_alive and sim.game_time < until:
+                intent = engine._next_intent(sim, state.step)
+                state.step += 1
+                engine.sim_hours += self._coarse_action(sim, intent)
+                engine.actions_performed += 1
+                self.coarse_actions += 1
+            return
+
+        # Senaryo ve rastgele politika durumdan bağımsızdır - geçen süre en fazla span_hours'lik dilimlerle
+        rng = subsystem_rng(engine.rng_service, sim, LOD_STREAM) or random
+        while sim.is_alive and sim.game_time < until:
+            span = min(self.span_hours, (until - sim.game_time).total_seconds() / 3600)
+            self._advance_span(sim, state, span, rng)
+
+    def _advance_span(self, sim, state: CoarseState, span: float, rng):
+        """Dilimi dolduran eylemler sırayla çekilir, sonuçları Sim'e tek tek uygulanmadan toplanıp azalmayla birlikte uygulanır"""
+        engine = self.engine
+        totals = defaultdict(float)
+        money = hours = 0.0
+        while hours < span:
+            intent = engine._next_intent(sim, state.step)
+            state.step += 1
+            spent, earned = self._sample_outcome(sim, intent, rng, totals, sim.money + money)
+            hours += spent
+            money += earned
+            engine.actions_performed += 1
+            self.coarse_actions += 1
+
+        if money:
+            sim.money = round(sim.money + money, 2)
+        # Toplam etki dilimin başında, azalma ve ölüm dilim boyunca kapalı formülle (Sim.fast_forward)
+        for need, total in totals.items():
+            setattr(sim, need, round(max(0, min(100, getattr(sim, need) + total)), 2))
+        started = sim.game_time
+        engine.idle(sim, hours)
+        # Ölen Sim'in saatleri ölüm anında biter
+        engine.sim_hours += (sim.game_time - started).total_seconds() / 3600
+
+    def _sample_outcome(self, sim, intent: dict, rng, totals: Dict[str, float], money: float) -> tuple:
+        """Eylemin örneklenmiş sonucu: (saat, para değişimi) - ihtiyaç etkileri totals'a eklenir, Sim değişmez"""
+        engine = self.engine
+        action = intent.get('action')
+        if action == WAIT_ACTION:
+            return intent.get('amount', IDLE_HOURS), 0.0
+
+        if action in ACTION_TABLE:
+            # Tablo eylemi: anlık etki + aktivite ilerlemesinin toplamı (flörtün NPC ilişkisi kurulmaz)
+            spec = ACTION_TABLE[action]
+            hours = sample(rng, spec['duration'])
+            cost = sample(rng, spec['cost']) if 'cost' in spec else 0
+            effects = {attr: sample(rng, value) for attr, value in spec['effects'].items()}
+            for attr, value in effects.items():
+                # Anlık etki update_needs'ten geçer - Dengeli azaltması burada da uygulanır
+                if value < 0 and attr in getattr(sim, 'DAMPENED_NEEDS', ()):
+                    value *= sim.NEGATIVE_SCALE
+                totals[attr] += value
+            earned = -cost
+        elif action == 'go_to_work':
+            # İşsiz veya yorgun Sim çalışamaz (Sim.work_at_job)
+            energy_cost = sim.job_instance.energy_cost
+            if sim.job == "İşsiz" or sim.energy + totals['energy'] < energy_cost:
+                return IDLE_HOURS, 0.0
+            # Beklenen maaş; enerji maliyeti eylem başında ve aktivite süresince
+            hours = rng.randint(4, 8)
+            totals['energy'] -= energy_cost
+            effects = dict(ACTION_PROFILES[action]['effects'], energy=-energy_cost)
+            earned = sim.job_instance.expected_salary()
+        elif action in GAMBLE_EXPECTATIONS:
+            stake = float(intent.get('amount', 0))
+            if stake <= 0 or stake > money:
+                return IDLE_HOURS, 0.0
+            # Kumar yatırılan birim başına beklenen kâr ve ruh hali etkisiyle
+            profit, mood = GAMBLE_EXPECTATIONS[action]
+            totals['mood'] += mood
+            return ACTION_PROFILES[action]['duration'], stake * profit
+        else:
+            # Diğer istekler (iş değişikliği) Sim üzerinde çözülür
+            engine._resolve_intent(sim, intent)
+            return IDLE_HOURS, 0.0
+
+        steps, _ = engine.ui.get_progress_plan(hours)
+        plan = compile_activity({'effects': effects}, steps)
+        for attr, total in zip(plan.fields, plan.sums):
+            totals[attr] += total
+        if engine.social_peers and action in SOCIAL_INTERACTIONS:
+            engine._post_interaction(sim, action)
+        return hours, earned
+
+    def _coarse_action(self, sim, intent: dict) -> float:
+        """Eylemi ara adımsız uygular - geçen oyun saatini döndürür"""
+        engine = self.engine
+        action = intent.get('action')
+        if action == WAIT_ACTION:
+            hours = intent.get('amount', IDLE_HOURS)
+            engine.idle(sim, hours)
+            return hours
+
+        result = engine._resolve_intent(sim, intent)
+        hours = result.get('duration', 0) if isinstance(result, dict) else 0
+        if hours <= 0:
+            # Yapılamayan eylem - tam ayrıntıdaki gibi bir saat boşta
+            engine.idle(sim, IDLE_HOURS)
+            return IDLE_HOURS
+
+        if action in ACTION_INTENTS and 'effects' in result:
+            # Aktivitenin adımları atlanır, toplam etkisi tek seferde eklenir
+            steps, _ = engine.ui.get_progress_plan(hours)
+            compile_activity(result, steps).apply_total(sim)
+        if engine.social_peers and action in SOCIAL_INTERACTIONS:
+            engine._post_interaction(sim, action)
+        engine._advance_sim_time(sim, hours)
+        if engine.decay:
+            sim.advance_time(hours)
+        return hours
+
+    def get_diagnostics(self) -> dict:
+        """Seviye sayaçları"""
+        return {
+            'full': len(self.engine.sims) - len(self._coarse),
+            'coarse': len(self._coarse),
+            'promotions': self.promotions,
+            'demotions': self.demotions,
+            'coarse_actions': self.coarse_actions
+        }
@@ -0,0 +1,66 @@
+import gc
+import tracemalloc
+from typing import Callable
+
+from models.character_types import CharacterFactory
+
+
+class LegacySimLayout:
+    """__slots__ öncesi Sim düzeni: alanlar __dict__'te, eşik ve ilişki tabloları Sim başına kopya (ölçüm için)"""
+
+    def __init__(self, sim):
+        # Aynı alan değerleri - eşik etkileri eskisi gibi Sim'e bağlı lambda'lardır
+        for cls in type(sim).__mro__:
+            for field in getattr(cls, '__slots__', ()):
+                if field.startswith('_status') or not hasattr(sim, field):
+                    continue
+                setattr(self, field, getattr(sim, field))
+        self.relationship_levels = dict(sim.relationship_levels)
+        self.death_thresholds = dict(sim.death_thresholds)
+        self.critical_thresholds = {
+            attr: {
+                'warning': thresholds['warning'],
+                'critical': thresholds['critical'],
+                'effects': {
+                    level: (lambda attr=attr, level=level: self._handle_critical_state(attr, level))
+                    for level in thresholds['effects']
+                }
+            }
+            for attr, thresholds in sim.critical_thresholds.items()
+        }
+
+    def _handle_critical_state(self, attribute, level):
+        """Ölçümde çağrılmaz - lambda'ların bağlandığı yöntem"""
+
+
+def measure(build: Callable[[int], object], count: int) -> float:
+    """build(i) ile kurulan count nesnenin tuttuğu bellek (byte/nesne) - geçici nesneler sayılmaz"""
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    objects = [build(i) for i in range(count)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (current - baseline) / len(objects) if objects else 0.0
+
+
+def sim_layouts(count: int) -> dict:
+    """Eski düzen, güncel Sim ve durum önbelleği kurulmuş Sim için Sim başına byte"""
+    character_types = CharacterFactory.get_available_types()
+
+    def create(i):
+        return CharacterFactory.create_character(character_types[i % len(character_types)], f"Sim{i + 1}", "Erkek", 25)
+
+    def displayed(i):
+        sim = create(i)
+        sim.get_status()  # Arayüzde gösterilen Sim'in durum önbelleği
+        return sim
+
+    # Modül ve sınıf düzeyindeki tabloların ilk yüklemesi ölçüme girmesin
+    LegacySimLayout(displayed(0))
+    return {
+        'legacy': measure(lambda i: LegacySimLayout(create(i)), count),
+        'current': measure(create, count),
+        'displayed': measure(displayed, count)
+    }
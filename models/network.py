@@ -7,10 +7,17 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from rich.console import Console
 from rich.panel import Panel
+from models.recorder import SessionRecorder, RECORD_INBOUND, RECORD_OUTBOUND
+from models.clock import ClockSync, format_world_time, parse_world_time
+from models.prediction import NeedsPredictor
+from models.statehash import state_hash_of, roster_hash, diverging_players
 
 # Sunucu kilit dosyası
 SERVER_LOCK_FILE = "server.lock"
 
+# Mesaj ayracı - TCP akışında birleşen mesajları ayırmak için
+MESSAGE_DELIMITER = b"\n"
+
 class SimpleNetwork:
     def __init__(self, game, is_server: bool = False, host: str = "localhost", port: int = 5000):
         self.game = game
@@ -28,9 +35,38 @@ class SimpleNetwork:
         # Player data - BASİT!
         self.players: Dict[str, Dict] = {}  # player_name -> player_data
         self.my_player_name = ""
+        self.predictors: Dict[str, NeedsPredictor] = {}  # player_name -> ihtiyaç tahmini
         
         # Threading
         self.lock = threading.Lock()
+        
+        # Saat senkronizasyonu - ping kanalı üzerinden host saati tahmini
+        self.clock_sync = ClockSync()
+        self.ping_interval = 2.0  # Saniye
+        
+        # Trafik istatistikleri (diagnostik ekranı için)
+        self.stats = {
+            'packets_sent': 0,
+            'packets_received': 0,
+            'bytes_sent': 0,
+            'bytes_received': 0
+        }
+        
+        # Desync tespiti - host düşük sıklıkla durum hash'lerini yayınlar
+        self.hash_interval = 10.0  # Saniye
+        self.desync_stats = {
+            'hash_checks': 0,
+            'hash_checks_skipped': 0,
+            'desyncs': 0,
+            'resync_requests': 0,
+            'players_resynced': 0
+        }
+        
+        # Oturum kaydı (performans regresyonlarını yeniden üretmek için)
+        self.recorder: Optional[SessionRecorder] = None
+        record_path = getattr(game, 'record_path', None)
+        if record_path:
+            self.start_recording(record_path)
     
     @classmethod
     def is_server_active(cls) -> bool:
@@ -74,6 +110,11 @@ class SimpleNetwork:
             server_thread.daemon = True
             server_thread.start()
             
+            # Durum hash'i yayın thread'i (desync tespiti)
+            hash_thread = threading.Thread(target=self._run_hash_broadcaster)
+            hash_thread.daemon = True
+            hash_thread.start()
+            
             self.console.print(f"[green]✅ Sunucu başlatıldı: {self.host}:{self.port}[/green]")
             return True
             
@@ -97,6 +138,11 @@ class SimpleNetwork:
             client_thread.daemon = True
             client_thread.start()
             
+            # Ping thread başlat (saat senkronizasyonu)
+            ping_thread = threading.Thread(target=self._run_pinger)
+            ping_thread.daemon = True
+            ping_thread.start()
+            
             self.console.print("[green]✅ Sunucuya bağlanıldı![/green]")
             return True
             
@@ -129,8 +175,16 @@ class SimpleNetwork:
                     self.console.print(f"[red]Server hatası: {e}[/red]")
                 break
     
+    def _split_messages(self, buffer: bytes, data: bytes):
+        """Satır sonu ile ayrılmış mesajları ayırır, (mesajlar, kalan tampon) döndürür"""
+        buffer += data
+        *lines, buffer = buffer.split(MESSAGE_DELIMITER)
+        messages = [json.loads(line.decode()) for line in lines if line.strip()]
+        return messages, buffer
+    
     def _handle_client(self, client_socket: socket.socket, connection_id: str):
         """Client mesajlarını işler"""
+        buffer = b""
         try:
             while self.running:
                 try:
@@ -138,12 +192,19 @@ class SimpleNetwork:
                     data = client_socket.recv(4096)
                     if not data:
                         break
-                        
-                    message = json.loads(data.decode())
-                    message['connection_id'] = connection_id
                     
-                    # Mesajı işle
-                    self._process_server_message(message, client_socket)
+                    self.stats['packets_received'] += 1
+                    self.stats['bytes_received'] += len(data)
+                        
+                    messages, buffer = self._split_messages(buffer, data)
+                    for message in messages:
+                        message['connection_id'] = connection_id
+                        
+                        if self.recorder:
+                            self.recorder.record(RECORD_INBOUND, message)
+                        
+                        # Mesajı işle
+                        self._process_server_message(message, client_socket)
                     
                 except socket.timeout:
                     continue
@@ -158,15 +219,22 @@ class SimpleNetwork:
     
     def _run_client(self):
         """Client ana döngüsü"""
+        buffer = b""
         try:
             while self.running:
                 try:
                     data = self.client_socket.recv(4096)
                     if not data:
                         break
+                    
+                    self.stats['packets_received'] += 1
+                    self.stats['bytes_received'] += len(data)
                         
-                    message = json.loads(data.decode())
-                    self._process_client_message(message)
+                    messages, buffer = self._split_messages(buffer, data)
+                    for message in messages:
+                        if self.recorder:
+                            self.recorder.record(RECORD_INBOUND, message)
+                        self._process_client_message(message)
                         
                 except socket.timeout:
                     continue
@@ -179,6 +247,19 @@ class SimpleNetwork:
         finally:
             self.running = False
     
+    def _run_pinger(self):
+        """Host saatini ölçmek için düzenli ping gönderir"""
+        while self.running:
+            self.send_ping()
+            time.sleep(self.ping_interval)
+    
+    def _run_hash_broadcaster(self):
+        """Host durum hash'lerini düzenli aralıklarla yayınlar"""
+        while self.running:
+            time.sleep(self.hash_interval)
+            if self.running:
+                self.broadcast_state_hashes()
+    
     def _process_server_message(self, message: dict, sender_socket: socket.socket):
         """Server tarafında mesaj işleme"""
         msg_type = message.get('type')
@@ -189,6 +270,12 @@ class SimpleNetwork:
             
             with self.lock:
                 self.players[player_name] = player_data
+                self._update_prediction(player_name)
+            
+            # Otoriter modda oyuncunun Sim'i host'ta oluşturulur
+            authority = getattr(self.game, 'authority', None)
+            if authority:
+                authority.add_player(player_name, player_data)
             
             # Tüm oyunculara yeni oyuncuyu bildir
             broadcast_msg = {
@@ -210,6 +297,45 @@ class SimpleNetwork:
         elif msg_type == 'chat_message':
             # Chat mesajını broadcast et
             self._broadcast(message)
+        
+        elif msg_type == 'action_intent':
+            # Otoriter/lockstep mod: istemci sadece eylem isteği gönderir
+            authority = getattr(self.game, 'authority', None)
+            lockstep = getattr(self.game, 'lockstep_session', None)
+            if authority and message.get('player_name'):
+                authority.submit_intent(message['player_name'], message)
+            elif lockstep and message.get('player_name'):
+                lockstep.submit(message['player_name'], message)
+        
+        elif msg_type == 'resync_request':
+            # Sadece hash'i uyuşmayan oyuncuların tam durumu gönderilir
+            turn, states = self.get_resync_states(message.get('players', []))
+            self._send_to_socket(sender_socket, {
+                'type': 'player_resync',
+                'turn': turn,
+                'states': states
+            })
+        
+        elif msg_type == 'ping':
+            # Dünya saatinin tek kaynağı host'un dünya saatidir - istemcinin zamanı onu değiştirmez.
+            # Host saati ve dünya zamanı aynı anda okunur
+            world_clock = getattr(self.game, 'world_clock', None)
+            if world_clock:
+                host_time, world_time = world_clock.read()
+                world_rate = world_clock.hours_per_second
+            else:
+                with self.game.time_lock:
+                    host_time = time.monotonic()
+                    world_time = self.game.game_time
+                world_rate = 0.0
+            pong_msg = {
+                'type': 'pong',
+                't0': message.get('t0'),
+                'host_time': host_time,
+                'world_time': format_world_time(world_time),
+                'world_rate': world_rate
+            }
+            self._send_to_socket(sender_socket, pong_msg)
             
         elif msg_type == 'player_update':
             # Oyuncu durumu güncelleme
@@ -219,6 +345,7 @@ class SimpleNetwork:
             with self.lock:
                 if player_name in self.players:
                     self.players[player_name].update(update_data)
+                    self._update_prediction(player_name)
                 
             # Diğer oyunculara ilet
             self._broadcast(message, exclude=sender_socket)
@@ -261,6 +388,7 @@ class SimpleNetwork:
             
             with self.lock:
                 self.players[player_name] = player_data
+                self._update_prediction(player_name)
             
             self.console.print(f"[green]🎮 Yeni oyuncu: {player_name}[/green]")
             
@@ -268,6 +396,8 @@ class SimpleNetwork:
             # Tam oyuncu listesi
             with self.lock:
                 self.players = message['players']
+                for player_name in self.players:
+                    self._update_prediction(player_name)
             
             self.console.print(f"[cyan]📊 Oyuncu listesi güncellendi: {len(self.players)} oyuncu[/cyan]")
             
@@ -279,6 +409,35 @@ class SimpleNetwork:
             with self.lock:
                 if player_name in self.players:
                     self.players[player_name].update(update_data)
+                    self._update_prediction(player_name)
+            
+        elif msg_type == 'sim_states':
+            # Otoriter mod: host'un hesapladığı Sim durumları
+            self.apply_sim_states(message.get('states', {}))
+            
+        elif msg_type == 'state_hash':
+            # Host'un hash'leriyle karşılaştır, uyuşmayanlar için resync iste
+            self.check_state_hashes(message)
+            
+        elif msg_type == 'player_resync':
+            self.apply_resync(message.get('turn'), message.get('states', {}))
+            
+        elif msg_type == 'lockstep_turn':
+            # Lockstep mod: sadece sıralı eylem kayıtları gelir, Sim'ler yerelde hesaplanır
+            lockstep = getattr(self.game, 'lockstep_session', None)
+            if lockstep:
+                lockstep.receive_turn(message.get('turn', 0), message.get('actions', []))
+            
+        elif msg_type == 'pong':
+            # Cristian algoritması: host saati + RTT/2
+            if message.get('t0') is not None:
+                world_time = parse_world_time(message['world_time']) if message.get('world_time') else None
+                self.clock_sync.add_sample(message['t0'], time.monotonic(), message['host_time'],
+                                           world_time, message.get('world_rate', 0.0))
+                
+                # Yerel oyun zamanı host dünya saatinin tahmininden türetilir - öndeki istemci geri çekilir
+                if hasattr(self.game, 'sync_world_time'):
+                    self.game.sync_world_time()
             
         elif msg_type == 'chat_message':
             player_name = message.get('player_name', 'Bilinmeyen')
@@ -291,10 +450,7 @@ class SimpleNetwork:
             start_message = message.get('message', 'Oyun başlıyor!')
             
             self.console.print(f"[bright_green]🎮 {start_message} (Host: {host_name})[/bright_green]")
-            
-            # Game nesnesine oyun başlatma sinyali gönder
-            if hasattr(self.game, '_handle_game_start'):
-                self.game._handle_game_start()
+            self._on_game_start(message)
             
         elif msg_type == 'player_disconnected':
             # Oyuncu ayrılma
@@ -320,6 +476,19 @@ class SimpleNetwork:
                 if player_name in self.players:
                     del self.players[player_name]
     
+    def _update_prediction(self, player_name: str):
+        """Oyuncunun son verisiyle ihtiyaç tahminini sıfırlar (lock altında çağrılır)"""
+        predictor = self.predictors.get(player_name)
+        if predictor is None:
+            predictor = NeedsPredictor()
+            self.predictors[player_name] = predictor
+        
+        # İstemcide mesaj yolculuğunun yarısı kadar geride kalınmıştır
+        received_at = time.monotonic()
+        if not self.is_server:
+            received_at -= self.clock_sync.rtt / 2
+        predictor.reset(self.players[player_name], received_at)
+    
     def _broadcast(self, message: dict, exclude: Optional[socket.socket] = None):
         """Tüm client'lara mesaj gönder"""
         if not self.is_server:
@@ -343,8 +512,14 @@ class SimpleNetwork:
     
     def _send_to_socket(self, sock: socket.socket, message: dict):
         """Socket'e mesaj gönder"""
-        data = json.dumps(message).encode()
-        sock.send(data)
+        data = json.dumps(message).encode() + MESSAGE_DELIMITER
+        sock.sendall(data)
+        
+        self.stats['packets_sent'] += 1
+        self.stats['bytes_sent'] += len(data)
+        
+        if self.recorder:
+            self.recorder.record(RECORD_OUTBOUND, message)
     
     def _disconnect_client(self, connection_id: str, client_socket: socket.socket):
         """Client bağlantısını kes"""
@@ -379,6 +554,22 @@ class SimpleNetwork:
     
     # PUBLIC API - Basit ve temiz!
     
+    def start_recording(self, path: str) -> bool:
+        """Gelen ve giden tüm mesajları kayıt dosyasına yazmaya başlar"""
+        try:
+            self.stop_recording()
+            self.recorder = SessionRecorder(path, 'server' if self.is_server else 'client')
+            return True
+        except Exception as e:
+            self.console.print(f"[red]Kayıt başlatılamadı: {e}[/red]")
+            return False
+    
+    def stop_recording(self):
+        """Oturum kaydını durdurur"""
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+    
     def join_game(self, player_name: str, player_data: dict):
         """Oyuna katıl"""
         self.my_player_name = player_name
@@ -430,6 +621,7 @@ class SimpleNetwork:
         with self.lock:
             if player_name in self.players:
                 self.players[player_name].update(player_data)
+                self._update_prediction(player_name)
         
         # Network güncelleme
         update_msg = {
@@ -446,6 +638,147 @@ class SimpleNetwork:
             except Exception:
                 pass
     
+    def send_ping(self):
+        """Host'a saat senkronizasyonu için ping gönderir"""
+        if self.is_server or not self.client_socket:
+            return
+        
+        ping_msg = {
+            'type': 'ping',
+            't0': time.monotonic()
+        }
+        try:
+            self._send_to_socket(self.client_socket, ping_msg)
+        except Exception:
+            pass
+    
+    def host_time(self) -> float:
+        """Host'un monotonic saatinin yerel tahmini"""
+        if self.is_server:
+            return time.monotonic()
+        return self.clock_sync.host_monotonic()
+    
+    def get_diagnostics(self) -> dict:
+        """Diagnostik ekranı için ağ bilgilerini toplar"""
+        with self.lock:
+            connected_clients = len(self.connected_clients) if self.is_server else len(self.players)
+        
+        return {
+            'stats': dict(self.stats),
+            'latency_info': self.clock_sync.get_latency_info(),
+            'connection_info': {
+                'is_server': self.is_server,
+                'is_connected': self.running,
+                'connected_clients': connected_clients
+            },
+            'queue_info': {},
+            'desync_info': dict(self.desync_stats)
+        }
+    
+    # Desync tespiti
+    
+    def _replicated_sims(self):
+        """Sim'leri yerelde çalıştıran simülasyon (lockstep veya otoriter host) varsa döndürür"""
+        session = getattr(self.game, 'lockstep_session', None)
+        if session:
+            return session
+        authority = getattr(self.game, 'authority', None)
+        if authority and self.is_server:
+            return authority
+        return None
+    
+    def get_state_hashes(self):
+        """(tur, oyuncu -> durum hash'i) - Sim nesneleri artımlı hash'i hazır tutar"""
+        session = self._replicated_sims()
+        if session:
+            return session.state_hashes()
+        with self.lock:
+            return None, {name: state_hash_of(data) for name, data in self.players.items()}
+    
+    def broadcast_state_hashes(self):
+        """Host: oyuncu ve lobi hash'lerini tüm istemcilere gönderir"""
+        if not self.is_server:
+            return
+        turn, hashes = self.get_state_hashes()
+        self._broadcast({
+            'type': 'state_hash',
+            'turn': turn,
+            'roster': roster_hash(hashes),
+            'players': hashes
+        })
+    
+    def check_state_hashes(self, message: dict) -> List[str]:
+        """İstemci: host hash'leriyle karşılaştırır, farklı oyuncular için resync ister"""
+        turn, hashes = self.get_state_hashes()
+        if message.get('turn') != turn:
+            # Lockstep'te farklı turlar karşılaştırılamaz
+            self.desync_stats['hash_checks_skipped'] += 1
+            return []
+        
+        self.desync_stats['hash_checks'] += 1
+        if roster_hash(hashes) == message.get('roster'):
+            return []
+        
+        diverging = diverging_players(hashes, message.get('players', {}))
+        if not diverging:
+            return []
+        
+        self.desync_stats['desyncs'] += 1
+        try:
+            self._send_to_socket(self.client_socket, {
+                'type': 'resync_request',
+                'players': diverging
+            })
+            self.desync_stats['resync_requests'] += 1
+        except Exception as e:
+            self.console.print(f"[red]Resync isteği gönderilemedi: {e}[/red]")
+        return diverging
+    
+    def get_resync_states(self, names):
+        """Host: istenen oyuncuların tam durumu"""
+        session = self._replicated_sims()
+        if session:
+            return session.get_resync_states(names)
+        with self.lock:
+            return None, {name: dict(self.players[name]) for name in names if name in self.players}
+    
+    def apply_resync(self, turn, states: Dict[str, dict]):
+        """İstemci: host'tan gelen tam durumları uygular"""
+        session = getattr(self.game, 'lockstep_session', None)
+        if session:
+            applied = session.apply_resync(turn, states)
+        else:
+            self.apply_sim_states(states)
+            applied = len(states)
+        self.desync_stats['players_resynced'] += applied
+    
+    def send_action_intent(self, player_name: str, intent: dict):
+        """Otoriter/lockstep modda host'a eylem isteği gönderir"""
+        intent_msg = {
+            'type': 'action_intent',
+            'player_name': player_name,
+            **intent
+        }
+        try:
+            self._send_to_socket(self.client_socket, intent_msg)
+            return True
+        except Exception as e:
+            self.console.print(f"[red]İstek gönderilemedi: {e}[/red]")
+            return False
+    
+    def apply_sim_states(self, states: Dict[str, dict]):
+        """Host'tan gelen Sim durumlarını oyuncu listesine ve kendi Sim'ine uygular"""
+        with self.lock:
+            for player_name, state in states.items():
+                if player_name in self.players:
+                    self.players[player_name].update(state)
+                    self._update_prediction(player_name)
+        
+        # Kendi durumumuz host'un hesapladığıdır
+        my_state = states.get(self.my_player_name)
+        if my_state and not self.is_server and hasattr(self.game, 'apply_authoritative_state'):
+            self.game.apply_authoritative_state(my_state)
+    
     def get_player_count(self) -> int:
         """Oyuncu sayısı"""
         with self.lock:
@@ -459,6 +792,16 @@ class SimpleNetwork:
                 for name, data in self.players.items()
             ]
     
+    def get_predicted_players(self) -> Dict[str, Dict]:
+        """Oyuncu verilerini tahmini güncel ihtiyaç değerleriyle döndürür"""
+        now = time.monotonic()
+        with self.lock:
+            predicted = {}
+            for name, data in self.players.items():
+                predictor = self.predictors.get(name)
+                predicted[name] = {**data, **predictor.predict(now)} if predictor else dict(data)
+            return predicted
+    
     def is_connected(self) -> bool:
         """Bağlantı durumu"""
         return self.running
@@ -496,12 +839,41 @@ class SimpleNetwork:
         
         with self.lock:
             self.players.clear()
+            self.predictors.clear()
+        
+        self.stop_recording()
             
         self.console.print("[yellow]Bağlantı kapatıldı![/yellow]")
     
+    def _on_game_start(self, message: dict):
+        """Game nesnesine oyun başlatma sinyali gönderir"""
+        if hasattr(self.game, '_handle_game_start'):
+            self.game._handle_game_start(message.get('mode'), message)
+    
     def __del__(self):
         if self.is_server:
             self._remove_server_lock() 
 
+
+class ReplayNetwork(SimpleNetwork):
+    """Kayıt oynatma ağı - socket açmaz, sunucu kilit dosyasına ve oyun arayüzüne dokunmaz"""
+    
+    def __init__(self, game, is_server: bool = False):
+        super().__init__(game, is_server=is_server)
+        self.console = Console(quiet=True)  # İşleyici çıktıları ölçümü bozmasın
+    
+    def _create_server_lock(self):
+        """Aynı makinede çalışan gerçek sunucunun kilidi korunur"""
+        return False
+    
+    def _remove_server_lock(self):
+        """Kilit dosyası oynatmaya ait değildir - silinmez"""
+        pass
+    
+    def _on_game_start(self, message: dict):
+        """Oyun modu uygulanır, başlangıç bildirimi ve bekleme ekranı atlanır"""
+        if hasattr(self.game, 'apply_game_mode'):
+            self.game.apply_game_mode(message.get('mode'), message)
+
 # Backward compatibility - eski Network sınıfını SimpleNetwork'e yönlendir
 Network = SimpleNetwork 
\ No newline at end of file
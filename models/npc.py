@@ -0,0 +1,162 @@
+from collections import OrderedDict
+from typing import Dict, List
+
+import numpy as np
+
+from models.character_types import CharacterFactory
+from models.relationships import RelationshipGraph
+from models.sim import Sim
+
+# Havuzdaki NPC sayısı ve aynı anda Sim nesnesi olarak tutulan en fazla NPC
+DEFAULT_POOL_SIZE = 5000
+MATERIALIZED_LIMIT = 64
+
+GENDERS = ("Erkek", "Kadın")
+FIRST_NAMES = {
+    "Erkek": ("Mehmet", "Ali", "Ahmet", "Mustafa", "Emre", "Burak", "Can", "Murat", "Kerem", "Oğuz"),
+    "Kadın": ("Ayşe", "Zeynep", "Fatma", "Elif", "Merve", "Selin", "Ebru", "Derya", "Gül", "İrem")
+}
+SURNAMES = ("Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Aydın", "Öztürk", "Arslan", "Doğan",
+            "Kılıç", "Koç", "Kurt", "Özdemir", "Polat")
+CHARACTER_TYPES = tuple(CharacterFactory.get_available_types())
+JOBS = ("İşsiz", "Yazılımcı", "Mühendis", "Doktor", "Öğretmen", "Sanatçı")
+
+# Sıkışık dizilerde tutulan ihtiyaçlar (float32) - para float64
+NEED_FIELDS = ('mood', 'energy', 'hunger', 'hygiene', 'social')
+
+# Rastgele üretilen değerlerin aralıkları (uçlar dahil)
+AGE_RANGE = (18, 60)
+NEED_RANGE = (40, 100)
+MONEY_RANGE = (200, 3000)
+
+
+class NPCPool:
+    """NPC'leri alan başına dizilerde tutan, etkileşimde Sim'e dönüştüren ve boştakileri geri sıkıştıran havuz"""
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, seed: int = 0, limit: int = MATERIALIZED_LIMIT,
+                 relationship_graph=None):
+        self.size = size
+        self.limit = limit
+        self.relationship_graph = relationship_graph if relationship_graph is not None else RelationshipGraph()
+
+        rng = np.random.default_rng(seed)
+        self.gender = rng.integers(0, len(GENDERS), size, dtype=np.int8)
+        self.age = rng.integers(AGE_RANGE[0], AGE_RANGE[1] + 1, size, dtype=np.int8)
+        self.character_type = rng.integers(0, len(CHARACTER_TYPES), size, dtype=np.int8)
+        self.job = rng.integers(0, len(JOBS), size, dtype=np.int8)
+        for field in NEED_FIELDS:
+            setattr(self, field, rng.integers(NEED_RANGE[0], NEED_RANGE[1] + 1, size).astype(np.float32))
+        self.money = rng.integers(MONEY_RANGE[0], MONEY_RANGE[1] + 1, size).astype(np.float64)
+
+        # Adlar: cinsiyete göre ad + soyad, tekrar edenlere sıra numarası eklenir
+        first = rng.integers(0, len(FIRST_NAMES["Erkek"]), size)
+        last = rng.integers(0, len(SURNAMES), size)
+        self.names: List[str] = []
+        self._index: Dict[str, int] = {}
+        for i in range(size):
+            base = f"{FIRST_NAMES[GENDERS[self.gender[i]]][first[i]]} {SURNAMES[last[i]]}"
+            name, copy = base, 1
+            while name in self._index:
+                copy += 1
+                name = f"{base} {copy}"
+            self.names.append(name)
+            self._index[name] = i
+
+        # Sim nesnesine dönüştürülmüş NPC'ler - en son etkileşilen sonda
+        self._materialized: 'OrderedDict[str, Sim]' = OrderedDict()
+
+        # Diagnostik sayaçları
+        self.hits = 0
+        self.materializations = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def pick(self, rng) -> str:
+        """Rastgele bir NPC'nin adı (rng: random.Random)"""
+        return self.names[rng.randrange(self.size)]
+
+    def is_materialized(self, name: str) -> bool:
+        return name in self._materialized
+
+    def get(self, name: str) -> Sim:
+        """NPC'nin Sim nesnesi - gerekirse dizilerden oluşturulur, sınır aşılırsa en eski boştaki sıkıştırılır"""
+        sim = self._materialized.get(name)
+        if sim is not None:
+            self._materialized.move_to_end(name)
+            self.hits += 1
+            return sim
+
+        sim = self._materialize(self._index[name])
+        self._materialized[name] = sim
+        while len(self._materialized) > self.limit:
+            self.evict(next(iter(self._materialized)))
+        return sim
+
+    def _materialize(self, i: int) -> Sim:
+        """Dizilerdeki kaydı tam Sim'e çevirir ve ilişki kenarlarını graftan yeniden bağlar"""
+        name = self.names[i]
+        sim = CharacterFactory.create_character(CHARACTER_TYPES[self.character_type[i]], name,
+                                                GENDERS[self.gender[i]], int(self.age[i]))
+        if JOBS[self.job[i]] != "İşsiz":
+            sim.change_job(JOBS[self.job[i]])
+        for field in NEED_FIELDS:
+            setattr(sim, field, round(float(getattr(self, field)[i]), 2))
+        sim.money = float(self.money[i])
+
+        for other_name, edge in self.relationship_graph.neighbors(name):
+            sim.relationships[other_name] = edge
+        self.relationship_graph.attach(sim)
+        self.materializations += 1
+        return sim
+
+    def evict(self, name: str):
+        """Sim nesnesini bırakır, değişen alanları dizilere geri yazar - kenarlar grafta kalır"""
+        sim = self._materialized.pop(name, None)
+        if sim is None:
+            return
+        self.relationship_graph.detach(name)
+        i = self._index[name]
+        for field in NEED_FIELDS:
+            getattr(self, field)[i] = getattr(sim, field)
+        self.money[i] = sim.money
+        self.job[i] = JOBS.index(sim.job) if sim.job in JOBS else 0
+        self.evictions += 1
+
+    def evict_all(self):
+        """Tüm NPC'leri sıkışık hale döndürür"""
+        for name in list(self._materialized):
+            self.evict(name)
+
+    def record(self, name: str) -> Dict:
+        """NPC'nin Sim oluşturmadan okunan kaydı"""
+        sim = self._materialized.get(name)
+        if sim is not None:
+            return {'name': name, 'gender': sim.gender, 'age': sim.age, 'character_type': sim.character_type,
+                    'job': sim.job, **{field: getattr(sim, field) for field in NEED_FIELDS + ('money',)}}
+        i = self._index[name]
+        return {
+            'name': name,
+            'gender': GENDERS[self.gender[i]],
+            'age': int(self.age[i]),
+            'character_type': CHARACTER_TYPES[self.character_type[i]],
+            'job': JOBS[self.job[i]],
+            **{field: round(float(getattr(self, field)[i]), 2) for field in NEED_FIELDS},
+            'money': float(self.money[i])
+        }
+
+    def get_diagnostics(self) -> dict:
+        """Havuz sayaçları"""
+        return {
+            'npcs': self.size,
+            'materialized': len(self._materialized),
+            'hits': self.hits,
+            'materializations': self.materializations,
+            'evictions': self.evictions,
+            'array_bytes': sum(getattr(self, field).nbytes for field in
+                               ('gender', 'age', 'character_type', 'job', 'money') + NEED_FIELDS)
+        }
@@ -0,0 +1,148 @@
+import math
+import multiprocessing
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from models.autopilot import Autopilot
+from models.headless import DEFAULT_START_TIME, HeadlessEngine
+from models.rng import RandomService
+
+# Bölümler arası ilişki mesajlarının değiş tokuş edildiği aralık (oyun saati)
+DEFAULT_BARRIER_HOURS = 24
+
+# Rapordaki ortalaması alınan ihtiyaçlar
+AVERAGED_FIELDS = ('mood', 'energy', 'hunger', 'hygiene', 'social', 'money')
+
+
+def sim_name(index: int) -> str:
+    """Nüfustaki sıranın Sim adı (HeadlessEngine.populate ile aynı)"""
+    return f"Sim{index + 1}"
+
+
+def partition_of(name: str, workers: int) -> int:
+    """Sim'in hangi bölümde çalıştığı - sıralar bölümlere sırayla dağıtılır"""
+    return (int(name[3:]) - 1) % workers
+
+
+def _worker(conn, indices: List[int], count: int, days: float, script, seed: int, start_time, autopilot=False):
+    """Tek bir bölümün Sim'lerini çalıştıran süreç - ana süreçten gelen komutlarla ilerler"""
+    engine = HeadlessEngine(script=script, seed=seed, start_time=start_time,
+                            autopilot=Autopilot() if autopilot else None)
+    engine.populate(len(indices), indices=indices)
+    engine.social_peers = [sim_name(i) for i in range(count)]
+    engine.start(days)
+    busy = 0.0  # Bariyerde beklenmeden geçen hesaplama süresi
+
+    while True:
+        command, payload = conn.recv()
+        started = time.perf_counter()
+        if command == 'advance':
+            until, inbox = payload
+            engine.deliver(inbox)
+            engine.advance(until)
+            busy += time.perf_counter() - started
+            conn.send(engine.take_outbox())
+        elif command == 'finish':
+            engine.deliver(payload)
+            engine.advance()
+            busy += time.perf_counter() - started
+            report = engine.get_report(busy)
+            report['averages'] = {
+                field: [getattr(sim, field) for sim in engine.sims.values()] for field in AVERAGED_FIELDS
+            }  # Birleştirmek için değerler - toplam bölüm sırasından bağımsız olsun diye fsum ile alınır
+            # Bölümler arası çiftler iki bölümde de tutulur - küçük adın sahibi sayar, NPC çiftlerini Sim'in bölümü
+            peers = set(engine.social_peers)
+            report['relationships'] = sum(
+                1 for name, other in engine.relationship_graph if (name if name in peers else other) in engine.sims
+            )
+            conn.send(report)
+            break
+    conn.close()
+
+
+def _route(outboxes: List[list], workers: int) -> List[list]:
+    """Mesajları taraflarından birini çalıştıran bölümlere dağıtır"""
+    inboxes = [[] for _ in range(workers)]
+    for outbox in outboxes:
+        for message in outbox:
+            _, name, peer, _ = message
+            if name == peer:
+                targets = range(workers)  # Ölüm bildirimi herkese
+            else:
+                targets = {partition_of(name, workers), partition_of(peer, workers)}
+            for target in targets:
+                inboxes[target].append(message)
+    return inboxes
+
+
+def merge_reports(reports: List[Dict], elapsed: float, seed: int, workers: int) -> Dict:
+    """Bölüm raporlarını tek rapora birleştirir"""
+    sims = sum(report['sims'] for report in reports)
+    sim_hours = sum(report['sim_hours'] for report in reports)
+    busy = sum(report['elapsed'] for report in reports)
+    return {
+        'seed': seed,
+        'workers': workers,
+        'sims': sims,
+        'alive': sum(report['alive'] for report in reports),
+        'deaths': sum(report['deaths'] for report in reports),
+        'actions': sum(report['actions'] for report in reports),
+        'sim_hours': sim_hours,
+        'elapsed': elapsed,
+        'worker_time': busy,
+        'sim_hours_per_second': sim_hours / elapsed if elapsed > 0 else 0.0,
+        'messages_applied': sum(report['messages_applied'] for report in reports),
+        'relationships': sum(report['relationships'] for report in reports),
+        'averages': {
+            field: round(math.fsum(value for report in reports for value in report['averages'][field]) / sims, 2)
+            if sims else 0
+            for field in AVERAGED_FIELDS
+        }
+    }
+
+
+def run_parallel(count: int, days: float, workers: int, script=None, seed: Optional[int] = None,
+                 barrier_hours: float = DEFAULT_BARRIER_HOURS, start_time=None, autopilot: bool = False) -> Dict:
+    """Sim'leri süreç bölümlerine dağıtıp bariyerlerle çalıştırır ve raporları birleştirir"""
+    seed = RandomService(seed).seed  # Tüm bölümler aynı seed'i kullanır
+    start_time = start_time or DEFAULT_START_TIME
+    workers = max(1, min(workers, count))
+
+    context = multiprocessing.get_context()
+    connections, processes = [], []
+    for worker in range(workers):
+        parent, child = context.Pipe()
+        process = context.Process(
+            target=_worker,
+            args=(child, list(range(worker, count, workers)), count, days, script, seed, start_time, autopilot),
+            daemon=True
+        )
+        process.start()
+        child.close()
+        connections.append(parent)
+        processes.append(process)
+
+    started = time.perf_counter()
+    try:
+        end_time = start_time + timedelta(days=days)
+        barrier = start_time
+        inboxes = [[] for _ in range(workers)]
+        while barrier < end_time:
+            barrier = min(barrier + timedelta(hours=barrier_hours), end_time)
+            for connection, inbox in zip(connections, inboxes):
+                connection.send(('advance', (barrier, inbox)))
+            # Bariyer: tüm bölümler bu ana gelmeden mesajlar dağıtılmaz
+            inboxes = _route([connection.recv() for connection in connections], workers)
+
+        for connection, inbox in zip(connections, inboxes):
+            connection.send(('finish', inbox))
+        reports = [connection.recv() for connection in connections]
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    elapsed = time.perf_counter() - started
+    return merge_reports(reports, elapsed, seed, workers)
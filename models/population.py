@@ -0,0 +1,282 @@
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from models.character_types import CharacterFactory
+from models.rng import POPULATION_STREAM
+from models.sim import Sim
+
+# İhtiyaçlar (0-100 arası) - sütun sırası sınıflandırma matrisinde de kullanılır
+NEEDS = ('mood', 'energy', 'hunger', 'hygiene', 'social')
+
+# Dizilerde tutulan tüm sayısal alanlar
+FIELDS = NEEDS + ('money', 'job_satisfaction')
+
+# Sim'in varsayılan başlangıç değerleri
+DEFAULTS = {
+    'mood': 70.0,
+    'energy': 100.0,
+    'hunger': 70.0,
+    'hygiene': 100.0,
+    'social': 50.0,
+    'money': 1000.0,
+    'job_satisfaction': 50.0
+}
+
+# Dengeli karakterlerde negatif etkisi azaltılan ihtiyaçlar ve çarpanı
+DAMPENED_NEEDS = ('energy', 'hunger', 'hygiene')
+BALANCED_NEGATIVE_SCALE = 0.8
+
+# NEEDS sırasıyla saatlik azalma ve Dengeli azaltmasının uygulandığı sütunlar (otomatik pilot ve tahminci tabloları)
+DECAY_PER_HOUR = np.array([Sim.NEEDS_DECAY_PER_HOUR.get(need, 0) for need in NEEDS], dtype=np.float64)
+DAMPENED_MASK = np.array([need in DAMPENED_NEEDS for need in NEEDS])
+
+# İhtiyaç durum kodları
+STATE_OK = 0
+STATE_WARNING = 1
+STATE_CRITICAL = 2
+
+
+class Population:
+    """İhtiyaçları Sim nesnelerinde değil alan başına bitişik NumPy dizilerinde tutan nüfus"""
+
+    def __init__(self, size: int, names: Optional[List[str]] = None):
+        self.size = size
+        self.names = names or [f"Sim{i + 1}" for i in range(size)]
+
+        for field in FIELDS:
+            setattr(self, field, np.full(size, DEFAULTS[field], dtype=np.float64))
+
+        self.employed = np.zeros(size, dtype=bool)
+        # Otomatik pilot için mesleğin beklenen maaşı ve enerji maliyeti
+        self.salary = np.zeros(size, dtype=np.float64)
+        self.work_energy = np.zeros(size, dtype=np.float64)
+        self.alive = np.ones(size, dtype=bool)
+        # Negatif ihtiyaç değişim çarpanı (Dengeli karakterler için 0.8)
+        self.negative_scale = np.ones(size, dtype=np.float64)
+        # İhtiyacın kaç oyun saatidir kritik seviyede olduğu (-1: kritik değil) ve ölümün nedeni olan ihtiyaç
+        self.critical_hours = np.full((size, len(NEEDS)), -1.0)
+        self.death_cause = np.full(size, -1, dtype=np.int8)
+
+        # Eşikler Sim'in sınıf düzeyindeki tablolarıyla aynı
+        self.warning_levels = np.array([Sim.critical_thresholds[n]['warning'] for n in NEEDS], dtype=np.float64)
+        self.critical_levels = np.array([Sim.critical_thresholds[n]['critical'] for n in NEEDS], dtype=np.float64)
+        self.death_hours = np.array([Sim.death_thresholds[n] for n in NEEDS], dtype=np.float64)
+        self.decay_per_hour = dict(Sim.NEEDS_DECAY_PER_HOUR)
+
+    @classmethod
+    def from_sims(cls, sims: List[Sim]) -> 'Population':
+        """Var olan Sim nesnelerinin değerlerini dizilere kopyalar"""
+        population = cls(len(sims), [sim.name for sim in sims])
+        for field in FIELDS:
+            getattr(population, field)[:] = [getattr(sim, field) for sim in sims]
+        population.employed[:] = [sim.job != "İşsiz" for sim in sims]
+        population.salary[:] = [sim.job_instance.expected_salary() for sim in sims]
+        population.work_energy[:] = [sim.job_instance.energy_cost for sim in sims]
+        population.alive[:] = [sim.is_alive for sim in sims]
+        population.negative_scale[:] = [
+            BALANCED_NEGATIVE_SCALE if getattr(sim, 'character_type', None) == "Dengeli" else 1.0
+            for sim in sims
+        ]
+        for i, sim in enumerate(sims):
+            now = sim.current_game_hours()
+            for attr, started in sim.critical_time_counters.items():
+                if now is not None and attr in NEEDS:
+                    population.critical_hours[i, NEEDS.index(attr)] = now - started
+        return population
+
+    @classmethod
+    def generate(cls, size: int, rng_service, jobs: Sequence[str],
+                 character_types: Optional[Sequence[str]] = None) -> 'Population':
+        """Karakter tipleri ve meslekleri seed'li akıştan rastgele dağıtılmış nüfus - Sim nesnesi sadece tip/meslek başına kurulur"""
+        character_types = character_types or CharacterFactory.get_available_types()
+        templates = []
+        for character_type in character_types:
+            for job in jobs:
+                sim = CharacterFactory.create_character(character_type, "", "Erkek", 25)
+                sim.change_job(job)
+                templates.append(sim)
+        template = cls.from_sims(templates)
+
+        rng = np.random.default_rng(rng_service.stream(POPULATION_STREAM).getrandbits(64))
+        rows = rng.integers(0, len(templates), size)
+        population = cls(size)
+        for field in FIELDS + ('employed', 'salary', 'work_energy', 'negative_scale'):
+            getattr(population, field)[:] = getattr(template, field)[rows]
+        return population
+
+    def write_back(self, sims: List[Sim]):
+        """Dizilerdeki değerleri aynı sıradaki Sim nesnelerine geri yazar - nüfusta ölenler Sim'de de ölür"""
+        for i, sim in enumerate(sims):
+            for field in FIELDS:
+                setattr(sim, field, float(getattr(self, field)[i]))
+            if sim.is_alive and not self.alive[i]:
+                sim._die(NEEDS[self.death_cause[i]])
+
+    # Vektörel güncellemeler
+
+    def update_needs(self, index=slice(None), **changes):
+        """Sim.update_needs'in vektörel karşılığı - değişimler skaler veya dizi olabilir"""
+        for need in NEEDS:
+            change = changes.get(need, 0)
+            if np.isscalar(change) and change == 0:
+                continue
+            change = np.asarray(change, dtype=np.float64)
+            if need in DAMPENED_NEEDS:
+                # Dengeli karakterlerde negatif değişim azaltılır
+                change = np.where(change < 0, change * self.negative_scale[index], change)
+
+            column = getattr(self, need)
+            values = column[index] + change
+            np.clip(values, 0, 100, out=values)
+            np.round(values, 2, out=values)
+            column[index] = values
+
+    def advance_time(self, hours=1, index=slice(None)):
+        """Sim.advance_time'ın vektörel karşılığı - saat başına ihtiyaç azalması"""
+        self.update_needs(index, **{need: rate * hours for need, rate in self.decay_per_hour.items()})
+
+    def apply_effects(self, index, effects: Dict[str, float]):
+        """Eylem etkilerini seçili Sim'lere uygular - para sınırlanmaz"""
+        self.update_needs(index, **{k: v for k, v in effects.items() if k in NEEDS})
+        if effects.get('money'):
+            self.money[index] = np.round(self.money[index] + effects['money'], 2)
+
+    def calculate_mood(self, index=slice(None)):
+        """Sim.calculate_mood'un vektörel karşılığı"""
+        total = (50
+                 + self.energy[index] * 0.2
+                 + self.hunger[index] * 0.2
+                 + self.hygiene[index] * 0.1
+                 + self.social[index] * 0.1
+                 + np.where(self.employed[index], self.job_satisfaction[index] * 0.1, 0))
+        self.mood[index] = np.round(np.clip(total, 0, 100), 2)
+        return self.mood[index]
+
+    def check_deaths(self, hours: float = 1) -> np.ndarray:
+        """Sim._check_death_conditions'ın vektörel karşılığı - kritik süresi dolan Sim'ler ölür, sıraları döner"""
+        values = np.stack([getattr(self, need) for need in NEEDS], axis=1)
+        critical = values <= self.critical_levels
+        # Kritik seviyeye yeni inen ihtiyacın sayacı 0'dan başlar, çıkanınki silinir
+        self.critical_hours = np.where(critical, np.where(self.critical_hours < 0, 0, self.critical_hours + hours), -1)
+
+        expired = self.critical_hours >= self.death_hours
+        dying = np.flatnonzero(self.alive & expired.any(axis=1))
+        if len(dying):
+            self.alive[dying] = False
+            self.death_cause[dying] = expired[dying].argmax(axis=1)  # Sim'deki gibi sıradaki ilk ihtiyaç
+        return dying
+
+    def classify(self) -> np.ndarray:
+        """(Sim sayısı x ihtiyaç) durum matrisi: STATE_OK / STATE_WARNING / STATE_CRITICAL"""
+        values = np.stack([getattr(self, need) for need in NEEDS], axis=1)
+        states = np.zeros(values.shape, dtype=np.int8)
+        states[values <= self.warning_levels] = STATE_WARNING
+        states[values <= self.critical_levels] = STATE_CRITICAL
+        return states
+
+    def simulate(self, hours: int, autopilot=None, rng=None) -> Dict:
+        """Tüm nüfusu saat saat ilerletir ve hız raporunu döndürür (autopilot: boştaki Sim'lere eylem seçer, rng: eylem aralıklarını örnekler)"""
+        busy = np.zeros(self.size)  # Sim'in süren eyleminin kalan saati
+        alive = np.flatnonzero(self.alive)
+        deaths = 0
+        started = time.perf_counter()
+        for _ in range(hours):
+            if autopilot is not None:
+                idle = alive[busy[alive] <= 0]
+                if len(idle):
+                    # Boştaki tüm Sim'ler tek puanlamayla karar verir
+                    _, durations = autopilot.step_population(self, idle, rng)
+                    busy[idle] = durations
+                busy -= 1
+            # Ölen Sim'lerin değerleri ölüm anındaki gibi kalır
+            self.advance_time(1, alive)
+            self.calculate_mood(alive)
+            dying = self.check_deaths()
+            if len(dying):
+                deaths += len(dying)
+                alive = np.flatnonzero(self.alive)
+        elapsed = time.perf_counter() - started
+
+        # Sınıflandırma sadece rapor için sonda bir kez yapılır
+        states = self.classify()[self.alive]
+        sim_hours = self.size * hours
+        return {
+            'sims': self.size,
+            'sim_hours': sim_hours,
+            'elapsed': elapsed,
+            'sim_hours_per_second': sim_hours / elapsed if elapsed > 0 else 0.0,
+            'alive': int(np.count_nonzero(self.alive)),
+            'deaths': deaths,
+            'warning': int(np.count_nonzero((states == STATE_WARNING).any(axis=1))),
+            'critical': int(np.count_nonzero((states == STATE_CRITICAL).any(axis=1))),
+            'averages': {field: round(float(getattr(self, field).mean()), 2) for field in FIELDS}
+        }
+
+    def view(self, index: int) -> 'SimView':
+        """Tek bir Sim'i nesne gibi okumak/yazmak için ince proxy"""
+        return SimView(self, index)
+
+
+def _field_property(field: str):
+    """SimView alanını nüfus dizisindeki hücreye bağlar"""
+    def getter(self):
+        return float(getattr(self._population, field)[self._index])
+
+    def setter(self, value):
+        getattr(self._population, field)[self._index] = value
+
+    return property(getter, setter)
+
+
+class SimView:
+    """Population içindeki tek bir Sim'e nesne arayüzü sağlar - veri kopyalanmaz"""
+
+    __slots__ = ('_population', '_index')
+
+    def __init__(self, population: Population, index: int):
+        self._population = population
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._population.names[self._index]
+
+    @property
+    def is_alive(self) -> bool:
+        return bool(self._population.alive[self._index])
+
+    @property
+    def employed(self) -> bool:
+        return bool(self._population.employed[self._index])
+
+    def update_needs(self, **changes):
+        """Sadece bu Sim'in ihtiyaçlarını günceller"""
+        self._population.update_needs(slice(self._index, self._index + 1), **changes)
+
+    def get_warning_attributes(self) -> List[str]:
+        """Uyarı seviyesindeki (kritik olmayan) ihtiyaçlar"""
+        values = [getattr(self, need) for need in NEEDS]
+        return [need for need, value, warning, critical in zip(
+            NEEDS, values, self._population.warning_levels, self._population.critical_levels)
+            if critical < value <= warning]
+
+    def get_critical_attributes(self) -> List[str]:
+        """Kritik seviyedeki ihtiyaçlar"""
+        return [need for need, critical in zip(NEEDS, self._population.critical_levels)
+                if getattr(self, need) <= critical]
+
+    def as_dict(self) -> Dict:
+        """Sim durumunu sözlük olarak döndürür"""
+        data = {field: getattr(self, field) for field in FIELDS}
+        data.update({'name': self.name, 'is_alive': self.is_alive})
+        return data
+
+    def __repr__(self):
+        return f"SimView({self.name!r}, mood={self.mood}, energy={self.energy}, hunger={self.hunger})"
+
+
+for _field in FIELDS:
+    setattr(SimView, _field, _field_property(_field))
+del _field
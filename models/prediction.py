@@ -0,0 +1,59 @@
+import time
+from typing import Dict, Optional
+
+# Tahmin edilen ihtiyaçlar (0-100 arası değerler)
+PREDICTED_NEEDS = ('mood', 'energy', 'hunger', 'hygiene', 'social')
+
+# Tahmin ile gerçek değer arasındaki izin verilen fark
+DEFAULT_TOLERANCE = 3.0
+
+
+class NeedsPredictor:
+    """Son güncellemeden uzak oyuncunun ihtiyaçlarını tahmin eder (dead reckoning)"""
+
+    def __init__(self):
+        self.values: Dict[str, float] = {}
+        self.rates: Dict[str, float] = {}  # Oyun saati başına değişim
+        self.activity_hours = 0.0  # Aktivitenin toplam süresi (oyun saati)
+        self.pace = 0.0  # Gerçek saniye başına oyun saati
+        self.received_at: Optional[float] = None
+
+    def reset(self, player_data: dict, received_at: Optional[float] = None):
+        """Yeni bir güncelleme geldiğinde tahmin modelini sıfırlar"""
+        for need in PREDICTED_NEEDS:
+            if need in player_data:
+                self.values[need] = float(player_data[need])
+
+        self.rates = dict(player_data.get('rates') or {})
+        self.activity_hours = float(player_data.get('activity_hours', 0) or 0)
+        self.pace = float(player_data.get('pace', 0) or 0)
+        self.received_at = time.monotonic() if received_at is None else received_at
+
+    def elapsed_hours(self, now: Optional[float] = None) -> float:
+        """Son güncellemeden bu yana aktivitede geçen oyun saati"""
+        if self.received_at is None or not self.rates or self.pace <= 0:
+            return 0.0
+        if now is None:
+            now = time.monotonic()
+        hours = max(0.0, now - self.received_at) * self.pace
+        # Aktivite bitince değerler sabit kalır
+        return min(hours, self.activity_hours)
+
+    def predict(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Şu anki tahmini ihtiyaç değerlerini döndürür"""
+        hours = self.elapsed_hours(now)
+        if hours <= 0:
+            return dict(self.values)
+
+        predicted = {}
+        for need, value in self.values.items():
+            rate = self.rates.get(need, 0)
+            predicted[need] = round(max(0, min(100, value + rate * hours)), 2)
+        return predicted
+
+    def drift(self, actual: dict, now: Optional[float] = None) -> float:
+        """Gerçek değerlerin tahminden en büyük sapması"""
+        predicted = self.predict(now)
+        if not predicted:
+            return float('inf')
+        return max(abs(float(actual.get(need, 0)) - predicted.get(need, 0)) for need in PREDICTED_NEEDS)
@@ -0,0 +1,169 @@
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Kayıt yönleri - log satırlarında tek harf olarak tutulur
+RECORD_INBOUND = "i"
+RECORD_OUTBOUND = "o"
+
+# Log formatı sürümü
+RECORD_FORMAT_VERSION = 1
+
+
+class SessionRecorder:
+    """SimpleNetwork trafiğini monoton zaman damgalarıyla append-only log'a yazar"""
+
+    def __init__(self, path: str, role: str):
+        self.path = path
+        self.role = role
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self.message_count = 0
+
+        # Satır tamponlu dosya - her mesaj hemen diske iner, çökme anında kayıp olmaz
+        self._file = open(path, 'a', encoding='utf-8', buffering=1)
+
+        # Her oturum bir başlık satırı ile başlar
+        header = {
+            'v': RECORD_FORMAT_VERSION,
+            'role': role,
+            'started': datetime.now().isoformat()
+        }
+        self._write(header)
+
+    def _write(self, entry):
+        """Tek bir log satırı yazar"""
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            if self._file:
+                self._file.write(line + "\n")
+
+    def record(self, direction: str, message: dict):
+        """Bir mesajı [zaman, yön, mesaj] formatında kaydeder"""
+        elapsed = round(time.monotonic() - self._start, 6)
+        self._write([elapsed, direction, message])
+        self.message_count += 1
+
+    def close(self):
+        """Log dosyasını kapatır"""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+def read_session(path: str) -> Tuple[Dict, List[Tuple[float, str, dict]]]:
+    """Kayıt dosyasını okur, (başlık, kayıtlar) döndürür"""
+    header: Dict = {}
+    records: List[Tuple[float, str, dict]] = []
+    offset = 0.0
+    last_time = 0.0
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+
+            if isinstance(entry, dict):
+                # Yeni oturum başlığı - zaman damgalarını önceki oturumun sonuna ekle
+                if not header:
+                    header = entry
+                offset = last_time
+                continue
+
+            elapsed, direction, message = entry
+            last_time = offset + elapsed
+            records.append((last_time, direction, message))
+
+    return header, records
+
+
+class _ReplaySocket:
+    """Tekrar oynatma sırasında gönderilen veriyi sayan sahte bağlantı"""
+
+    def __init__(self, connection_id: str):
+        self.connection_id = connection_id
+        self.bytes_sent = 0
+        self.packets_sent = 0
+
+    def send(self, data: bytes) -> int:
+        self.bytes_sent += len(data)
+        self.packets_sent += 1
+        return len(data)
+
+    def sendall(self, data: bytes):
+        self.send(data)
+
+    def close(self):
+        pass
+
+
+class SessionReplayer:
+    """Kaydedilmiş bir oturumu sunucu veya istemci mesaj işleyicilerine geri besler"""
+
+    def __init__(self, network, path: str, speed: Optional[float] = 1.0):
+        self.network = network
+        self.path = path
+        self.speed = speed  # 1 = gerçek zaman, N = N kat hızlı, 0/None = maksimum hız
+        self.header, self.records = read_session(path)
+        self._sockets: Dict[str, _ReplaySocket] = {}
+
+    def _get_socket(self, connection_id: str) -> _ReplaySocket:
+        """Bağlantı kimliği için sahte socket'i oluşturur ve sunucuya kaydeder"""
+        sock = self._sockets.get(connection_id)
+        if sock is None:
+            sock = _ReplaySocket(connection_id)
+            self._sockets[connection_id] = sock
+            with self.network.lock:
+                self.network.connected_clients[connection_id] = sock
+        return sock
+
+    def _iter_inbound(self) -> Iterator[Tuple[float, dict]]:
+        """Sadece gelen mesajları döndürür - giden mesajlar işleyicilerin çıktısıdır"""
+        for elapsed, direction, message in self.records:
+            if direction == RECORD_INBOUND:
+                yield elapsed, message
+
+    def replay(self) -> Dict:
+        """Oturumu oynatır ve performans istatistiklerini döndürür"""
+        fast = not self.speed or self.speed <= 0
+        started = time.perf_counter()
+        handler_time = 0.0
+        processed = 0
+        errors = 0
+
+        for elapsed, message in self._iter_inbound():
+            if not fast:
+                # Kayıttaki zamanlamayı hız çarpanıyla koru
+                delay = elapsed / self.speed - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+
+            message = dict(message)
+            handler_start = time.perf_counter()
+            try:
+                if self.network.is_server:
+                    sock = self._get_socket(message.get('connection_id', 'replay'))
+                    self.network._process_server_message(message, sock)
+                else:
+                    self.network._process_client_message(message)
+            except Exception:
+                errors += 1
+            handler_time += time.perf_counter() - handler_start
+            processed += 1
+
+        total_time = time.perf_counter() - started
+
+        return {
+            'messages': processed,
+            'errors': errors,
+            'elapsed': total_time,
+            'handler_time': handler_time,
+            'messages_per_second': processed / handler_time if handler_time > 0 else 0.0,
+            'bytes_sent': sum(s.bytes_sent for s in self._sockets.values()),
+            'packets_sent': sum(s.packets_sent for s in self._sockets.values())
+        }
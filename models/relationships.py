@@ -0,0 +1,419 @@
+import random
+import weakref
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set, Tuple
+
+# İlişki seviyeleri - artan eşik sırasıyla
+RELATIONSHIP_LEVELS = MappingProxyType({
+    "Yabancı": 0,
+    "Tanıdık": 20,
+    "Arkadaş": 40,
+    "İyi Arkadaş": 60,
+    "En İyi Arkadaş": 80,
+    "Sevgili": 90
+})
+
+# Uyum bandının üst kısmı - sosyal menüde yakınlaşmaya açık ilişkiler olarak gösterilir
+HIGH_COMPATIBILITY = 75
+
+# Flört etkileşiminin anı adı - kenar flört edilmiş olarak işaretlenir ("Flört Et" hedefi)
+FLIRT_EVENT = "Flört"
+
+# Çift başına saklanan son anı sayısı - eskileri özet sayaçlarına katlanır (UI son 5'i gösterir)
+MEMORY_LIMIT = 10
+
+# bisect için sıralı eşik ve tür listeleri
+_LEVEL_THRESHOLDS = tuple(sorted(RELATIONSHIP_LEVELS.values()))
+_LEVEL_NAMES = tuple(sorted(RELATIONSHIP_LEVELS, key=RELATIONSHIP_LEVELS.get))
+
+
+def relationship_type(level: float) -> str:
+    """Seviyenin karşılık geldiği ilişki türü - eşik tablosunda ikili arama"""
+    index = bisect_right(_LEVEL_THRESHOLDS, level) - 1
+    return _LEVEL_NAMES[max(0, index)]
+
+
+def new_memory(entries=()) -> deque:
+    """Sınırlı anı halkası"""
+    return deque(entries, maxlen=MEMORY_LIMIT)
+
+
+def remember(edge: dict, entry: dict):
+    """Anıyı halkaya ekler - halka doluysa en eski anı özet sayaçlarına katlanır"""
+    memory = edge.get('memory')
+    if not isinstance(memory, deque):
+        memory = edge['memory'] = new_memory()
+    if len(memory) == memory.maxlen:
+        _summarize(edge, memory.popleft())
+    memory.append(entry)
+
+
+def _summarize(edge: dict, entry: dict):
+    """Halkadan düşen anıyı sabit boyutlu özete ekler"""
+    summary = edge.setdefault('summary', {'events': 0, 'goals_completed': 0, 'level_change': 0, 'since': None})
+    summary['events'] += 1
+    summary['level_change'] = round(summary['level_change'] + entry.get('level_change', 0), 2)
+    if str(entry.get('event', '')).startswith("Hedef tamamlandı"):
+        summary['goals_completed'] += 1
+    if summary['since'] is None:
+        summary['since'] = entry.get('time')
+
+
+def recent_memory(edge: dict, count: int = 5) -> list:
+    """Son anılar (eskiden yeniye)"""
+    memory = edge.get('memory') or ()
+    return list(memory)[-count:]
+
+
+def serialize_edge(edge: dict) -> dict:
+    """Kenarın JSON'a yazılabilir kopyası - halka listeye çevrilir"""
+    data = dict(edge)
+    if 'memory' in data:
+        data['memory'] = list(data['memory'])
+    return data
+
+
+def restore_edge(edge: dict) -> dict:
+    """Kayıttan okunan kenarın anı listesini halkaya çevirir - eski sınırsız listeler özetlenir"""
+    entries = edge.get('memory')
+    if entries is None or isinstance(entries, deque):
+        return edge
+    edge['memory'] = new_memory()
+    for entry in entries:
+        remember(edge, entry)
+    return edge
+
+
+def copy_edge(edge: dict) -> dict:
+    """Kenarın bağımsız kopyası - anı halkası ve özet de kopyalanır"""
+    data = dict(edge)
+    if 'memory' in data:
+        data['memory'] = new_memory(data['memory'])
+    if data.get('summary') is not None:
+        data['summary'] = dict(data['summary'])
+    return data
+
+
+def pair_key(name: str, other_name: str) -> Tuple[str, str]:
+    """Çiftin sıradan bağımsız anahtarı - (a, b) ve (b, a) aynı kenardır"""
+    return (name, other_name) if name <= other_name else (other_name, name)
+
+
+class RelationshipJournal:
+    """Bir Sim'in anlık görüntüsünden sonra değişen kenarların ilk hali - kenar ilk değişiminde kopyalanır"""
+
+    __slots__ = ('name', 'edges', 'created', '__weakref__')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.edges: Dict[Tuple[str, str], Tuple[dict, dict]] = {}  # anahtar -> (kenar, ilk hali)
+        self.created: Dict[Tuple[str, str], tuple] = {}  # anahtar -> kenarı gösteren (sözlük, ad) çiftleri
+
+    def __len__(self):
+        return len(self.edges) + len(self.created)
+
+
+class RelationshipGraph:
+    """İki Sim arasındaki ilişkiyi tek kenar olarak tutan depo - iki Sim de aynı kenarı görür
+
+    Her dünyanın (Game, headless motor) kendi deposu vardır; Sim'ler adlarıyla tutulduğu için
+    farklı oyunlardaki aynı adlı Sim'ler birbirinin kenarlarını görmez.
+    """
+
+    def __init__(self):
+        self._edges: Dict[Tuple[str, str], dict] = {}
+        self._holders: Dict[str, dict] = {}  # Sim adı -> kenarları gösteren relationships sözlüğü
+
+        # İkincil indeksler - sorgular taramadan ikili aramayla yapılır
+        self._by_level: Dict[str, List[Tuple[float, str]]] = {}  # Sim -> sıralı (seviye, diğer)
+        self._by_compatibility: Dict[str, List[Tuple[int, str]]] = {}  # Sim -> sıralı (uyum, diğer)
+        self._by_type: Dict[str, Set[Tuple[str, str]]] = {name: set() for name in RELATIONSHIP_LEVELS}
+
+        # Açık anlık görüntü günlükleri - görüntü bırakılınca kendiliğinden düşer
+        self._journals = weakref.WeakSet()
+
+    def __len__(self):
+        return len(self._edges)
+
+    def __contains__(self, key):
+        return pair_key(*key) in self._edges
+
+    def __iter__(self):
+        """Çift anahtarları"""
+        return iter(self._edges)
+
+    def get(self, name: str, other_name: str) -> Optional[dict]:
+        """Çiftin kenarı - yoksa None"""
+        return self._edges.get(pair_key(name, other_name))
+
+    # İndeks bakımı
+
+    def _index(self, key: Tuple[str, str], edge: dict):
+        """Kenarı iki tarafın seviye/uyum listelerine ve tür kümesine ekler - listeye ekleme O(k) kaydırmadır (k: ilişki sayısı)"""
+        name, other_name = key
+        for owner, other in ((name, other_name), (other_name, name)):
+            insort(self._by_level.setdefault(owner, []), (edge['level'], other))
+            insort(self._by_compatibility.setdefault(owner, []), (edge['compatibility'], other))
+        self._by_type.setdefault(edge['type'], set()).add(key)
+
+    def _unindex(self, key: Tuple[str, str], edge: dict):
+        """Kenarı indekslerden çıkarır - silme de O(k) kaydırmadır"""
+        name, other_name = key
+        for owner, other in ((name, other_name), (other_name, name)):
+            _discard_sorted(self._by_level.get(owner), (edge['level'], other))
+            _discard_sorted(self._by_compatibility.get(owner), (edge['compatibility'], other))
+        self._by_type.get(edge['type'], set()).discard(key)
+
+    # Anlık görüntü günlükleri
+
+    def journal(self, name: str) -> RelationshipJournal:
+        """Sim'in kenarlarındaki değişiklikleri geri alınabilir şekilde kaydetmeye başlar"""
+        journal = RelationshipJournal(name)
+        self._journals.add(journal)
+        return journal
+
+    def _record(self, key: Tuple[str, str], edge: Optional[dict], holders=()):
+        """Kenar değişmeden önce açık günlüklere ilk halini yazar (yeni kenarlar için sahiplerini)"""
+        for journal in self._journals:
+            if journal.name not in key or key in journal.edges or key in journal.created:
+                continue
+            if edge is None:
+                journal.created[key] = holders
+            else:
+                journal.edges[key] = (edge, copy_edge(edge))
+
+    def rollback(self, journal: RelationshipJournal):
+        """Günlükteki kenarları kaydedildikleri hale döndürür - günlük sonraki dal için boşalır"""
+        for key, holders in journal.created.items():
+            edge = self._edges.pop(key, None)
+            if edge is None:
+                continue
+            self._unindex(key, edge)
+            for relationships, other_name in holders:
+                if relationships.get(other_name) is edge:
+                    del relationships[other_name]
+
+        for key, (edge, saved) in journal.edges.items():
+            current = self._edges.get(key)
+            if current is not None:
+                self._unindex(key, current)
+            # Silinmiş (ör. ölüm) veya silinip yeniden kurulmuş kenar tarafların sözlüğüne geri bağlanır
+            for owner, other in (key, key[::-1]):
+                holder = self._holders.get(owner)
+                if holder is not None and holder.get(other, current) is current:
+                    holder[other] = edge
+            # Kenar yerinde geri yazılır - iki Sim'in sözlüğü aynı nesneyi göstermeye devam eder
+            edge.clear()
+            edge.update(copy_edge(saved))
+            self._edges[key] = edge
+            self._index(key, edge)
+
+        journal.edges.clear()
+        journal.created.clear()
+
+    def release(self, journal: RelationshipJournal):
+        """Günlüğü kapatır - kenarlar artık onun için kopyalanmaz"""
+        self._journals.discard(journal)
+
+    # Sim'ler
+
+    def attach(self, sim):
+        """Sim'i bu depoya bağlar - Sim'in ilişki sözlüğü kenar silinince güncellenir"""
+        sim.relationship_graph = self
+        self._holders[sim.name] = sim.relationships
+
+    def detach(self, name: str):
+        """Sim'in sözlüğünü bırakır - kenarları depoda kalır (ör. sıkıştırılan NPC)"""
+        self._holders.pop(name, None)
+
+    def remove_sim(self, name: str):
+        """Ölen veya çıkarılan Sim'in tüm kenarlarını ve indeks kayıtlarını siler"""
+        for other_name, edge in self.neighbors(name):
+            key = pair_key(name, other_name)
+            if self._journals:
+                self._record(key, edge)
+            del self._edges[key]
+            self._unindex(key, edge)
+            # Karşı taraf artık bu Sim'i ilişkilerinde görmez
+            holder = self._holders.get(other_name)
+            if holder is not None and holder.get(name) is edge:
+                del holder[name]
+        self._by_level.pop(name, None)
+        self._by_compatibility.pop(name, None)
+        self._holders.pop(name, None)
+
+    def _hold(self, sim):
+        """Kenara bağlanan Sim'in sözlüğünü kaydeder - henüz bir depoya bağlı olmayan Sim buna bağlanır"""
+        if getattr(sim, '_graph', self) is None:
+            sim.relationship_graph = self
+        self._holders[sim.name] = sim.relationships
+
+    # Kenar işlemleri
+
+    def connect(self, sim, other_sim, initial_level=0, rng=None) -> dict:
+        """Çift için kenarı oluşturur (varsa mevcut olanı) ve iki Sim'in sözlüğüne bağlar"""
+        key = pair_key(sim.name, other_sim.name)
+        edge = self._edges.get(key)
+        if edge is None or (sim.relationships.get(other_sim.name) is not edge
+                            and other_sim.relationships.get(sim.name) is not edge):
+            # Yeni çift veya aynı isimli eski Sim'lerden kalmış, kimsenin göstermediği kenar
+            if self._journals:
+                self._record(key, edge, ((sim.relationships, other_sim.name),
+                                         (other_sim.relationships, sim.name)))
+            if edge is not None:
+                self._unindex(key, edge)
+            level = max(0, min(100, initial_level))
+            edge = self._edges[key] = {
+                'level': level,
+                'type': relationship_type(level),
+                'compatibility': (rng or random).randint(30, 90),
+                'memory': new_memory(),
+                'interactions': 0
+            }
+            self._index(key, edge)
+        sim.relationships[other_sim.name] = edge
+        other_sim.relationships[sim.name] = edge
+        self._hold(sim)
+        self._hold(other_sim)
+        return edge
+
+    def update(self, sim, other_sim, change, event=None, rng=None) -> dict:
+        """Etkileşimi kenara tek seferde uygular - iki yön de aynı değişimi görür"""
+        key = pair_key(sim.name, other_sim.name)
+        edge = self._edges.get(key)
+        if edge is None:
+            return self.connect(sim, other_sim, max(0, change), rng)
+        if self._journals:
+            self._record(key, edge)
+
+        level = max(0, min(100, edge['level'] + change))
+        if level != edge['level']:
+            self._unindex(key, edge)
+            edge['level'] = level
+            edge['type'] = relationship_type(level)
+            self._index(key, edge)
+        edge['interactions'] += 1
+
+        if event:
+            remember(edge, {
+                'event': event,
+                'time': sim.game_time.strftime("%Y-%m-%d %H:%M") if sim.game_time else "Bilinmiyor",
+                'level_change': change
+            })
+        return edge
+
+    def adopt(self, sim):
+        """Kayıttan yüklenen Sim'i bağlar ve kenarlarını depoya alır - karşı taraf bu depoda yaşıyorsa onunki kullanılır"""
+        self.attach(sim)
+        for other_name, edge in list(sim.relationships.items()):
+            if 'interactions' not in edge:
+                continue  # Eski kayıtlardaki kenar olmayan (NPC) ilişkiler Sim'e özeldir
+            restore_edge(edge)
+            key = pair_key(sim.name, other_name)
+            current = self._edges.get(key)
+            holder = self._holders.get(other_name)
+            if current is not None and holder is not None and holder.get(sim.name) is current:
+                sim.relationships[other_name] = current
+                continue
+            # Yeni çift veya kimsenin göstermediği eski kenar - kayıttaki veri geçerlidir
+            if self._journals:
+                self._record(key, current, ((sim.relationships, other_name),))
+            if current is not None:
+                self._unindex(key, current)
+            self._edges[key] = edge
+            self._index(key, edge)
+
+    def remove(self, name: str, other_name: str):
+        """Çiftin kenarını depodan çıkarır"""
+        key = pair_key(name, other_name)
+        edge = self._edges.get(key)
+        if edge is not None:
+            if self._journals:
+                self._record(key, edge)
+            del self._edges[key]
+            self._unindex(key, edge)
+            for owner, other in (key, key[::-1]):
+                holder = self._holders.get(owner)
+                if holder is not None and holder.get(other) is edge:
+                    del holder[other]
+
+    def flirt(self, name: str, other_name: str):
+        """Kenarı flört edilmiş olarak işaretler - ilişki türü seviyeden gelir, flört ayrı tutulur"""
+        edge = self._edges.get(pair_key(name, other_name))
+        if edge is not None and not edge.get('flirted'):
+            self.touch(name, other_name)
+            edge['flirted'] = True
+
+    def touch(self, name: str, other_name: str):
+        """Kenar graf dışından (ör. anı eklenerek) değiştirilmeden önce günlüklere bildirilir"""
+        if self._journals:
+            key = pair_key(name, other_name)
+            edge = self._edges.get(key)
+            if edge is not None:
+                self._record(key, edge)
+
+    def clear(self):
+        """Tüm kenarları ve indeksleri siler"""
+        self._edges.clear()
+        self._holders.clear()
+        self._by_level.clear()
+        self._by_compatibility.clear()
+        for pairs in self._by_type.values():
+            pairs.clear()
+
+    # Sorgular - O(log k + sonuç), k: Sim'in ilişki sayısı
+
+    def top(self, name: str, k: int = 5) -> List[Tuple[str, dict]]:
+        """En yüksek seviyeli k ilişki (yüksekten düşüğe)"""
+        levels = self._by_level.get(name, [])
+        return [(other, self.get(name, other)) for _, other in reversed(levels[-k:])] if k > 0 else []
+
+    def in_level_range(self, name: str, low: float, high: float) -> List[str]:
+        """Seviyesi [low, high) aralığındaki ilişkiler (düşükten yükseğe)"""
+        levels = self._by_level.get(name, [])
+        start = bisect_left(levels, (low, ''))
+        end = bisect_left(levels, (high, ''))
+        return [other for _, other in levels[start:end]]
+
+    def by_type(self, name: str, rel_type: str) -> List[str]:
+        """Verilen türdeki ilişkiler - tür seviye aralığına çevrilip ikili aramayla bulunur"""
+        index = _LEVEL_NAMES.index(rel_type)
+        high = _LEVEL_THRESHOLDS[index + 1] if index + 1 < len(_LEVEL_THRESHOLDS) else float('inf')
+        return self.in_level_range(name, _LEVEL_THRESHOLDS[index], high)
+
+    def neighbors(self, name: str) -> List[Tuple[str, dict]]:
+        """Sim'in tüm kenarları (diğer, kenar) - Sim nesnesi olmadan yeniden bağlamak için"""
+        return [(other, self._edges[pair_key(name, other)]) for _, other in self._by_level.get(name, ())]
+
+    def partners(self, name: str) -> List[str]:
+        """Sevgilileri"""
+        return self.by_type(name, "Sevgili")
+
+    def near_next_level(self, name: str, margin: float = 5) -> List[Tuple[str, str]]:
+        """Bir sonraki seviyeye margin kadar yaklaşmış ilişkiler: (diğer, sıradaki tür)"""
+        result = []
+        for threshold, next_type in zip(_LEVEL_THRESHOLDS[1:], _LEVEL_NAMES[1:]):
+            result.extend((other, next_type) for other in self.in_level_range(name, threshold - margin, threshold))
+        return result
+
+    def by_compatibility(self, name: str, low: int, high: int) -> List[str]:
+        """Uyumu [low, high] bandındaki ilişkiler (düşükten yükseğe)"""
+        compatibilities = self._by_compatibility.get(name, [])
+        start = bisect_left(compatibilities, (low, ''))
+        end = bisect_right(compatibilities, (high, '\uffff'))
+        return [other for _, other in compatibilities[start:end]]
+
+    def pairs_of_type(self, rel_type: str) -> Set[Tuple[str, str]]:
+        """Tüm nüfusta verilen türdeki çiftler"""
+        return set(self._by_type.get(rel_type, ()))
+
+
+def _discard_sorted(items: Optional[list], item):
+    """Sıralı listeden öğeyi ikili aramayla siler"""
+    if not items:
+        return
+    index = bisect_left(items, item)
+    if index < len(items) and items[index] == item:
+        del items[index]
@@ -0,0 +1,49 @@
+import random
+from typing import Dict, Optional, Tuple
+
+# Akış adları - her alt sistem ayrı akış kullanır, biri diğerinin sırasını kaydırmaz
+SIM_STREAM = 'sim'  # Eylemler, meslekler ve ilişkiler (Sim.rng)
+EVENTS_STREAM = 'events'
+GAMBLING_STREAM = 'gambling'
+POLICY_STREAM = 'policy'  # Headless rastgele eylem seçimi
+NPC_STREAM = 'npc'  # Flört edilen NPC havuzlarının üretimi
+POPULATION_STREAM = 'population'  # Vektörel nüfusun tip/meslek dağılımı ve eylem örnekleri
+LOD_STREAM = 'lod'  # Kaba ayrıntıdaki Sim'lerin örneklenen eylem sonuçları
+
+
+class RandomService:
+    """Tek bir seed'den alt sistem ve Sim başına bağımsız, tekrarlanabilir rastgele akışlar üretir"""
+
+    def __init__(self, seed: Optional[int] = None):
+        # Seed verilmezse rastgele seçilir ve raporlanır - çalıştırma sonradan tekrarlanabilir
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2 ** 32)
+        self._streams: Dict[Tuple[str, Optional[str]], random.Random] = {}
+
+    def stream(self, subsystem: str, owner: Optional[str] = None) -> random.Random:
+        """Alt sistemin (ve varsa sahibinin) akışı - süreç ve sıradan bağımsız aynı seed'le başlar"""
+        key = (subsystem, owner)
+        rng = self._streams.get(key)
+        if rng is None:
+            # str seed'ler süreçler arasında aynı sonucu verir (hash() rastgeleleştirmesinden etkilenmez)
+            label = f"{self.seed}:{subsystem}" if owner is None else f"{self.seed}:{subsystem}:{owner}"
+            rng = self._streams[key] = random.Random(label)
+        return rng
+
+    def bind_sim(self, sim) -> random.Random:
+        """Sim'in kendi akışını Sim.rng'ye bağlar"""
+        sim.rng = self.stream(SIM_STREAM, sim.name)
+        return sim.rng
+
+    def for_sim(self, sim, subsystem: str) -> random.Random:
+        """Sim'in verilen alt sistemdeki akışı"""
+        return self.stream(subsystem, sim.name)
+
+    def __len__(self):
+        return len(self._streams)
+
+
+def subsystem_rng(service: Optional[RandomService], sim, subsystem: str):
+    """Servis varsa Sim'in alt sistem akışı, yoksa Sim.rng (o da None ise çağıran global random kullanır)"""
+    if service is not None:
+        return service.for_sim(sim, subsystem)
+    return sim.rng
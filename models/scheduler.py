@@ -0,0 +1,116 @@
+import heapq
+import itertools
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+
+class ScheduledEvent:
+    """Kuyruktaki tek bir geri çağrı - iptal edilince kuyruktan tembel şekilde atılır"""
+
+    __slots__ = ('time', 'callback', 'args', 'key', 'cancelled')
+
+    def __init__(self, time: datetime, callback: Callable, args: tuple, key=None):
+        self.time = time
+        self.callback = callback
+        self.args = args
+        self.key = key
+        self.cancelled = False
+
+    def __repr__(self):
+        return f"ScheduledEvent({self.time}, {getattr(self.callback, '__name__', self.callback)!r}, key={self.key!r})"
+
+
+class EventScheduler:
+    """Oyun zamanına göre sıralı geri çağrılar (min-heap) - sıradaki olaya doğrudan atlanır"""
+
+    def __init__(self, start_time: Optional[datetime] = None):
+        self.now = start_time  # Son işlenen olayın oyun zamanı
+        self._queue = []  # (zaman, sıra, olay) - aynı andaki olaylar eklenme sırasıyla
+        self._counter = itertools.count()
+        self._keyed: Dict[object, ScheduledEvent] = {}  # Anahtar başına tek bekleyen olay
+        self._pending = 0
+
+        # Diagnostik sayaçları
+        self.processed = 0
+        self.cancelled = 0
+
+    def __len__(self):
+        return self._pending
+
+    def schedule(self, at: datetime, callback: Callable, *args, key=None) -> ScheduledEvent:
+        """Geri çağrıyı verilen oyun zamanına kurar - aynı anahtarlı eski olay iptal edilir"""
+        if key is not None:
+            self.cancel(self._keyed.get(key))
+
+        event = ScheduledEvent(at, callback, args, key)
+        heapq.heappush(self._queue, (at, next(self._counter), event))
+        self._pending += 1
+        if key is not None:
+            self._keyed[key] = event
+        return event
+
+    def cancel(self, event: Optional[ScheduledEvent]):
+        """Bekleyen olayı iptal eder (None ve işlenmiş olaylar yok sayılır)"""
+        if event is None or event.cancelled:
+            return
+        event.cancelled = True
+        self._pending -= 1
+        self.cancelled += 1
+        if event.key is not None and self._keyed.get(event.key) is event:
+            del self._keyed[event.key]
+
+    def cancel_key(self, key):
+        """Anahtara bağlı bekleyen olayı iptal eder"""
+        self.cancel(self._keyed.get(key))
+
+    def get(self, key) -> Optional[ScheduledEvent]:
+        """Anahtara bağlı bekleyen olay"""
+        return self._keyed.get(key)
+
+    def next_time(self) -> Optional[datetime]:
+        """Sıradaki geçerli olayın zamanı - kuyruk boşsa None"""
+        while self._queue and self._queue[0][2].cancelled:
+            heapq.heappop(self._queue)
+        return self._queue[0][0] if self._queue else None
+
+    def pop(self) -> Optional[ScheduledEvent]:
+        """Sıradaki geçerli olayı kuyruktan çıkarır ve saati o ana getirir"""
+        while self._queue:
+            at, _, event = heapq.heappop(self._queue)
+            if event.cancelled:
+                continue
+            # İşlenen olay artık iptal edilemez
+            event.cancelled = True
+            self._pending -= 1
+            if event.key is not None and self._keyed.get(event.key) is event:
+                del self._keyed[event.key]
+            if self.now is None or at > self.now:
+                self.now = at
+            return event
+        return None
+
+    def run_until(self, until: Optional[datetime] = None) -> int:
+        """Zamanı gelen olayları sırayla çalıştırır (until yoksa kuyruk boşalana kadar)"""
+        count = 0
+        while True:
+            next_time = self.next_time()
+            if next_time is None or (until is not None and next_time > until):
+                break
+            event = self.pop()
+            event.callback(*event.args)
+            count += 1
+
+        self.processed += count
+        if until is not None and (self.now is None or until > self.now):
+            self.now = until
+        return count
+
+    def get_diagnostics(self) -> dict:
+        """Kuyruk sayaçları"""
+        return {
+            'now': self.now,
+            'pending': self._pending,
+            'processed': self.processed,
+            'cancelled': self.cancelled,
+            'next_time': self.next_time()
+        }
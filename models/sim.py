@@ -1,12 +1,118 @@
 import json
 import os
-import random
+import sys
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from types import MappingProxyType
+from models.activity import compile_activity
+from models.clock import game_hours, hours_until
 from models.jobs import Job, JobFactory
-import time
+from models.relationships import (RELATIONSHIP_LEVELS, RelationshipGraph, recent_memory,
+                                  remember, serialize_edge)
+from models.statehash import HASHED_FIELDS, field_digest
+
+def _threshold(warning, critical, warning_effect, critical_effect):
+    """Değiştirilemez eşik kaydı - etkiler (mesaj, ruh hali, enerji, para) demetleridir"""
+    return MappingProxyType({
+        'warning': warning,
+        'critical': critical,
+        'effects': MappingProxyType({
+            'warning': warning_effect,
+            'critical': critical_effect
+        })
+    })
+
+
+# Anlık görüntüde henüz atanmamış alanın işareti (ör. ölmemiş Sim'in death_time'ı)
+_UNSET = object()
+
+
+class SimSnapshot:
+    """Sim'in değişken durumunun küçük kopyası - ilişki kenarları sadece değiştiklerinde kopyalanır"""
+
+    __slots__ = ('values', 'job', 'containers', 'relationships', 'journal', 'rng_state')
+
+    def __init__(self, values, job, containers, relationships, journal, rng_state):
+        self.values = values  # SNAPSHOT_FIELDS sırasıyla değerler
+        self.job = job  # (meslek nesnesi, seviye, deneyim)
+        self.containers = containers  # Kritik durum kümeleri, sayaçlar ve hedefler
+        self.relationships = relationships  # İlişki sözlüğünün sığ kopyası
+        self.journal = journal  # Ortak kenarların değişmeden önceki halleri
+        self.rng_state = rng_state
+
 
 class Sim:
+    # Nesne başına __dict__ yerine sabit alan düzeni (bellek için)
+    __slots__ = (
+        'name', 'gender', 'age', 'mood', 'energy', 'hunger', 'hygiene', 'social', 'money',
+        'job_instance', 'job', 'job_level', 'job_experience', 'job_satisfaction',
+        'relationships', 'relationship_events', 'last_interaction', 'relationship_memory',
+        'compatibility', 'social_traits', 'relationship_goals', 'current_date', 'state',
+        'current_activity', 'game_time', 'clock', 'rng', 'last_warning_time', 'critical_states',
+        'is_critical', 'has_warnings', '_critical_attributes', 'is_alive', 'death_reason',
+        'death_time', 'critical_time_counters', 'character_type', '_state_hash', '_graph',
+        '_status_cache', '_status_view', '_status_dirty'
+    )
+    
+    # get_status çıktısındaki alanlar (sırasıyla) - değiştiklerinde önbellek kirlenir
+    STATUS_FIELDS = ('name', 'gender', 'age', 'mood', 'energy', 'hunger', 'hygiene',
+                     'social', 'money', 'job', 'state', 'game_time', 'relationships')
+    _STATUS_FIELD_SET = frozenset(STATUS_FIELDS)
+    
+    # snapshot/restore ile geri alınan değişken alanlar
+    SNAPSHOT_FIELDS = ('mood', 'energy', 'hunger', 'hygiene', 'social', 'money', 'job', 'job_level',
+                       'job_experience', 'job_satisfaction', 'state', 'current_activity', 'game_time',
+                       'last_warning_time', 'is_critical', 'has_warnings', 'is_alive', 'death_reason',
+                       'death_time')
+    
+    # Uyarı/kritik durumunu etkileyen alanlar
+    _NEED_FIELDS = frozenset(('mood', 'energy', 'hunger', 'hygiene', 'social'))
+    
+    # İlişki seviyeleri - tüm Sim'lerde ortak
+    relationship_levels = RELATIONSHIP_LEVELS
+    
+    # Ölüm eşikleri (oyun saati) - tüm Sim'lerde ortak
+    death_thresholds = MappingProxyType({
+        'energy': 15,     # 15 oyun saati kritik seviyede kalırsa ölür
+        'hunger': 30,     # 30 oyun saati kritik seviyede kalırsa ölür
+        'hygiene': 90,    # ~4 oyun günü kritik seviyede kalırsa ölür
+        'mood': 45,       # 45 oyun saati kritik seviyede kalırsa ölür
+        'social': 120     # 5 oyun günü kritik seviyede kalırsa ölür
+    })
+    
+    # Kritik durum eşikleri ve etkileri - tüm Sim'lerde ortak
+    critical_thresholds = MappingProxyType({
+        'energy': _threshold(20, 10,
+            ("Yorgunsunuz! Dinlenmeniz gerekiyor.", -5, 0, 0),
+            ("AŞIRI YORGUNLUK! Hemen dinlenmelisiniz!", -10, -5, -100)),
+        'hunger': _threshold(20, 10,
+            ("Açsınız! Yemek yemelisiniz.", -5, -5, 0),
+            ("AÇLIKTAN BAYILMAK ÜZERESİNİZ! Hemen yemek yemelisiniz!", -15, -10, -200)),
+        'hygiene': _threshold(20, 10,
+            ("Kirli hissediyorsunuz! Banyo yapmalısınız.", -5, -5, 0),
+            ("DAYANILMAZ KİRLİLİK! Hemen banyo yapmalısınız!", -20, -10, -150)),
+        'mood': _threshold(20, 10,
+            ("Kendinizi kötü hissediyorsunuz.", -5, -5, 0),
+            ("DEPRESYONA GİRİYORSUNUZ! Bir şeyler yapmalısınız!", -10, -15, -300)),
+        'social': _threshold(20, 10,
+            ("Yalnızlık hissetmeye başladınız.", -5, -5, 0),
+            ("SOSYAL İZOLASYON! İnsanlarla görüşmelisiniz!", -15, -10, -250))
+    })
+    
+    # Zaman geçtikçe ihtiyaçların saat başına azalması (advance_time)
+    NEEDS_DECAY_PER_HOUR = {
+        'energy': -2,
+        'hunger': -3,
+        'hygiene': -1,
+        'social': -1
+    }
+    
     def __init__(self, name, gender, age=25):
+        # Durum önbelleği ilk get_status'ta kurulur - arayüzde gösterilmeyen Sim'ler için bellek ayrılmaz
+        self._status_cache = None
+        self._status_view = None
+        self._status_dirty = None
+        
         self.name = name
         self.gender = gender
         self.age = age
@@ -19,29 +125,25 @@ class Sim:
         
         # Job sistemi - yeni yaklaşım
         self.job_instance = JobFactory.create_job("İşsiz")
-        self.job = self.job_instance.name  # Geriye uyumluluk için
+        self.job = sys.intern(self.job_instance.name)  # Geriye uyumluluk için
         self.job_level = 1  # İş seviyesi
         self.job_experience = 0  # İş deneyimi
         self.job_satisfaction = 50  # İş memnuniyeti (0-100)
         
         self.relationships = {}
-        self.relationship_levels = {
-            "Yabancı": 0,
-            "Tanıdık": 20,
-            "Arkadaş": 40,
-            "İyi Arkadaş": 60,
-            "En İyi Arkadaş": 80,
-            "Sevgili": 90
-        }
+        self._graph = None  # Bağlı olduğu dünyanın ilişki deposu (RelationshipGraph.attach)
         self.relationship_events = []  # İlişki olaylarını tutacak liste
         self.last_interaction = {}  # Son etkileşim zamanlarını tutacak sözlük
         self.relationship_memory = {}  # İlişki anılarını tutacak sözlük
         self.compatibility = {}  # Karakter uyumluluklarını tutacak sözlük
         self.social_traits = []  # Sosyal özellikleri tutacak liste
-        self.relationship_goals = {}  # İlişki hedeflerini tutacak sözlük
+        self.relationship_goals = {}  # Diğer Sim adı -> bu Sim'in o ilişkideki hedefleri
         self.current_date = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
         self.state = "normal"  # normal, depressed, flirty, etc.
+        self.current_activity = "Boşta"  # Devam eden aktivite (multiplayer tahmini için)
         self.game_time = None  # Game sınıfından alınacak
+        self.clock = None  # Oyun saati kaynağı (çağrılabilir), None ise game_time kullanılır
+        self.rng = None  # Seed'li rastgele akış (lockstep), None ise global random
         self.last_warning_time = None
         self.critical_states = set()  # Aktif kritik durumları tutar
         self.is_critical = False  # Kritik durum kontrolü için
@@ -51,68 +153,50 @@ class Sim:
         # Ölüm mekanizması
         self.is_alive = True  # Canlı mı?
         self.death_reason = None  # Ölüm sebebi
-        self.critical_time_counters = {}  # Her kritik durum için süre sayacı
-        self.death_thresholds = {
-            'energy': 15,     # 15 saniye kritik seviyede kalırsa ölür
-            'hunger': 30,     # 30 saniye kritik seviyede kalırsa ölür
-            'hygiene': 90,    # 1.5 dakika kritik seviyede kalırsa ölür
-            'mood': 45,       # 45 saniye kritik seviyede kalırsa ölür
-            'social': 120     # 2 dakika kritik seviyede kalırsa ölür
-        }
-        
-        # Kritik durum eşikleri ve etkileri
-        self.critical_thresholds = {
-            'energy': {
-                'warning': 20,  # 20'den düşükse uyarı
-                'critical': 10,  # 10'dan düşükse kritik
-                'effects': {
-                    'warning': lambda: self._handle_critical_state('energy', 'warning', 
-                        "Yorgunsunuz! Dinlenmeniz gerekiyor.", -5, 0, 0),
-                    'critical': lambda: self._handle_critical_state('energy', 'critical',
-                        "AŞIRI YORGUNLUK! Hemen dinlenmelisiniz!", -10, -5, -100)
-                }
-            },
-            'hunger': {
-                'warning': 20,  # 20'den düşükse uyarı (açlık)
-                'critical': 10,  # 10'dan düşükse kritik
-                'effects': {
-                    'warning': lambda: self._handle_critical_state('hunger', 'warning',
-                        "Açsınız! Yemek yemelisiniz.", -5, -5, 0),
-                    'critical': lambda: self._handle_critical_state('hunger', 'critical',
-                        "AÇLIKTAN BAYILMAK ÜZERESİNİZ! Hemen yemek yemelisiniz!", -15, -10, -200)
-                }
-            },
-            'hygiene': {
-                'warning': 20,  # 20'den düşükse uyarı
-                'critical': 10,  # 10'dan düşükse kritik
-                'effects': {
-                    'warning': lambda: self._handle_critical_state('hygiene', 'warning',
-                        "Kirli hissediyorsunuz! Banyo yapmalısınız.", -5, -5, 0),
-                    'critical': lambda: self._handle_critical_state('hygiene', 'critical',
-                        "DAYANILMAZ KİRLİLİK! Hemen banyo yapmalısınız!", -20, -10, -150)
-                }
-            },
-            'mood': {
-                'warning': 20,  # 20'den düşükse uyarı
-                'critical': 10,  # 10'dan düşükse kritik
-                'effects': {
-                    'warning': lambda: self._handle_critical_state('mood', 'warning',
-                        "Kendinizi kötü hissediyorsunuz.", -5, -5, 0),
-                    'critical': lambda: self._handle_critical_state('mood', 'critical',
-                        "DEPRESYONA GİRİYORSUNUZ! Bir şeyler yapmalısınız!", -10, -15, -300)
-                }
-            },
-            'social': {
-                'warning': 20,  # 20'den düşükse uyarı
-                'critical': 10,  # 10'dan düşükse kritik
-                'effects': {
-                    'warning': lambda: self._handle_critical_state('social', 'warning',
-                        "Yalnızlık hissetmeye başladınız.", -5, -5, 0),
-                    'critical': lambda: self._handle_critical_state('social', 'critical',
-                        "SOSYAL İZOLASYON! İnsanlarla görüşmelisiniz!", -15, -10, -250)
-                }
-            }
-        }
+        self.critical_time_counters = {}  # Her kritik durumun başladığı oyun saati
+    
+    def __setattr__(self, name, value):
+        """Takip edilen alanlar değiştikçe durum hash'ini günceller ve durum önbelleğini kirli işaretler"""
+        if name in HASHED_FIELDS:
+            state_hash = getattr(self, '_state_hash', None)
+            if state_hash is not None:
+                # Sadece değişen alanın özeti XOR ile çıkarılıp yenisi eklenir (hash hiç okunmadıysa maliyet yok)
+                old = getattr(self, name, _UNSET)
+                if old is not _UNSET:
+                    state_hash ^= field_digest(name, old)
+                object.__setattr__(self, '_state_hash', state_hash ^ field_digest(name, value))
+        if name in self._STATUS_FIELD_SET and self._status_dirty is not None:
+            self._status_dirty.add(name)
+        object.__setattr__(self, name, value)
+    
+    @property
+    def relationship_graph(self) -> RelationshipGraph:
+        """Sim'ler arası ilişkiler - çift başına tek kenar; dünyaya bağlanmamış Sim kendi deposunu oluşturur"""
+        if self._graph is None:
+            RelationshipGraph().attach(self)
+        return self._graph
+    
+    @relationship_graph.setter
+    def relationship_graph(self, graph: RelationshipGraph):
+        self._graph = graph
+    
+    @property
+    def state_hash(self) -> int:
+        """Desync tespiti için Sim durumunun hash'i - ilk okunuşta hesaplanır, sonra alan yazıldıkça güncellenir"""
+        state_hash = getattr(self, '_state_hash', None)
+        if state_hash is None:
+            state_hash = 0
+            for name in HASHED_FIELDS:
+                value = getattr(self, name, _UNSET)
+                if value is not _UNSET:
+                    state_hash ^= field_digest(name, value)
+            object.__setattr__(self, '_state_hash', state_hash)
+        return state_hash
+    
+    def apply_threshold_effect(self, attribute, level):
+        """Eşik tablosundaki uyarı/kritik etkisini uygular"""
+        message, mood_effect, energy_effect, money_effect = self.critical_thresholds[attribute]['effects'][level]
+        self._handle_critical_state(attribute, level, message, mood_effect, energy_effect, money_effect)
     
     def _check_critical_state(self, attribute):
         """Bir özelliğin kritik durumda olup olmadığını kontrol eder"""
@@ -142,12 +226,22 @@ class Sim:
         # Ölüm kontrolü yap
         self._check_death_conditions()
     
+    def current_game_hours(self):
+        """Ölüm sayaçlarının okuduğu oyun saati - zaman bilinmiyorsa None"""
+        if self.clock is not None:
+            return self.clock()
+        if self.game_time is None:
+            return None
+        return game_hours(self.game_time)
+    
     def _check_death_conditions(self):
         """Ölüm koşullarını kontrol eder ve gerekirse ölümü gerçekleştirir"""
         if not self.is_alive:
             return
             
-        current_time = time.time()
+        current_time = self.current_game_hours()
+        if current_time is None:
+            return  # Oyun zamanı yokken kritik süre ilerlemez
         
         # Her kritik özellik için süre sayacını güncelle
         for attr in self.critical_thresholds.keys():
@@ -188,6 +282,10 @@ class Sim:
             self.death_time = self.game_time
         else:
             self.death_time = datetime.now()
+        
+        # Kenarlar dünyanın deposundan silinir - diğer Sim'ler artık ölen Sim'i görmez
+        if self._graph is not None:
+            self._graph.remove_sim(self.name)
     
     def get_death_info(self):
         """Ölüm bilgilerini döndürür"""
@@ -279,73 +377,68 @@ class Sim:
         self.energy = max(0, min(100, self.energy))
     
     def get_status(self):
-        """Sim'in durumunu döndürür"""
-        # Kritik ve uyarı durumlarını güncelle
-        self._update_critical_state()
-        self.get_warning_attributes()
-        
-        # Kritik durumları kontrol et
-        warnings = []
-        for attr in self._critical_attributes:
-            thresholds = self.critical_thresholds[attr]
-            value = getattr(self, attr)
-            if value <= thresholds['critical']:
-                warnings.append(f"{attr} kritik seviyede")
-        
-        # Uyarı durumlarını kontrol et
-        warning_attributes = self.get_warning_attributes()
-        for attr in warning_attributes:
-            warnings.append(f"{attr} düşük seviyede")
-        
-        # Durum bilgisini oluştur
-        status = {
-            'name': self.name,
-            'gender': self.gender,
-            'age': self.age,
-            'mood': self.mood,
-            'energy': self.energy,
-            'hunger': self.hunger,
-            'hygiene': self.hygiene,
-            'social': self.social,
-            'money': self.money,
-            'job': self.job,
-            'state': self.state,
-            'game_time': self.game_time.strftime("%d %B %Y, %H:%M") if self.game_time else "Bilinmiyor",
-            'relationships': self.relationships
-        }
+        """Sim'in durumunu döndürür - sadece son çağrıdan beri değişen kısımlar hesaplanır"""
+        if self._status_cache is None:
+            self._status_cache = dict.fromkeys(self.STATUS_FIELDS)
+            self._status_view = MappingProxyType(self._status_cache)
+            self._status_dirty = set(self.STATUS_FIELDS)
+        dirty = self._status_dirty
+        status = self._status_cache
+        
+        if dirty:
+            needs_changed = not dirty.isdisjoint(self._NEED_FIELDS)
+            for field in dirty:
+                if field == 'game_time':
+                    status['game_time'] = self.game_time.strftime("%d %B %Y, %H:%M") if self.game_time else "Bilinmiyor"
+                else:
+                    status[field] = getattr(self, field)
+            dirty.clear()
+            
+            if needs_changed:
+                # Kritik ve uyarı durumlarını güncelle
+                self._update_critical_state()
+                self._refresh_status_warnings()
+                return self._status_view
+        
+        if self._critical_attributes:
+            # Değerler değişmese de oyun zamanı ilerlemiş olabilir - ölüm kontrolü yapılır
+            self._check_death_conditions()
+        
+        # Salt okunur görünüm - önbellek dışarıdan bozulamaz
+        return self._status_view
+    
+    def _refresh_status_warnings(self):
+        """Önbellekteki kritik durum ve uyarı listesini yeniler"""
+        warnings = [f"{attr} kritik seviyede" for attr in self._critical_attributes]
+        warnings.extend(f"{attr} düşük seviyede" for attr in self.get_warning_attributes())
         
         # Kritik durumlar veya uyarılar varsa ekle
         if warnings:
-            status['warnings'] = warnings
-            
-        return status
+            self._status_cache['warnings'] = warnings
+        else:
+            self._status_cache.pop('warnings', None)
     
     def update_stats_during_activity(self, activity_info, step, total_steps):
         """Aktivite sırasında istatistikleri günceller"""
-        if 'effects' not in activity_info:
-            return
-            
-        # Her adımda etkilerin bir kısmını uygula
-        effects = activity_info['effects']
-        progress_ratio = (step + 1) / total_steps
-        
-        # Etkileri hesapla ve uygula
-        for attr, value in effects.items():
-            if hasattr(self, attr):
-                # Toplam etkinin progress_ratio kadarını uygula
-                step_effect = value * progress_ratio / total_steps
-                current = getattr(self, attr)
-                
-                if attr == 'money':
-                    # Para için doğrudan ekle/çıkar - round ile 2 ondalık haneye yuvarla
-                    if step == total_steps - 1:  # Son adımda kalan tüm parayı ekle
-                        setattr(self, attr, round(current + (value - (step * step_effect)), 2))
-                    else:
-                        setattr(self, attr, round(current + step_effect, 2))
-                else:
-                    # Diğer özellikler için sınırla (0-100 arası) ve round et
-                    new_value = round(max(0, min(100, current + step_effect)), 2)
-                    setattr(self, attr, new_value)
+        compile_activity(activity_info, total_steps).apply_step(self, step)
+    
+    def run_activity(self, activity_info, total_steps):
+        """Aktivitenin tüm adımlarını beklemeden tek seferde uygular"""
+        compile_activity(activity_info, total_steps).apply(self)
+    
+    def get_activity_rates(self, activity_info, total_steps):
+        """Aktivite sırasında ihtiyaçların oyun saati başına ortalama değişimi"""
+        duration = activity_info.get('duration', 0)
+        if 'effects' not in activity_info or duration <= 0 or total_steps <= 0:
+            return {}
+        
+        # update_stats_during_activity toplamda value * (T + 1) / (2T) kadar uygular
+        scale = (total_steps + 1) / (2 * total_steps) / duration
+        return {
+            attr: round(value * scale, 4)
+            for attr, value in activity_info['effects'].items()
+            if attr != 'money'
+        }
     
     def advance_time(self, hours=1):
         """Zamanı ilerletir ve ihtiyaçları günceller"""
@@ -353,10 +446,10 @@ class Sim:
             return
             
         # İhtiyaçları güncelle (zaman ilerlemeden)
-        energy_change = -2 * hours
-        hunger_change = -3 * hours
-        hygiene_change = -1 * hours
-        social_change = -1 * hours
+        energy_change = self.NEEDS_DECAY_PER_HOUR['energy'] * hours
+        hunger_change = self.NEEDS_DECAY_PER_HOUR['hunger'] * hours
+        hygiene_change = self.NEEDS_DECAY_PER_HOUR['hygiene'] * hours
+        social_change = self.NEEDS_DECAY_PER_HOUR['social'] * hours
         
         self.update_needs(
             energy=energy_change,
@@ -365,6 +458,115 @@ class Sim:
             social=social_change
         )
     
+    def decay_rates(self):
+        """Karakter düzeltmeleri uygulanmış saatlik ihtiyaç değişimleri"""
+        return dict(self.NEEDS_DECAY_PER_HOUR)
+    
+    def next_threshold_crossing(self, exact=None):
+        """Mevcut azalma hızlarıyla sıradaki eşik olayı: (saat, özellik, seviye) veya None - exact yuvarlanmamış değerlerdir"""
+        rates = self.decay_rates()
+        now = self.current_game_hours()
+        nearest = None
+        
+        for attr, thresholds in self.critical_thresholds.items():
+            value = getattr(self, attr)
+            rate = rates.get(attr, 0)
+            candidates = []
+            
+            # Doğrusal azalmada eşiğe kalan süre kapalı formülle bulunur
+            if rate < 0:
+                start = exact.get(attr, value) if exact else value
+                for level in ('warning', 'critical'):
+                    if value > thresholds[level]:
+                        candidates.append((max(0.0, (start - thresholds[level]) / -rate), level))
+            
+            # Kritik seviyedeyse ölüm anı sayaçtan hesaplanır (_check_death_conditions ile aynı karşılaştırma)
+            if value <= thresholds['critical'] and now is not None:
+                started = self.critical_time_counters.get(attr, now)
+                candidates.append((max(0.0, self.death_thresholds[attr] - (now - started)), 'death'))
+            
+            for hours, level in candidates:
+                if nearest is None or hours < nearest[0]:
+                    nearest = (hours, attr, level)
+        
+        return nearest
+    
+    def fast_forward(self, hours):
+        """Zamanı saat saat değil doğrudan sıradaki eşik olaylarına atlayarak ilerletir"""
+        if not self.game_time:
+            return []
+        
+        rates = self.decay_rates()
+        start_time = self.game_time
+        end_time = start_time + timedelta(hours=hours)
+        start_values = {need: getattr(self, need) for need in rates}
+        
+        # Doğrudan atanmış (henüz güncellenmemiş) kritik değerlerin sayaçları atlamanın başında başlar
+        self._update_critical_state()
+        
+        events = []
+        exact = dict(start_values)
+        while self.game_time < end_time and self.is_alive:
+            # Eşik anları yuvarlanmış değerlerden değil kapalı formülden bulunur - atlamalar arasında kayma birikmez
+            crossing = self.next_threshold_crossing(exact)
+            remaining = (end_time - self.game_time).total_seconds() / 3600
+            if crossing is None or crossing[0] >= remaining:
+                target, crossing = end_time, None
+            else:
+                target = self.game_time + hours_until(crossing[0])
+            
+            # Değerler başlangıçtan kapalı formülle hesaplanır - saatlik adımlarla aynı yuvarlama
+            elapsed = (target - start_time).total_seconds() / 3600
+            self.game_time = target
+            for need, rate in rates.items():
+                exact[need] = max(0, min(100, start_values[need] + rate * elapsed))
+                setattr(self, need, round(exact[need], 2))
+            self._update_critical_state()
+            
+            if crossing:
+                events.append({'time': self.game_time, 'attribute': crossing[1], 'level': crossing[2]})
+        
+        return events
+    
+    def catch_up(self, until):
+        """Tembel bekleyen Sim'i verilen oyun zamanına kadar ilerletir"""
+        if self.game_time and until > self.game_time:
+            return self.fast_forward((until - self.game_time).total_seconds() / 3600)
+        return []
+    
+    def next_death(self):
+        """Sadece azalma sürerse ölümün gerçekleşeceği an: (saat, özellik) veya None"""
+        rates = self.decay_rates()
+        now = self.current_game_hours()
+        if now is None:
+            return None
+        
+        nearest = None
+        for attr, thresholds in self.critical_thresholds.items():
+            value = getattr(self, attr)
+            rate = rates.get(attr, 0)
+            if value <= thresholds['critical']:
+                started = self.critical_time_counters.get(attr, now)
+                hours = max(0.0, self.death_thresholds[attr] - (now - started))
+            elif rate < 0:
+                # Kritik seviyeye iniş + kritikte kalma süresi
+                hours = (value - thresholds['critical']) / -rate + self.death_thresholds[attr]
+            else:
+                continue
+            if nearest is None or hours < nearest[0]:
+                nearest = (hours, attr)
+        return nearest
+    
+    def schedule_death(self, scheduler, callback):
+        """Bekleyen Sim'in ölüm anını zamanlayıcıya kurar: callback(sim, özellik)"""
+        key = (self, 'death')
+        death = self.next_death() if self.game_time and self.is_alive else None
+        if death is None:
+            scheduler.cancel_key(key)
+            return None
+        hours, attribute = death
+        return scheduler.schedule(self.game_time + hours_until(hours), callback, self, attribute, key=key)
+    
     def calculate_mood(self):
         """Ruh halini diğer faktörlere göre hesaplar"""
         base_mood = 50  # Temel ruh hali
@@ -388,6 +590,68 @@ class Sim:
         
         return self.mood
     
+    def snapshot(self) -> SimSnapshot:
+        """Geri dönülebilir anlık görüntü - deepcopy yerine sadece değişken alanlar alınır"""
+        values = tuple(getattr(self, field, _UNSET) for field in self.SNAPSHOT_FIELDS)
+        job = (self.job_instance, self.job_instance.level, self.job_instance.experience)
+        containers = (
+            set(self.critical_states),
+            set(self._critical_attributes),
+            dict(self.critical_time_counters),
+            {name: list(goals) for name, goals in self.relationship_goals.items()}
+        )
+        # Ortak kenarlar günlükle korunur; eski kayıtlardan kalan Sim'e özel ilişkiler küçük olduğu için kopyalanır
+        relationships = {
+            name: rel if 'interactions' in rel else dict(rel) for name, rel in self.relationships.items()
+        }
+        journal = self.relationship_graph.journal(self.name)
+        rng_state = self.rng.getstate() if self.rng is not None else None
+        return SimSnapshot(values, job, containers, relationships, journal, rng_state)
+    
+    def restore(self, snapshot: SimSnapshot):
+        """Sim'i anlık görüntüdeki haline döndürür - aynı görüntüye tekrar tekrar dönülebilir"""
+        for field, value in zip(self.SNAPSHOT_FIELDS, snapshot.values):
+            if value is _UNSET:
+                if hasattr(self, field):
+                    object.__delattr__(self, field)
+                    if field in HASHED_FIELDS:
+                        object.__setattr__(self, '_state_hash', None)  # Silinen alan - hash yeniden hesaplanır
+            elif getattr(self, field, _UNSET) != value:
+                setattr(self, field, value)  # Hash ve durum önbelleği __setattr__ ile güncellenir
+        
+        job_instance, level, experience = snapshot.job
+        self.job_instance = job_instance
+        job_instance.level = level
+        job_instance.experience = experience
+        
+        critical_states, critical_attributes, counters, goals = snapshot.containers
+        self.critical_states = set(critical_states)
+        self._critical_attributes = set(critical_attributes)
+        self.critical_time_counters = dict(counters)
+        self.relationship_goals = {name: list(items) for name, items in goals.items()}
+        
+        self.relationship_graph.rollback(snapshot.journal)
+        self.relationships = {
+            name: rel if 'interactions' in rel else dict(rel) for name, rel in snapshot.relationships.items()
+        }
+        self.relationship_graph.attach(self)
+        if snapshot.rng_state is not None:
+            self.rng.setstate(snapshot.rng_state)
+    
+    def release(self, snapshot: SimSnapshot):
+        """Görüntüyü bırakır - ilişki kenarları artık onun için kopyalanmaz"""
+        self.relationship_graph.release(snapshot.journal)
+    
+    @contextmanager
+    def speculate(self):
+        """'Ne olurdu' denemesi: blok içindeki değişiklikler çıkışta geri alınır"""
+        snapshot = self.snapshot()
+        try:
+            yield snapshot
+        finally:
+            self.restore(snapshot)
+            self.release(snapshot)
+    
     def save(self):
         """Sim'i kaydeder - yeni job sistemi ile"""
         try:
@@ -409,9 +673,11 @@ class Sim:
                 'job_instance_name': self.job_instance.name,
                 'job_instance_level': self.job_instance.level,
                 'job_instance_experience': self.job_instance.experience,
-                'relationships': self.relationships,
+                'relationships': {name: serialize_edge(rel) for name, rel in self.relationships.items()},
+                'relationship_goals': self.relationship_goals,
                 'state': self.state,
-                'game_time': self.game_time.strftime("%Y-%m-%d %H:%M:%S") if self.game_time else None
+                'game_time': self.game_time.strftime("%Y-%m-%d %H:%M:%S") if self.game_time else None,
+                'critical_time_counters': self.critical_time_counters
             }
             
             with open(f"save_{self.name}.json", 'w', encoding='utf-8') as f:
@@ -423,8 +689,8 @@ class Sim:
             return False
     
     @classmethod
-    def load(cls, name):
-        """Kaydedilmiş Sim'i yükler - yeni job sistemi ile"""
+    def load(cls, name, relationship_graph=None):
+        """Kaydedilmiş Sim'i yükler - ilişkileri verilen dünyanın deposuna (yoksa Sim'e özel depoya) alınır"""
         try:
             with open(f"save_{name}.json", 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -436,19 +702,26 @@ class Sim:
             sim.hygiene = round(data['hygiene'], 2)
             sim.social = round(data['social'], 2)
             sim.money = round(data['money'], 2)
-            sim.job = data['job']
+            sim.job = sys.intern(data['job'])
             sim.job_level = data['job_level']
             sim.job_experience = data['job_experience']
             sim.job_satisfaction = data['job_satisfaction']
             sim.relationships = data['relationships']
-            sim.state = data['state']
+            sim.relationship_goals = data.get('relationship_goals', {})
+            for other_name, rel in sim.relationships.items():
+                # Eski kayıtlarda hedefler ilişki kaydının içindeydi
+                goals = rel.pop('goals', None)
+                if goals:
+                    sim.relationship_goals.setdefault(other_name, goals)
+            (relationship_graph if relationship_graph is not None else RelationshipGraph()).adopt(sim)
+            sim.state = sys.intern(data['state'])
             
             # Yeni job sistemi verilerini yükle
             if 'job_instance_name' in data:
                 sim.job_instance = JobFactory.create_job(data['job_instance_name'])
                 sim.job_instance.level = data.get('job_instance_level', 1)
                 sim.job_instance.experience = data.get('job_instance_experience', 0)
-                sim.job = sim.job_instance.name  # Senkronize et
+                sim.job = sys.intern(sim.job_instance.name)  # Senkronize et
             else:
                 # Eski kayıt dosyaları için geriye uyumluluk
                 sim.job_instance = JobFactory.create_job(data['job'])
@@ -456,6 +729,8 @@ class Sim:
             # Zamanı yükle
             if data['game_time']:
                 sim.game_time = datetime.strptime(data['game_time'], "%Y-%m-%d %H:%M:%S")
+            # Kritik süre sayaçları oyun saatinde tutulduğu için kayıtla birlikte taşınır
+            sim.critical_time_counters = data.get('critical_time_counters', {})
             
             return sim
         except Exception as e:
@@ -496,7 +771,7 @@ class Sim:
     def change_job(self, new_job_name: str):
         """Mesleği değiştirir"""
         self.job_instance = JobFactory.create_job(new_job_name)
-        self.job = self.job_instance.name  # Geriye uyumluluk için
+        self.job = sys.intern(self.job_instance.name)  # Geriye uyumluluk için
     
     def work_at_job(self):
         """İş yapar ve sonuçları döndürür"""
@@ -518,7 +793,7 @@ class Sim:
             }
         
         # İş sonuçlarını al
-        work_result = self.job_instance.work()
+        work_result = self.job_instance.work(self.rng)
         
         # Sim'in değerlerini güncelle
         self.energy -= work_result['energy_cost']
@@ -540,65 +815,21 @@ class Sim:
         }
     
     def add_relationship(self, other_sim, initial_level=0):
-        """Yeni bir ilişki ekler"""
+        """Yeni bir ilişki ekler - kenar iki Sim arasında ortaktır"""
         if other_sim.name not in self.relationships:
-            # Uyumluluk hesapla
-            compatibility = random.randint(30, 90)
-            
-            # İlişki türünü belirle
-            relationship_type = "Tanıdık"
-            for level_name, level_value in self.relationship_levels.items():
-                if initial_level >= level_value:
-                    relationship_type = level_name
-            
-            # İlişkiyi ekle
-            self.relationships[other_sim.name] = {
-                'level': initial_level,
-                'type': relationship_type,
-                'compatibility': compatibility,
-                'goals': [],
-                'memory': [],
-                'interactions': 0
-            }
-            
-            # Karşılıklı ilişki
-            if self.name not in other_sim.relationships:
-                other_sim.add_relationship(self, initial_level)
+            self.relationship_graph.connect(self, other_sim, initial_level, self.rng)
     
     def update_relationship(self, other_sim, change, event=None):
-        """İlişkiyi günceller"""
+        """İlişkiyi günceller - ortak kenara tek simetrik güncelleme uygulanır"""
         if other_sim.name not in self.relationships:
             self.add_relationship(other_sim, max(0, change))
             return
         
-        # İlişki seviyesini güncelle
-        self.relationships[other_sim.name]['level'] += change
-        self.relationships[other_sim.name]['level'] = max(0, min(100, self.relationships[other_sim.name]['level']))
-        
-        # İlişki türünü güncelle
-        current_level = self.relationships[other_sim.name]['level']
-        for level_name, level_value in sorted(self.relationship_levels.items(), key=lambda x: x[1], reverse=True):
-            if current_level >= level_value:
-                self.relationships[other_sim.name]['type'] = level_name
-                break
+        self.relationship_graph.update(self, other_sim, change, event, self.rng)
         
-        # Etkileşim sayısını artır
-        self.relationships[other_sim.name]['interactions'] += 1
-        
-        # Olay varsa kaydet
-        if event:
-            self.relationships[other_sim.name]['memory'].append({
-                'event': event,
-                'time': self.game_time.strftime("%Y-%m-%d %H:%M") if self.game_time else "Bilinmiyor",
-                'level_change': change
-            })
-        
-        # Hedefleri kontrol et
+        # Her iki tarafın da hedeflerini kontrol et
         self.check_relationship_goals(other_sim)
-        
-        # Karşılıklı ilişkiyi güncelle
-        if self.name in other_sim.relationships:
-            other_sim.update_relationship(self, change * 0.8, event)
+        other_sim.check_relationship_goals(self)
     
     def get_relationship_info(self, other_sim):
         """İlişki bilgilerini döndürür"""
@@ -613,27 +844,38 @@ class Sim:
             'type': rel['type'],
             'compatibility': rel['compatibility'],
             'interactions': rel['interactions'],
-            'recent_events': rel['memory'][-5:] if rel['memory'] else [],
-            'goals': rel['goals']
+            'recent_events': recent_memory(rel),
+            'memory_summary': rel.get('summary'),
+            'goals': list(self.relationship_goals.get(other_sim.name, ()))
         }
     
+    def get_best_friends(self, k=3):
+        """En yüksek seviyeli k ilişki: (isim, seviye, tür) - ilişki indeksinden, taramasız"""
+        return [(other, edge['level'], edge['type']) for other, edge in self.relationship_graph.top(self.name, k)]
+    
+    def get_partners(self):
+        """Sevgili olunan Sim'ler"""
+        return self.relationship_graph.partners(self.name)
+    
     def add_relationship_goal(self, other_sim, goal):
         """İlişki hedefi ekler"""
         if other_sim.name not in self.relationships:
             self.add_relationship(other_sim)
         
-        if goal not in self.relationships[other_sim.name]['goals']:
-            self.relationships[other_sim.name]['goals'].append(goal)
+        goals = self.relationship_goals.setdefault(other_sim.name, [])
+        if goal not in goals:
+            goals.append(goal)
     
     def check_relationship_goals(self, other_sim):
         """İlişki hedeflerini kontrol eder"""
-        if other_sim.name not in self.relationships or not self.relationships[other_sim.name]['goals']:
+        goals = self.relationship_goals.get(other_sim.name)
+        if other_sim.name not in self.relationships or not goals:
             return
         
         rel = self.relationships[other_sim.name]
         completed_goals = []
         
-        for goal in rel['goals']:
+        for goal in goals:
             # Hedef kontrolü
             if goal == "Arkadaş Ol" and rel['level'] >= self.relationship_levels["Arkadaş"]:
                 completed_goals.append(goal)
@@ -641,17 +883,18 @@ class Sim:
                 completed_goals.append(goal)
             elif goal == "En İyi Arkadaş Ol" and rel['level'] >= self.relationship_levels["En İyi Arkadaş"]:
                 completed_goals.append(goal)
-            elif goal == "Flört Et" and rel['type'] == "Flört":
+            elif goal == "Flört Et" and rel.get('flirted'):
                 completed_goals.append(goal)
             elif goal == "Sevgili Ol" and rel['level'] >= self.relationship_levels["Sevgili"]:
                 completed_goals.append(goal)
         
         # Tamamlanan hedefleri kaldır
         for goal in completed_goals:
-            rel['goals'].remove(goal)
+            goals.remove(goal)
             
             # Hedef tamamlandığında anı ekle
-            rel['memory'].append({
+            self.relationship_graph.touch(self.name, other_sim.name)
+            remember(rel, {
                 'event': f"Hedef tamamlandı: {goal}",
                 'time': self.game_time.strftime("%Y-%m-%d %H:%M") if self.game_time else "Bilinmiyor",
                 'level_change': 0
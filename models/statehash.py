@@ -0,0 +1,51 @@
+import hashlib
+from functools import lru_cache
+from typing import Dict
+
+# Hash'e giren Sim alanları - Sim nesnesi ve ağdaki durum sözlüğü için aynı
+HASHED_FIELDS = frozenset((
+    'mood', 'energy', 'hunger', 'hygiene', 'social', 'money',
+    'job', 'job_satisfaction', 'is_alive'
+))
+
+
+def _normalize(value) -> str:
+    """Aynı değerin int/float veya JSON dönüşümünden bağımsız aynı metne çevrilmesi"""
+    if isinstance(value, bool) or value is None:
+        return repr(value)
+    if isinstance(value, (int, float)):
+        return f"{float(value):.2f}"
+    return str(value)
+
+
+def _digest(text: str) -> int:
+    """Deterministik 64-bit özet (Python'un hash()'i süreçler arasında değişir)"""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+@lru_cache(maxsize=65536, typed=True)
+def field_digest(name: str, value) -> int:
+    """Tek bir alan=değer çiftinin özeti - XOR ile birleştirilir"""
+    return _digest(f"{name}={_normalize(value)}")
+
+
+def state_hash_of(state: dict) -> int:
+    """Durum sözlüğünün hash'i - eksik alanlar hesaba katılmaz"""
+    result = 0
+    for name in HASHED_FIELDS:
+        if name in state:
+            result ^= field_digest(name, state[name])
+    return result
+
+
+def roster_hash(hashes: Dict[str, int]) -> int:
+    """Oyuncu başına hash'lerden tüm lobinin tek hash'ini üretir"""
+    result = 0
+    for player_name, state_hash in hashes.items():
+        result ^= field_digest(player_name, state_hash)
+    return result
+
+
+def diverging_players(local: Dict[str, int], remote: Dict[str, int]) -> list:
+    """Hash'i uyuşmayan (veya bir tarafta eksik olan) oyuncular"""
+    return sorted(name for name in set(local) | set(remote) if local.get(name) != remote.get(name))
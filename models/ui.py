@@ -3,7 +3,7 @@ import time
 import inquirer
 import pyfiglet
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -14,6 +14,7 @@ from rich.text import Text
 from rich.align import Align
 from rich.style import Style
 from rich.box import ROUNDED, HEAVY
+from models.relationships import HIGH_COMPATIBILITY
 
 class SimsUI:
     def __init__(self, game, dev_mode: bool = False):
@@ -362,6 +363,7 @@ class SimsUI:
             actions.append("👪 Oyuncu Listesi")
             
         actions.extend([
+            "🔮 Eylem Tahminleri",
             "💾 Oyunu Kaydet",
             "🚪 Ana Menüye Dön"
         ])
@@ -486,6 +488,7 @@ class SimsUI:
     def show_social_menu(self):
         """Sosyalleşme menüsünü gösterir"""
         self.is_showing_menu = True
+        self.show_close_relationships(self.game.sim)
         
         social_actions = [
             "Arkadaşlarla Buluş",
@@ -504,6 +507,32 @@ class SimsUI:
         self.is_showing_menu = False
         return answer['social_action']
         
+    def show_close_relationships(self, sim):
+        """Sosyal menüsünün üstünde en yakın ilişkileri ve sevgilileri gösterir - ilişki indeksinden"""
+        if sim is None:
+            return
+        best_friends = sim.get_best_friends()
+        if not best_friends:
+            return
+        
+        lines = [f"[bright_white]{name}[/bright_white]: {rel_type} ({level:.0f})"
+                 for name, level, rel_type in best_friends]
+        partners = sim.get_partners()
+        if partners:
+            lines.append(f"[bright_magenta]❤ Sevgili:[/bright_magenta] {', '.join(partners)}")
+        # Uyumu yüksek ama henüz sevgili olunmayanlar - uyum indeksinden bant sorgusu
+        compatible = [name for name in sim.relationship_graph.by_compatibility(sim.name, HIGH_COMPATIBILITY, 100)
+                      if name not in partners]
+        if compatible:
+            lines.append(f"[bright_green]✨ Uyumlu:[/bright_green] {', '.join(reversed(compatible))}")
+        
+        self.console.print(Panel(
+            "\n".join(lines),
+            title="[bright_cyan]Yakın İlişkiler[/bright_cyan]",
+            border_style="bright_cyan",
+            box=ROUNDED
+        ))
+        
     def show_multiplayer_lobby(self, is_server=False):
         """Multiplayer lobi ekranını gösterir - geliştirilmiş versiyon"""
         
@@ -638,6 +667,8 @@ class SimsUI:
             "🎲 Bahis Oyunları",
             "💬 Chat Gönder",
             "📊 Oyuncu Listesi",
+            "📡 Network Diagnostikleri",
+            "🔮 Eylem Tahminleri",
             "💾 Oyunu Kaydet",
             "🔌 Bağlantıyı Kes"
         ]
@@ -677,6 +708,7 @@ class SimsUI:
         self.console.print(Panel(
             f"[{latency_color}]⚡ Ortalama Latency:[/{latency_color}] {avg_latency:.2f}ms\n"
             f"[red]🔺 Maksimum Latency:[/red] {max_latency:.2f}ms\n"
+            f"[cyan]🕐 Host Saat Farkı:[/cyan] {latency_info.get('clock_offset', 0):.2f}ms\n"
             f"[green]📉 Packet Loss:[/green] {stats.get('packet_loss', 0):.2%}",
             title="Bağlantı Performansı",
             border_style=latency_color
@@ -706,6 +738,19 @@ class SimsUI:
             border_style="white"
         ))
         
+        # Desync tespiti
+        desync_info = diagnostics.get('desync_info', {})
+        desync_color = "green" if not desync_info.get('desyncs') else "yellow"
+        self.console.print(Panel(
+            f"[white]🔍 Hash Kontrolü:[/white] {desync_info.get('hash_checks', 0)} "
+            f"[dim](atlanan: {desync_info.get('hash_checks_skipped', 0)})[/dim]\n"
+            f"[{desync_color}]⚠️  Desync:[/{desync_color}] {desync_info.get('desyncs', 0)}\n"
+            f"[white]🔄 Resync İsteği:[/white] {desync_info.get('resync_requests', 0)}\n"
+            f"[white]👥 Yeniden Eşitlenen Oyuncu:[/white] {desync_info.get('players_resynced', 0)}",
+            title="Durum Tutarlılığı",
+            border_style=desync_color
+        ))
+        
         # Performans önerileri
         recommendations = self._get_performance_recommendations(diagnostics)
         if recommendations:
@@ -718,6 +763,74 @@ class SimsUI:
         self.console.print("\n[dim]Devam etmek için herhangi bir tuşa basın...[/dim]")
         input()
     
+    def show_action_estimates(self, estimates: dict, diagnostics: dict, rehearsals: Optional[dict] = None):
+        """Eylemlerin Monte Carlo tahminlerini (ve varsa tek denemelerini) tablo olarak gösterir"""
+        self.console.clear()
+        
+        labels = {
+            'eat': "🍽️ Ye",
+            'sleep': "💤 Uyu",
+            'take_bath': "🚿 Banyo Yap",
+            'go_to_work': "💼 İşe Git",
+            'meet_friends': "👥 Arkadaşlarla Buluş",
+            'flirt': "💕 Flört Et",
+            'go_to_party': "🎉 Partiye Git",
+            'bet': "🎲 Bahis (%10)",
+            'slots': "🎰 Slot (%10)"
+        }
+        
+        table = Table(title="🔮 Eylem Tahminleri (ortalama değişim)", box=ROUNDED)
+        table.add_column("Eylem", style="bright_white")
+        table.add_column("Süre", justify="right")
+        for column in ("Ruh Hali", "Enerji", "Açlık", "Hijyen", "Sosyal"):
+            table.add_column(column, justify="right")
+        table.add_column("Para (±)", justify="right", style="bright_green")
+        table.add_column("Kritik", justify="right", style="bright_yellow")
+        table.add_column("Ölüm", justify="right", style="bright_red")
+        
+        for action, result in estimates.items():
+            expected = result['expected']
+            if result['p_failed'] >= 1:
+                table.add_row(labels.get(action, action), "-", "", "", "", "", "", "yapılamaz", "", "")
+                continue
+            needs = [f"{expected[need]:+.1f}" for need in ('mood', 'energy', 'hunger', 'hygiene', 'social')]
+            table.add_row(
+                labels.get(action, action),
+                f"{result['expected_hours']:.1f} sa",
+                *needs,
+                f"{expected['money']:+.0f} (±{result['variance']['money'] ** 0.5:.0f})",
+                f"%{result['p_critical'] * 100:.0f}",
+                f"%{result['p_death'] * 100:.0f}"
+            )
+        
+        self.console.print(table)
+        self.console.print(f"[dim]{next(iter(estimates.values()))['trials']:,} deneme | "
+                           f"Önbellek: {diagnostics['cached']} durum, isabet %{diagnostics['hit_rate'] * 100:.0f}[/dim]")
+        
+        if rehearsals:
+            # Gerçek kurallarla bir kez yapılıp geri alınan eylemler - sınırlama ve ilişkiler dahil
+            rehearsal_table = Table(title="🎭 Şimdi Yapılsaydı (tek deneme, geri alındı)", box=ROUNDED)
+            rehearsal_table.add_column("Eylem", style="bright_white")
+            rehearsal_table.add_column("Süre", justify="right")
+            for column in ("Ruh Hali", "Enerji", "Açlık", "Hijyen", "Sosyal"):
+                rehearsal_table.add_column(column, justify="right")
+            rehearsal_table.add_column("Para", justify="right", style="bright_green")
+            rehearsal_table.add_column("İlişki", style="bright_magenta")
+            
+            for action, result in rehearsals.items():
+                relationship = result.get('relationship')
+                rehearsal_table.add_row(
+                    labels.get(action, action),
+                    f"{result['duration']} sa",
+                    *[f"{result[need]:+.1f}" for need in ('mood', 'energy', 'hunger', 'hygiene', 'social')],
+                    f"{result['money']:+.0f}",
+                    f"{relationship['name']}: {relationship['type']}" if relationship else ""
+                )
+            self.console.print(rehearsal_table)
+        
+        self.console.print("\n[dim]Devam etmek için herhangi bir tuşa basın...[/dim]")
+        input()
+    
     def _format_bytes(self, bytes_count: int) -> str:
         """Byte'ları okunabilir formata çevirir"""
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -996,6 +1109,19 @@ class SimsUI:
         
         return self._get_choice("Sosyalleşme - Ne yapmak istiyorsun?", social_actions)
         
+    def get_progress_plan(self, duration):
+        """Aktivite ilerlemesi için (adım sayısı, adım bekleme süresi) döndürür"""
+        if self.dev_mode:
+            # Dev modda aktiviteleri çok hızlı tamamla
+            return min(10, duration * 2), 0.01  # Dev modda daha az adım, çok hızlı
+        return duration * 10, 0.1  # Her saniye için 10 adım, normal süre
+    
+    def get_activity_pace(self, duration):
+        """Aktivite sırasında gerçek saniye başına geçen oyun saati"""
+        steps, sleep_time = self.get_progress_plan(duration)
+        real_seconds = steps * sleep_time
+        return duration / real_seconds if real_seconds > 0 else 0.0
+    
     def show_activity_progress(self, activity_name, duration, callback=None):
         """Aktivite ilerleme çubuğunu gösterir"""
         self.console.clear()
@@ -1006,13 +1132,7 @@ class SimsUI:
             box=ROUNDED
         ))
         
-        if self.dev_mode:
-            # Dev modda aktiviteleri çok hızlı tamamla
-            steps = min(10, duration * 2)  # Dev modda daha az adım
-            sleep_time = 0.01  # Çok hızlı
-        else:
-            steps = duration * 10  # Her saniye için 10 adım
-            sleep_time = 0.1   # Normal süre
+        steps, sleep_time = self.get_progress_plan(duration)
         
         with Progress(
             TextColumn("[progress.description]{task.description}"),
@@ -1090,4 +1210,38 @@ class SimsUI:
             ))
         
         self.console.print("\n[bright_yellow]Devam etmek için Enter tuşuna basın...[/bright_yellow]")
-        input() 
\ No newline at end of file
+        input() 
+
+class HeadlessUI(SimsUI):
+    """Konsolsuz ve beklemesiz arayüz - host simülasyonu ve toplu çalıştırmalar için"""
+    
+    def __init__(self, game):
+        super().__init__(game, dev_mode=True)
+        self.console = Console(quiet=True)  # Hiçbir çıktı üretmez
+    
+    def show_notification(self, message, style="info", duration=3):
+        """Bildirimler sessizce yutulur"""
+        self.notification = message
+    
+    def show_event(self, event_title, event_description):
+        """Olay ekranı gösterilmez"""
+        pass
+    
+    def show_social_menu(self):
+        """Etkileşimli menü yok - sosyalleşme iptal edilir"""
+        return "Geri Dön"
+    
+    def get_progress_plan(self, duration):
+        """Normal oyundaki adım sayısı korunur ama beklenmez"""
+        return duration * 10, 0.0
+    
+    def get_activity_pace(self, duration):
+        """Beklemesiz çalıştırmada gerçek zamana bağlı hız yoktur"""
+        return 0.0
+    
+    def show_activity_progress(self, activity_name, duration, callback=None):
+        """Aktivite adımlarını beklemeden uygular"""
+        steps, _ = self.get_progress_plan(duration)
+        if callback:
+            for i in range(steps):
+                callback(i, steps)
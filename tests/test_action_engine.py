@@ -0,0 +1,54 @@
+import random
+
+import numpy as np
+import pytest
+
+from models.action_engine import ACTION_TABLE, ActionEngine, activity_steps
+from models.character_types import CharacterFactory
+from models.population import FIELDS, Population
+
+# Nüfus motoru flörtte NPC ilişkisi kurmaz - karşılaştırılan eylemler
+POPULATION_ACTIONS = [action for action, spec in ACTION_TABLE.items() if not spec.get('romance')]
+
+
+class MidpointRandom:
+    """Aralıkların ortasını veren akış - rng'siz nüfus uygulamasının beklenen değerleriyle aynı örnekler"""
+
+    def randint(self, low, high):
+        return (low + high) // 2
+
+
+def _sims(count, seed):
+    """Farklı türlerde ve ihtiyaçlarda Sim'ler"""
+    rng = random.Random(seed)
+    types = CharacterFactory.get_available_types()
+    sims = []
+    for i in range(count):
+        sim = CharacterFactory.create_character(types[i % len(types)], f"Sim{i + 1}", "Kadın", 30)
+        for field in ('mood', 'energy', 'hunger', 'hygiene', 'social'):
+            setattr(sim, field, round(rng.uniform(0, 100), 2))
+        sim.money = round(rng.uniform(0, 2000), 2)
+        sims.append(sim)
+    return sims
+
+
+@pytest.mark.parametrize('action', POPULATION_ACTIONS)
+def test_apply_population_matches_per_sim_perform(action):
+    """Toplu uygulama her satırda Sim'e perform ve aktivite ilerlemesi uygulamakla aynı sonucu verir"""
+    engine = ActionEngine()
+    sims = _sims(24, action)
+    population = Population.from_sims(sims)
+    index = np.arange(0, len(sims), 2)  # Seçilmeyen satırlar değişmez
+
+    durations = engine.apply_population(population, index, action)
+
+    chosen = index.tolist()
+    for row, sim in enumerate(sims):
+        if row in chosen:
+            result = engine.perform(sim, action, rng=MidpointRandom())
+            sim.run_activity(result, activity_steps(result['duration']))
+            assert durations[chosen.index(row)] == result['duration']
+        for field in FIELDS:
+            # Nüfus parayı kuruşa yuvarlanmış tutar, Sim'de çıkarma yuvarlanmaz
+            expected = round(sim.money, 2) if field == 'money' else getattr(sim, field)
+            assert getattr(population, field)[row] == expected, (sim.character_type, field)
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from models.authority import AuthoritativeSimulation
+from models.clock import WorldClock
+
+START = datetime(1960, 1, 1, 6, 0)
+
+
+class FakeMonotonic:
+    """Elle ilerletilen host saati"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _simulation():
+    clock = FakeMonotonic()
+    game = SimpleNamespace(world_clock=WorldClock(START, monotonic=clock), game_time=START, network=None)
+    return AuthoritativeSimulation(game), clock
+
+
+def test_idle_sim_is_only_touched_by_its_events():
+    """Olayı gelmeyen adımda boştaki Sim hesaplanmaz; ölüm tam ölüm anında gerçekleşir"""
+    simulation, clock = _simulation()
+    sim = simulation.add_player("Ali", {'character_type': 'Dengeli', 'hunger': 12})
+    twin = _simulation()[0].add_player("Ali", {'character_type': 'Dengeli', 'hunger': 12})
+    twin.fast_forward(48)
+    assert not twin.is_alive
+
+    clock.now = 0.5  # Yarım oyun saati - ne yayın ne ölüm zamanı
+    assert simulation.step() == []
+    assert sim.game_time == START
+
+    clock.now = 1.0
+    assert simulation.step() == ["Ali"]
+    assert sim.game_time == START + timedelta(hours=1)
+
+    clock.now = 48.0
+    assert simulation.step() == ["Ali"]
+    assert not sim.is_alive
+    assert sim.death_time == twin.death_time and sim.death_reason == twin.death_reason
+
+
+def test_activity_end_is_scheduled():
+    """Eylem dünya saatinde bitene kadar sürer; bitişi kuyruktan gelir"""
+    simulation, clock = _simulation()
+    sim = simulation.add_player("Ayşe", {'character_type': 'Dengeli', 'job': 'Yazılımcı'})
+
+    simulation.submit_intent("Ayşe", {'action': 'eat'})
+    assert simulation.step() == ["Ayşe"]
+    assert sim.current_activity == 'Yemek yeme'
+    assert sim.game_time == START + timedelta(hours=3)
+
+    clock.now = 2.5
+    simulation.step()
+    assert sim.current_activity == 'Yemek yeme' and sim.game_time == START + timedelta(hours=3)
+
+    clock.now = 3.0
+    assert simulation.step() == ["Ayşe"]
+    assert sim.current_activity == 'Boşta'
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+
+from models.character_types import CharacterFactory
+from models.clock import ClockSync, WorldClock
+from models.game import Game
+from models.ui import HeadlessUI
+
+START = datetime(1960, 1, 1, 6, 0)
+
+
+class RealTime:
+    """Elle ilerletilen gerçek zaman - her makinenin monotonic saati bundan sabit farkla okunur"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self, offset):
+        return lambda: self.now + offset
+
+
+class FakeNetwork:
+    """Sadece host saati tahminini taşıyan ağ"""
+
+    def __init__(self, local_clock):
+        self.clock_sync = ClockSync(monotonic=local_clock)
+
+    def disconnect(self):
+        pass
+
+
+def _client(name, local_clock):
+    """Ağ bağlantısı yerine yalnızca ClockSync taşıyan istemci oyunu"""
+    game = Game(dev_mode=True)
+    game.ui = HeadlessUI(game)
+    game.events.check_for_events = lambda sim: None
+    game.network = FakeNetwork(local_clock)
+    game.sim = CharacterFactory.create_character("Dengeli", name, "Kadın", 30)
+    game.sim.game_time = game.game_time
+    game.relationship_graph.attach(game.sim)
+    return game
+
+
+def _ping(client, real_time, world_clock, rtt):
+    """Ping/pong: host dünya saatini cevabı gönderirken okur, cevap yolculuğun yarısında yola çıkar"""
+    clock_sync = client.network.clock_sync
+    t0 = clock_sync._monotonic()
+    real_time.now += rtt / 2
+    host_time, world_time = world_clock.read()
+    real_time.now += rtt / 2
+    clock_sync.add_sample(t0, clock_sync._monotonic(), host_time, world_time, world_clock.hours_per_second)
+    client.sync_world_time()
+
+
+def test_clients_follow_host_world_clock():
+    """Farklı süreli eylemler yapan istemciler dünya saatinde buluşur; öndeki istemci geri çekilir"""
+    real_time = RealTime()
+    world_clock = WorldClock(START, monotonic=real_time.monotonic(1000.0))
+    first = _client("Ali", real_time.monotonic(5.0))
+    second = _client("Ayşe", real_time.monotonic(-70.0))
+
+    _ping(first, real_time, world_clock, rtt=0.04)
+    _ping(second, real_time, world_clock, rtt=0.2)
+    first.sync_world_time()
+    assert first.game_time == second.game_time == world_clock.now()
+
+    # Yemek 3, uyku 6-8 oyun saati sürer; gerçek zamanda ikisi de 2 saniye içinde biter
+    first.perform_action(first.actions.eat)
+    second.perform_action(second.actions.sleep)
+    real_time.now += 2.0
+    first.sync_world_time()
+    second.sync_world_time()
+
+    world_time = world_clock.now()
+    assert first.game_time == second.game_time == world_time
+    assert first.sim.game_time == second.sim.game_time == world_time
+    assert world_time - START < timedelta(hours=3)
+
+    # Yerelde öne geçen istemci bir sonraki pong'da dünya saatine geri çekilir
+    first.game_time += timedelta(hours=5)
+    _ping(first, real_time, world_clock, rtt=0.04)
+    assert first.game_time == first.sim.game_time == world_clock.now()
+
+
+def test_host_world_clock_ignores_host_actions():
+    """Host'un eylemleri dünya saatini ilerletmez - host zamanı da dünya saatinden okunur"""
+    real_time = RealTime()
+    host = _client("Host", real_time.monotonic(0.0))
+    host.network = None
+    host.is_host = True
+    host.world_clock = WorldClock(START, monotonic=real_time.monotonic(0.0))
+
+    host.perform_action(host.actions.sleep)
+    assert host.game_time == host.sim.game_time == START
+
+    real_time.now += 1.5
+    host.perform_action(host.actions.eat)
+    assert host.game_time == START + timedelta(hours=1.5)
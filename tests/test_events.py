@@ -0,0 +1,55 @@
+from models.character_types import CharacterFactory
+from models.game import Game
+from models.ui import HeadlessUI
+
+
+def _game():
+    """Tek oyunculu oyun - olaylar her zaman ve sadece ilişki kategorisinden çıkar"""
+    game = Game(dev_mode=True)
+    game.ui = HeadlessUI(game)
+    game.sim = CharacterFactory.create_character("Sosyal", "Deneme", "Kadın", 30)
+    game.sim.game_time = game.game_time
+    game.relationship_graph.attach(game.sim)
+
+    events = game.events
+    events.time_based_probabilities = dict.fromkeys(events.time_based_probabilities, 1.0)
+    events.event_categories = {'relationship': dict(events.event_categories['relationship'], probability=1)}
+    shown = []
+    game.ui.show_event = lambda title, description: shown.append((title, description))
+    return game, shown
+
+
+def _couple(game):
+    """Oyuncunun iki tanıdığı birbirinin sevgilisi"""
+    first = CharacterFactory.create_character("Dengeli", "Ali", "Erkek", 30)
+    second = CharacterFactory.create_character("Dengeli", "Ayşe", "Kadın", 30)
+    graph = game.relationship_graph
+    graph.update(first, second, 95)
+    graph.update(game.sim, first, 30)
+    graph.update(game.sim, second, 30)
+
+
+def test_actions_trigger_events_with_game_hour_cooldown():
+    """Normal oyunda eylemden sonra olay çıkar; bekleme süresi oyun saatiyle ölçülür"""
+    game, shown = _game()
+    _couple(game)
+    money = game.sim.money
+
+    game.perform_action(game.actions.eat)
+    assert [title for title, _ in shown] == ['Düğün Daveti']
+    assert "Ali ve Ayşe" in shown[0][1]
+    assert game.sim.money < money
+
+    game.perform_action(game.actions.eat)  # 3 oyun saati - bekleme süresi dolmadı
+    assert len(shown) == 1
+
+    game.perform_action(game.actions.sleep)  # 6-8 oyun saati sonra yeni olay çıkabilir
+    assert len(shown) == 2
+
+
+def test_no_relationship_event_without_a_known_couple():
+    """Koşulu sağlanmayan ilişki olayları seçilmez"""
+    game, shown = _game()
+
+    game.perform_action(game.actions.eat)
+    assert shown == []
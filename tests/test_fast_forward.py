@@ -0,0 +1,80 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.character_types import CharacterFactory
+from models.clock import game_hours
+
+START = datetime(1960, 1, 1, 6, 0)
+NEEDS = ('mood', 'energy', 'hunger', 'hygiene', 'social')
+# Eşik anları mikrosaniyeye yukarı yuvarlanır (hours_until) ve kayan noktalı saatler birikir
+ROUNDING = timedelta(microseconds=10)
+
+
+def _pair(character_type, values):
+    """Aynı durumda iki Sim"""
+    sims = []
+    for _ in range(2):
+        sim = CharacterFactory.create_character(character_type, "Deneme", "Erkek", 30)
+        sim.game_time = START
+        for need, value in values.items():
+            setattr(sim, need, value)
+        sim._update_critical_state()  # Son güncellemedeki gibi kritik sayaçları başlar
+        sims.append(sim)
+    return sims
+
+
+def _hour_by_hour(sim, hours):
+    """Saat saat ilerletme - fast_forward'un karşılaştırıldığı referans"""
+    for _ in range(hours):
+        if not sim.is_alive:
+            break
+        sim.game_time += timedelta(hours=1)
+        sim.advance_time(1)
+
+
+def _deaths_within_hour(sim, death_time):
+    """Ölüm anından önceki bir saat içinde kritik süresi dolan ihtiyaçlar"""
+    end = game_hours(death_time + ROUNDING)
+    return [attr for attr, started in sim.critical_time_counters.items()
+            if end - 1 < started + sim.death_thresholds[attr] <= end]
+
+
+@pytest.mark.parametrize('character_type', CharacterFactory.get_available_types())
+def test_fast_forward_matches_hourly_advance(character_type):
+    """Kapalı formülle atlama saat saat azalmayla aynı ihtiyaçları, zamanı ve ölümü verir"""
+    rng = random.Random(character_type)
+    for _ in range(60):
+        values = {need: round(rng.uniform(5, 100), 2) for need in NEEDS}
+        hours = rng.randint(1, 200)
+        jumped, stepped = _pair(character_type, values)
+
+        jumped.fast_forward(hours)
+        _hour_by_hour(stepped, hours)
+
+        assert jumped.is_alive == stepped.is_alive
+        if jumped.is_alive:
+            assert jumped.game_time == stepped.game_time
+            assert {need: getattr(jumped, need) for need in NEEDS} == \
+                   {need: getattr(stepped, need) for need in NEEDS}
+            assert jumped.critical_states == stepped.critical_states
+        else:
+            # Saatlik adımlar ölümü eşiğin geçildiği saatin sonunda görür
+            assert stepped.death_time - timedelta(hours=1) < jumped.death_time <= stepped.death_time + ROUNDING
+            if jumped.death_reason != stepped.death_reason:
+                # Sadece iki ihtiyaç aynı saat içinde öldürüyorsa sıralama farklı olabilir
+                assert len(_deaths_within_hour(jumped, stepped.death_time)) > 1
+
+
+def test_fast_forward_reports_threshold_events_in_order():
+    """Atlanan eşik olayları zaman sırasıyla döner ve ölümle biter"""
+    sim = CharacterFactory.create_character("Dengeli", "Deneme", "Erkek", 30)
+    sim.game_time = START
+
+    events = sim.fast_forward(24 * 7)
+
+    times = [event['time'] for event in events]
+    assert times == sorted(times)
+    assert events[-1]['level'] == 'death'
+    assert not sim.is_alive
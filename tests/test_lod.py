@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from models.headless import DEFAULT_START_TIME, HeadlessEngine, parse_script
+from models.lod import TIER_COARSE, TIER_FULL, LevelOfDetail
+from models.statehash import HASHED_FIELDS
+
+SCRIPT = "eat,sleep,take_bath,go_to_work,meet_friends"
+
+
+def _engine(count, focus, script=SCRIPT):
+    engine = HeadlessEngine(parse_script(script), seed=11)
+    engine.populate(count)
+    return engine, LevelOfDetail(engine, focus, radius=0)
+
+
+def _fields(sim):
+    return {field: getattr(sim, field) for field in HASHED_FIELDS}
+
+
+def _turn(engine, sim):
+    event = engine.scheduler.get((sim, 'turn'))
+    return event.time, event.args[1], event.args[2]
+
+
+def test_demote_and_promote_without_elapsed_time_changes_nothing():
+    """Aynı anda düşürülüp yükseltilen Sim'in durumu ve sırası aynen kalır"""
+    engine, lod = _engine(4, ['Sim1'])
+    engine.start(2)
+    engine.advance(DEFAULT_START_TIME + timedelta(hours=10))
+    lod.set_focus(engine.sims)
+    before = {name: (_fields(sim), _turn(engine, sim)) for name, sim in engine.sims.items()}
+
+    lod.set_focus(['Sim1'])
+    assert [lod.tier(name) for name in sorted(engine.sims)] == [TIER_FULL] + [TIER_COARSE] * 3
+    lod.set_focus(engine.sims)
+
+    assert lod.promotions == 6 and lod.demotions == 6
+    assert {name: (_fields(sim), _turn(engine, sim)) for name, sim in engine.sims.items()} == before
+
+
+def test_promoted_sim_resumes_where_coarse_advance_stopped():
+    """Yükseltilen Sim gözlendiği ana kadar kaba ilerler, senaryoya kaldığı adımdan devam eder"""
+    engine, lod = _engine(3, ['Sim1'])
+    engine.start(3)
+    sim = engine.sims['Sim2']
+
+    engine.advance(DEFAULT_START_TIME + timedelta(hours=30))
+    coarse = lod._coarse['Sim2']
+    lod.set_focus(['Sim1', 'Sim2'])
+
+    now = engine.scheduler.now
+    at, end_time, step = _turn(engine, sim)
+    assert sim.game_time >= now and at == sim.game_time
+    assert end_time == coarse.end_time and step == coarse.step > 0
+    assert lod.coarse_actions == step
+
+    # Tekrar düşürülüp çalışma sonuna kadar kaba ilerler
+    lod.set_focus(['Sim1'])
+    engine.advance()
+    lod.settle()
+    assert all(other.game_time >= end_time for other in engine.sims.values() if other.is_alive)
+
+
+def test_coarse_tier_is_sampled_not_replayed():
+    """Kaba seviye tam çalıştırmanın aynısını tekrarlamaz ama aynı senaryoda Sim'ler hayatta kalır"""
+    full = HeadlessEngine(parse_script(SCRIPT), seed=11)
+    full.populate(20)
+    full_report = full.run(3)
+
+    engine, _ = _engine(20, ['Sim1'])
+    report = engine.run(3)
+
+    assert report['lod']['coarse'] == 19 and report['lod']['coarse_actions'] > 0
+    assert report['alive'] == full_report['alive'] == 20
+    assert report['averages'] != full_report['averages']
+    assert abs(report['sim_hours'] - full_report['sim_hours']) < 0.05 * full_report['sim_hours']
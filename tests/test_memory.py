@@ -0,0 +1,20 @@
+from models.memory import sim_layouts
+from models.sim import Sim
+
+
+def test_slots_layout_uses_less_memory_than_legacy_layout():
+    """Güncel düzen eski düzenin yarısından az yer tutar, durum önbelleği de bunu geri almaz"""
+    layouts = sim_layouts(500)
+    assert layouts['current'] < layouts['legacy'] / 2
+    assert layouts['displayed'] < layouts['legacy'] / 2
+
+
+def test_status_cache_is_built_on_first_get_status():
+    """Durum önbelleği ilk get_status'a kadar kurulmaz, sonra değişen alanları izler"""
+    sim = Sim("Deneme", "Kadın", 30)
+    sim.energy = 40
+    assert sim._status_cache is None
+
+    assert sim.get_status()['energy'] == 40
+    sim.energy = 35
+    assert sim.get_status()['energy'] == 35
@@ -0,0 +1,30 @@
+import pytest
+
+from models.parallel import run_parallel
+
+# Ölçüm süreleri ve süreç sayısı dışındaki tüm rapor alanları seed'den gelir
+TIMING_FIELDS = ('workers', 'elapsed', 'worker_time', 'sim_hours_per_second')
+
+
+def _outcome(report):
+    return {field: value for field, value in report.items() if field not in TIMING_FIELDS}
+
+
+@pytest.mark.parametrize('autopilot', [False, True], ids=['senaryo', 'autopilot'])
+def test_same_seed_same_report_for_any_worker_count(autopilot):
+    """Aynı seed tek süreçte ve iki süreçte aynı nüfus sonucunu üretir"""
+    single = run_parallel(12, 3, 1, seed=42, autopilot=autopilot)
+    split = run_parallel(12, 3, 2, seed=42, autopilot=autopilot)
+
+    assert split['workers'] == 2
+    assert _outcome(single) == _outcome(split)
+    assert single['actions'] > 0 and single['relationships'] > 0
+
+
+def test_same_seed_repeats():
+    """Aynı seed'le tekrarlanan çalışma aynı raporu verir"""
+    first = run_parallel(8, 2, 2, seed=7)
+    second = run_parallel(8, 2, 2, seed=7)
+
+    assert first['seed'] == second['seed'] == 7
+    assert _outcome(first) == _outcome(second)
@@ -0,0 +1,74 @@
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from models.character_types import CharacterFactory
+from models.headless import DEFAULT_JOBS
+from models.population import FIELDS, NEEDS, Population
+from models.rng import RandomService
+
+START = datetime(1960, 1, 1, 6, 0)
+
+
+def _sims(count, seed):
+    rng = random.Random(seed)
+    types = CharacterFactory.get_available_types()
+    sims = []
+    for i in range(count):
+        sim = CharacterFactory.create_character(types[i % len(types)], f"Sim{i + 1}", "Erkek", 30)
+        sim.game_time = START
+        for need in NEEDS:
+            setattr(sim, need, round(rng.uniform(5, 60), 2))
+        sim._update_critical_state()
+        sims.append(sim)
+    return sims
+
+
+def test_deaths_match_hourly_sim_decay():
+    """Nüfustaki ölüm kuralı saat saat azalan Sim'lerle aynı saatte ve aynı nedenle öldürür"""
+    sims = _sims(40, 5)
+    population = Population.from_sims(sims)
+
+    for _ in range(24 * 6):
+        for sim in sims:
+            if sim.is_alive:
+                sim.game_time += timedelta(hours=1)
+                sim.advance_time(1)
+        population.advance_time(1, np.flatnonzero(population.alive))
+        population.check_deaths()
+
+        assert population.alive.tolist() == [sim.is_alive for sim in sims]
+        for i, sim in enumerate(sims):
+            if sim.is_alive:
+                assert [getattr(population, need)[i] for need in NEEDS] == [getattr(sim, need) for need in NEEDS]
+
+    assert not population.alive.any()
+    copies = _sims(40, 5)
+    population.write_back(copies)
+    assert [sim.death_reason for sim in copies] == [sim.death_reason for sim in sims]
+
+
+def test_generated_population_is_seeded_and_varied():
+    """Aynı seed aynı nüfusu verir; tipler ve meslekler satırlara dağılır"""
+    first = Population.generate(500, RandomService(9), DEFAULT_JOBS)
+    second = Population.generate(500, RandomService(9), DEFAULT_JOBS)
+    other = Population.generate(500, RandomService(10), DEFAULT_JOBS)
+
+    for field in FIELDS + ('employed', 'salary', 'negative_scale'):
+        assert np.array_equal(getattr(first, field), getattr(second, field))
+    assert not np.array_equal(first.salary, other.salary)
+    assert first.employed.any() and not first.employed.all()
+    assert len(np.unique(first.negative_scale)) == 2
+    assert len(np.unique(first.money)) > 1
+
+
+def test_simulate_without_actions_reports_deaths():
+    """Eylemsiz nüfus ihtiyaçları tükenince ölür; ölenlerin değerleri donar"""
+    population = Population.generate(200, RandomService(1), DEFAULT_JOBS)
+    report = population.simulate(24 * 7)
+
+    assert report['deaths'] == report['sims'] - report['alive'] == 200
+    frozen = population.energy.copy()
+    population.simulate(24)
+    assert np.array_equal(population.energy, frozen)
@@ -0,0 +1,95 @@
+import gc
+
+from models.game import Game
+from models.network import ReplayNetwork, SERVER_LOCK_FILE
+from models.recorder import RECORD_INBOUND, RECORD_OUTBOUND, SessionRecorder, SessionReplayer, read_session
+from models.ui import HeadlessUI
+
+# Sunucuya gelen örnek oturum
+MESSAGES = [
+    {'type': 'player_join', 'player_name': 'Bob', 'player_data': {'name': 'Bob', 'energy': 40}},
+    {'type': 'chat_message', 'player_name': 'Bob', 'message': 'Merhaba'},
+    {'type': 'ping', 't0': 1.5},
+    {'type': 'player_update', 'player_name': 'Bob', 'player_data': {'energy': 30}},
+]
+
+
+def _record(path, role='server'):
+    recorder = SessionRecorder(str(path), role)
+    for message in MESSAGES:
+        recorder.record(RECORD_INBOUND, message)
+    recorder.close()
+
+
+def _replay_network(is_server=True):
+    game = Game(dev_mode=True)
+    game.ui = HeadlessUI(game)
+    return ReplayNetwork(game, is_server=is_server)
+
+
+def test_recorded_session_reads_back(tmp_path):
+    """Kaydedilen başlık ve mesajlar sırasıyla geri okunur"""
+    path = tmp_path / 'oturum.log'
+    _record(path)
+
+    header, records = read_session(str(path))
+    assert header['role'] == 'server'
+    assert [direction for _, direction, _ in records] == [RECORD_INBOUND] * len(MESSAGES)
+    assert [message for _, _, message in records] == MESSAGES
+    times = [elapsed for elapsed, _, _ in records]
+    assert times == sorted(times)
+
+
+def test_replay_feeds_handlers_and_records_replies(tmp_path, monkeypatch):
+    """Oynatılan mesajlar sunucu işleyicilerinden geçer, cevapları yeni kayda yazılır"""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / 'oturum.log'
+    _record(path)
+
+    network = _replay_network()
+    network.start_recording(str(tmp_path / 'cevaplar.log'))
+    stats = SessionReplayer(network, str(path), speed=0).replay()
+    network.stop_recording()
+
+    assert stats['messages'] == len(MESSAGES)
+    assert stats['errors'] == 0
+    assert network.players['Bob']['energy'] == 30
+    assert stats['packets_sent'] > 0
+
+    header, records = read_session(str(tmp_path / 'cevaplar.log'))
+    assert header['role'] == 'server'
+    replies = [message['type'] for _, direction, message in records if direction == RECORD_OUTBOUND]
+    assert 'player_list' in replies
+    assert 'pong' in replies
+
+
+def test_replay_leaves_live_server_lock(tmp_path, monkeypatch):
+    """Oynatma ağı çalışan sunucunun kilit dosyasını silmez"""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / 'oturum.log'
+    _record(path)
+    lock = tmp_path / SERVER_LOCK_FILE
+    lock.write_text('localhost:5000')
+
+    network = _replay_network()
+    SessionReplayer(network, str(path), speed=0).replay()
+    network.disconnect()
+    del network
+    gc.collect()
+
+    assert lock.read_text() == 'localhost:5000'
+
+
+def test_client_game_start_applies_mode_without_ui(tmp_path):
+    """İstemci kaydındaki oyun başlangıcı modu uygular, arayüz bekleme ekranına girmez"""
+    path = tmp_path / 'istemci.log'
+    recorder = SessionRecorder(str(path), 'client')
+    recorder.record(RECORD_INBOUND, {'type': 'game_start', 'mode': 'authoritative', 'host': 'Host'})
+    recorder.close()
+
+    network = _replay_network(is_server=False)
+    stats = SessionReplayer(network, str(path), speed=0).replay()
+
+    assert stats['errors'] == 0
+    assert network.game.authoritative
+    assert not network.game._game_started
@@ -0,0 +1,125 @@
+import random
+
+import pytest
+
+from models.relationships import RELATIONSHIP_LEVELS, RelationshipGraph, pair_key, relationship_type
+from models.sim import Sim
+
+NAMES = ('Ali', 'Ayşe', 'Can', 'Deniz', 'Ece', 'Mert')
+
+
+def _world():
+    graph = RelationshipGraph()
+    sims = {}
+    for name in NAMES:
+        sim = Sim(name, "Kadın", 30)
+        graph.attach(sim)
+        sims[name] = sim
+    return graph, sims
+
+
+def _edges_of(graph, name):
+    """Taramayla bulunan kenarlar - indekslerin karşılaştırıldığı referans"""
+    return {other: graph.get(name, other) for key in graph for other in key
+            if name in key and other != name}
+
+
+def _assert_indexes(graph, sims):
+    """Sorgular, kenarları tek tek tarayan karşılıklarıyla aynı sonucu verir"""
+    for name in NAMES:
+        edges = _edges_of(graph, name)
+        by_level = sorted(edges, key=lambda other: (edges[other]['level'], other))
+
+        assert [other for other, _ in graph.neighbors(name)] == by_level
+        assert [other for other, _ in graph.top(name, 3)] == by_level[::-1][:3]
+        assert graph.in_level_range(name, 20, 60) == [other for other in by_level
+                                                      if 20 <= edges[other]['level'] < 60]
+        for rel_type in RELATIONSHIP_LEVELS:
+            assert graph.by_type(name, rel_type) == [other for other in by_level
+                                                     if edges[other]['type'] == rel_type]
+        assert graph.partners(name) == graph.by_type(name, "Sevgili")
+        by_compatibility = sorted(edges, key=lambda other: (edges[other]['compatibility'], other))
+        assert graph.by_compatibility(name, 50, 75) == [other for other in by_compatibility
+                                                        if 50 <= edges[other]['compatibility'] <= 75]
+        assert sorted(graph.near_next_level(name)) == sorted(
+            (other, relationship_type(threshold)) for other in by_level
+            for threshold in sorted(RELATIONSHIP_LEVELS.values())[1:]
+            if threshold - 5 <= edges[other]['level'] < threshold)
+
+        # Sim'lerin sözlükleri depodaki kenarların aynısını gösterir
+        if name in sims:
+            assert set(sims[name].relationships) == set(edges)
+            assert all(sims[name].relationships[other] is edge for other, edge in edges.items())
+
+
+def _assert_pairs(graph):
+    """Türe göre çift kümeleri tüm kenarların türleriyle aynıdır"""
+    for rel_type in RELATIONSHIP_LEVELS:
+        assert graph.pairs_of_type(rel_type) == {key for key in graph if graph.get(*key)['type'] == rel_type}
+
+
+def test_indexes_follow_updates():
+    """Seviye değişimleri indekslerdeki sırayı ve türü günceller"""
+    graph, sims = _world()
+    rng = random.Random(7)
+    for _ in range(300):
+        sim, other = rng.sample(list(sims.values()), 2)
+        graph.update(sim, other, rng.uniform(-15, 25), rng=rng)
+        _assert_indexes(graph, sims)
+        _assert_pairs(graph)
+
+    edge = graph.get('Ali', 'Can') or graph.update(sims['Ali'], sims['Can'], 10, rng=rng)
+    graph.update(sims['Can'], sims['Ali'], 100)
+    assert edge['level'] == 100 and edge['type'] == "Sevgili"
+    assert 'Can' in graph.partners('Ali') and 'Ali' in graph.partners('Can')
+    _assert_indexes(graph, sims)
+
+
+def test_indexes_follow_removals():
+    """Kenar ve Sim silindiğinde iki tarafın indeksi ve sözlüğü temizlenir"""
+    graph, sims = _world()
+    rng = random.Random(11)
+    for sim in sims.values():
+        for other in sims.values():
+            if sim.name < other.name:
+                graph.update(sim, other, rng.uniform(0, 100), rng=rng)
+    _assert_indexes(graph, sims)
+
+    graph.remove('Deniz', 'Ali')
+    assert ('Ali', 'Deniz') not in graph
+    assert 'Deniz' not in sims['Ali'].relationships and 'Ali' not in sims['Deniz'].relationships
+    _assert_indexes(graph, sims)
+
+    graph.remove_sim('Ece')
+    del sims['Ece']
+    assert not graph.neighbors('Ece')
+    assert all('Ece' not in pair_key(*key) for key in graph)
+    _assert_indexes(graph, sims)
+    _assert_pairs(graph)
+
+    # Silinen çift yeniden kurulduğunda yeni seviyesiyle indekslenir
+    graph.update(sims['Ali'], sims['Deniz'], 45, rng=rng)
+    assert graph.by_type('Ali', "Arkadaş").count('Deniz') == 1
+    _assert_indexes(graph, sims)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_indexes_follow_mixed_operations(seed):
+    """Rastgele güncelleme, silme ve geri alma dizilerinden sonra indeksler taramayla aynıdır"""
+    graph, sims = _world()
+    rng = random.Random(seed)
+    snapshot = None
+    for _ in range(200):
+        roll = rng.random()
+        sim, other = rng.sample(list(sims.values()), 2)
+        if roll < 0.7:
+            graph.update(sim, other, rng.uniform(-20, 30), rng=rng)
+        elif roll < 0.85:
+            graph.remove(sim.name, other.name)
+        elif snapshot is None:
+            snapshot = sims['Ali'].snapshot()
+        else:
+            sims['Ali'].restore(snapshot)
+            snapshot = None
+        _assert_indexes(graph, sims)
+        _assert_pairs(graph)
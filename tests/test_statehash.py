@@ -0,0 +1,35 @@
+import random
+
+from models.sim import Sim
+from models.statehash import HASHED_FIELDS, state_hash_of
+
+
+def _fields(sim):
+    return {name: getattr(sim, name) for name in HASHED_FIELDS}
+
+
+def test_state_hash_follows_field_writes():
+    """Yazılan alan XOR ile güncellenen hash, alanlardan baştan hesaplanan hash'le aynıdır"""
+    sim = Sim("Deneme", "Kadın", 30)
+    rng = random.Random(3)
+    assert sim.state_hash == state_hash_of(_fields(sim))
+
+    for _ in range(200):
+        field = rng.choice(('mood', 'energy', 'hunger', 'hygiene', 'social', 'money', 'job_satisfaction'))
+        setattr(sim, field, round(rng.uniform(0, 100), 2))
+        if rng.random() < 0.05:
+            sim.is_alive = not sim.is_alive
+        assert sim.state_hash == state_hash_of(_fields(sim))
+
+
+def test_state_hash_after_restore():
+    """Anlık görüntüye dönen Sim'in hash'i görüntüdeki hash'tir"""
+    sim = Sim("Deneme", "Kadın", 30)
+    before = sim.state_hash
+    snapshot = sim.snapshot()
+    sim.update_needs(energy=-30, hunger=-20)
+    sim.money -= 250
+    assert sim.state_hash != before
+
+    sim.restore(snapshot)
+    assert sim.state_hash == before == state_hash_of(_fields(sim))